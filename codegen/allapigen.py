@@ -1,6 +1,8 @@
 """Helper module to generate Fluent API classes."""
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+import pickle
 from time import time
 
 from ansys.fluent.core import CODEGEN_OUTDIR, FluentMode, FluentVersion, launch_fluent
@@ -9,61 +11,15 @@ from ansys.fluent.core.codegen.print_fluent_version import print_fluent_version
 from ansys.fluent.core.search import _generate_api_data
 from ansys.fluent.core.utils.fluent_version import get_version_for_file_name
 
-if __name__ == "__main__":
-    t0 = time()
-    meshing = launch_fluent(mode=FluentMode.MESHING)
-    version = get_version_for_file_name(session=meshing)
-    gt_222 = FluentVersion(version) > FluentVersion.v222
-    ge_231 = FluentVersion(version) >= FluentVersion.v231
-    ge_242 = FluentVersion(version) >= FluentVersion.v242
 
-    static_infos = {
-        StaticInfoType.DATAMODEL_WORKFLOW: meshing._datamodel_service_se.get_static_info(
-            "workflow"
-        ),
-        StaticInfoType.DATAMODEL_MESHING: meshing._datamodel_service_se.get_static_info(
-            "meshing"
-        ),
-        StaticInfoType.DATAMODEL_PART_MANAGEMENT: meshing._datamodel_service_se.get_static_info(
-            "PartManagement"
-        ),
-        StaticInfoType.DATAMODEL_PM_FILE_MANAGEMENT: meshing._datamodel_service_se.get_static_info(
-            "PMFileManagement"
-        ),
-    }
-    if gt_222:
-        static_infos[StaticInfoType.TUI_MESHING] = (
-            meshing._datamodel_service_tui.get_static_info("")
-        )
-    if ge_242:
-        static_infos[StaticInfoType.DATAMODEL_MESHING_UTILITIES] = (
-            meshing._datamodel_service_se.get_static_info("MeshingUtilities")
-        )
-    meshing.exit()
+def _fetch_static_infos(getters: dict) -> dict:
+    # The static info of the different rules are fetched concurrently from a session.
+    with ThreadPoolExecutor(max_workers=len(getters)) as executor:
+        futures = {k: executor.submit(*v) for k, v in getters.items()}
+        return {k: v.result() for k, v in futures.items()}
 
-    solver = launch_fluent(
-        mode=FluentMode.SOLVER_ICING if ge_231 else FluentMode.SOLVER
-    )
-    static_infos[StaticInfoType.DATAMODEL_PREFERENCES] = (
-        solver._datamodel_service_se.get_static_info("preferences")
-    )
-    static_infos[StaticInfoType.SETTINGS] = solver._settings_service.get_static_info()
-    if gt_222:
-        static_infos[StaticInfoType.TUI_SOLVER] = (
-            solver._datamodel_service_tui.get_static_info("")
-        )
-    if ge_231:
-        static_infos[StaticInfoType.DATAMODEL_FLICING] = (
-            solver._datamodel_service_se.get_static_info("flserver")
-        )
-        static_infos[StaticInfoType.DATAMODEL_SOLVER_WORKFLOW] = (
-            solver._datamodel_service_se.get_static_info("solverworkflow")
-        )
-    t1 = time()
-    print(f"\nTime to fetch static info: {t1 - t0:.2f} seconds")
-    CODEGEN_OUTDIR.mkdir(parents=True, exist_ok=True)
-    print_fluent_version(solver._app_utilities)
-    solver.exit()
+
+if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="A script to write Fluent API files with an optional verbose output."
     )
@@ -73,7 +29,76 @@ if __name__ == "__main__":
         action="store_true",
         help="Show paths of written Fluent API files.",
     )
+    parser.add_argument(
+        "--save-static-info",
+        help="Save the static info fetched from Fluent to the given pickle file.",
+    )
+    parser.add_argument(
+        "--load-static-info",
+        help="Generate from a static info pickle file instead of launching Fluent.",
+    )
     args = parser.parse_args()
+
+    t0 = time()
+    if args.load_static_info:
+        with open(args.load_static_info, "rb") as f:
+            version, static_infos = pickle.load(f)
+    else:
+        meshing = launch_fluent(mode=FluentMode.MESHING)
+        version = get_version_for_file_name(session=meshing)
+        gt_222 = FluentVersion(version) > FluentVersion.v222
+        ge_231 = FluentVersion(version) >= FluentVersion.v231
+        ge_242 = FluentVersion(version) >= FluentVersion.v242
+
+        se_info = meshing._datamodel_service_se.get_static_info
+        getters = {
+            StaticInfoType.DATAMODEL_WORKFLOW: (se_info, "workflow"),
+            StaticInfoType.DATAMODEL_MESHING: (se_info, "meshing"),
+            StaticInfoType.DATAMODEL_PART_MANAGEMENT: (se_info, "PartManagement"),
+            StaticInfoType.DATAMODEL_PM_FILE_MANAGEMENT: (se_info, "PMFileManagement"),
+        }
+        if gt_222:
+            getters[StaticInfoType.TUI_MESHING] = (
+                meshing._datamodel_service_tui.get_static_info,
+                "",
+            )
+        if ge_242:
+            getters[StaticInfoType.DATAMODEL_MESHING_UTILITIES] = (
+                se_info,
+                "MeshingUtilities",
+            )
+        static_infos = _fetch_static_infos(getters)
+        meshing.exit()
+
+        solver = launch_fluent(
+            mode=FluentMode.SOLVER_ICING if ge_231 else FluentMode.SOLVER
+        )
+        se_info = solver._datamodel_service_se.get_static_info
+        getters = {
+            StaticInfoType.DATAMODEL_PREFERENCES: (se_info, "preferences"),
+            StaticInfoType.SETTINGS: (solver._settings_service.get_static_info,),
+        }
+        if gt_222:
+            getters[StaticInfoType.TUI_SOLVER] = (
+                solver._datamodel_service_tui.get_static_info,
+                "",
+            )
+        if ge_231:
+            getters[StaticInfoType.DATAMODEL_FLICING] = (se_info, "flserver")
+            getters[StaticInfoType.DATAMODEL_SOLVER_WORKFLOW] = (
+                se_info,
+                "solverworkflow",
+            )
+        static_infos.update(_fetch_static_infos(getters))
+    t1 = time()
+    print(f"\nTime to fetch static info: {t1 - t0:.2f} seconds")
+    CODEGEN_OUTDIR.mkdir(parents=True, exist_ok=True)
+    if not args.load_static_info:
+        print_fluent_version(solver._app_utilities)
+        solver.exit()
+    if args.save_static_info:
+        with open(args.save_static_info, "wb") as f:
+            pickle.dump((version, static_infos), f)
     allapigen.generate(version, static_infos, args.verbose)
     t2 = time()
     print(f"Time to generate APIs: {t2 - t1:.2f} seconds")
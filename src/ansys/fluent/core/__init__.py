@@ -32,50 +32,98 @@ from ansys.fluent.core.logger import set_console_logging_level  # noqa: F401
 
 # isort: on
 
-from ansys.fluent.core.field_data_interfaces import (  # noqa: F401
-    PathlinesFieldDataRequest,
-    ScalarFieldDataRequest,
-    SurfaceDataType,
-    SurfaceFieldDataRequest,
-    VectorFieldDataRequest,
-)
 from ansys.fluent.core.get_build_details import (  # noqa: F401
     get_build_version,
     get_build_version_string,
 )
-from ansys.fluent.core.launcher.launch_options import (  # noqa: F401
-    Dimension,
-    FluentLinuxGraphicsDriver,
-    FluentMode,
-    FluentWindowsGraphicsDriver,
-    Precision,
-    UIMode,
-)
-from ansys.fluent.core.launcher.launcher import (  # noqa: F401
-    connect_to_fluent,
-    launch_fluent,
-)
-from ansys.fluent.core.parametric import LocalParametricStudy  # noqa: F401
 from ansys.fluent.core.pyfluent_warnings import (  # noqa: F401
     PyFluentDeprecationWarning,
     PyFluentUserWarning,
     warning,
 )
-from ansys.fluent.core.search import search  # noqa: F401
-from ansys.fluent.core.services.batch_ops import BatchOps  # noqa: F401
-from ansys.fluent.core.session import BaseSession as Fluent  # noqa: F401
-from ansys.fluent.core.session_utilities import (  # noqa: F401
-    Meshing,
-    PrePost,
-    PureMeshing,
-    Solver,
-    SolverAero,
-    SolverIcing,
+from ansys.fluent.core.utils import (  # noqa: F401
+    fldoc,
+    get_examples_download_dir,
+    lazy_module_attrs,
+    search,
 )
-from ansys.fluent.core.streaming_services.events_streaming import *  # noqa: F401, F403
-from ansys.fluent.core.utils import fldoc, get_examples_download_dir
 from ansys.fluent.core.utils.fluent_version import FluentVersion  # noqa: F401
-from ansys.fluent.core.utils.setup_for_fluent import setup_for_fluent  # noqa: F401
+
+# Public objects which are imported from their modules on first access, as the
+# modules pull in gRPC, pandas, docker and the session classes.
+_LAZY_ATTRS = {
+    **dict.fromkeys(
+        (
+            "PathlinesFieldDataRequest",
+            "ScalarFieldDataRequest",
+            "SurfaceDataType",
+            "SurfaceFieldDataRequest",
+            "VectorFieldDataRequest",
+        ),
+        "ansys.fluent.core.field_data_interfaces",
+    ),
+    **dict.fromkeys(
+        (
+            "Dimension",
+            "FluentLinuxGraphicsDriver",
+            "FluentMode",
+            "FluentWindowsGraphicsDriver",
+            "Precision",
+            "UIMode",
+        ),
+        "ansys.fluent.core.launcher.launch_options",
+    ),
+    **dict.fromkeys(
+        ("connect_to_fluent", "launch_fluent"), "ansys.fluent.core.launcher.launcher"
+    ),
+    "SessionPool": "ansys.fluent.core.launcher.session_pool",
+    "LocalParametricStudy": "ansys.fluent.core.parametric",
+    "BatchOps": "ansys.fluent.core.services.batch_ops",
+    "ChannelProfile": "ansys.fluent.core.fluent_connection",
+    "Fluent": ("ansys.fluent.core.session", "BaseSession"),
+    **dict.fromkeys(
+        ("Meshing", "PrePost", "PureMeshing", "Solver", "SolverAero", "SolverIcing"),
+        "ansys.fluent.core.session_utilities",
+    ),
+    # The names of events_streaming.__all__, which test_import_time checks.
+    **dict.fromkeys(
+        (
+            "EventsManager",
+            "Event",
+            "SolverEvent",
+            "MeshingEvent",
+            "TimestepStartedEventInfo",
+            "TimestepEndedEventInfo",
+            "IterationEndedEventInfo",
+            "CalculationsStartedEventInfo",
+            "CalculationsEndedEventInfo",
+            "CalculationsPausedEventInfo",
+            "CalculationsResumedEventInfo",
+            "AboutToLoadCaseEventInfo",
+            "CaseLoadedEventInfo",
+            "AboutToLoadDataEventInfo",
+            "DataLoadedEventInfo",
+            "AboutToInitializeSolutionEventInfo",
+            "SolutionInitializedEventInfo",
+            "ReportDefinitionUpdatedEventInfo",
+            "ReportPlotSetUpdatedEventInfo",
+            "ResidualPlotUpdatedEventInfo",
+            "SettingsClearedEventInfo",
+            "SolutionPausedEventInfo",
+            "ProgressUpdatedEventInfo",
+            "SolverTimeEstimateUpdatedEventInfo",
+            "FatalErrorEventInfo",
+        ),
+        "ansys.fluent.core.streaming_services.events_streaming",
+    ),
+    "FieldDataDeliveryPolicy": (
+        "ansys.fluent.core.streaming_services.field_data_streaming"
+    ),
+    "setup_for_fluent": "ansys.fluent.core.utils.setup_for_fluent",
+}
+
+
+__getattr__, __dir__ = lazy_module_attrs(globals(), _LAZY_ATTRS)
 
 __version__ = "0.34.dev0"
 
@@ -169,6 +217,9 @@ CHECK_HEALTH_TIMEOUT = 60
 # Whether to skip health check
 CHECK_HEALTH = True
 
+# Minimum time in seconds between two queries of the Slurm job states
+SLURM_JOB_MONITOR_INTERVAL = 5
+
 # Whether to print search results
 PRINT_SEARCH_RESULTS = True
 
@@ -23,6 +23,9 @@
 """This module contains the code generation logic for Fluent's Python API."""
 
 from enum import Enum, auto
+import hashlib
+from pathlib import Path
+import pickle
 
 
 class StaticInfoType(Enum):
@@ -40,3 +43,38 @@ class StaticInfoType(Enum):
     DATAMODEL_SOLVER_WORKFLOW = auto()
     DATAMODEL_MESHING_UTILITIES = auto()
     SETTINGS = auto()
+
+
+def _gethash(obj_info):
+    dhash = hashlib.sha256()
+    dhash.update(pickle.dumps(obj_info))
+    return dhash.hexdigest()
+
+
+def _write_if_changed(file_name: str | Path, content: str) -> bool:
+    """Write a generated file unless its content is unchanged.
+
+    The existing file is left untouched, including its modification time, when the
+    hash of its content matches the hash of the new content.
+
+    Parameters
+    ----------
+    file_name : str | Path
+        Path of the generated file.
+    content : str
+        Content of the generated file.
+
+    Returns
+    -------
+    bool
+        True if the file has been written, False if it was already up to date.
+    """
+    file_name = Path(file_name)
+    if file_name.exists():
+        with open(file_name, "r", encoding="utf8") as f:
+            if _gethash(f.read()) == _gethash(content):
+                return False
+    file_name.parent.mkdir(parents=True, exist_ok=True)
+    with open(file_name, "w", encoding="utf8") as f:
+        f.write(content)
+    return True
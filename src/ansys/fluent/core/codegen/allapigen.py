@@ -23,17 +23,21 @@
 """Module to generate Fluent API classes."""
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 import os
 from pathlib import Path
 import pickle
 
 from ansys.fluent.core.codegen import (  # noqa: F401
+    StaticInfoType,
     builtin_settingsgen,
     datamodelgen,
     settingsgen,
     tuigen,
 )
 from ansys.fluent.core.search import get_api_tree_file_name
+from ansys.fluent.core.utils.fluent_version import FluentVersion
 
 
 def _update_first_level(d, u):
@@ -41,12 +45,90 @@ def _update_first_level(d, u):
         d[k].update(u.get(k, {}))
 
 
-def generate(version: str, static_infos: dict, verbose: bool = False):
-    """Generate Fluent API classes."""
+def _init_worker(codegen_outdir: Path) -> None:
+    # The spawned workers do not inherit a CODEGEN_OUTDIR modified at runtime.
+    import ansys.fluent.core as pyfluent
+
+    pyfluent.CODEGEN_OUTDIR = codegen_outdir
+
+
+_GENERATOR_INFO_PREFIXES = {
+    tuigen: "TUI_",
+    datamodelgen: "DATAMODEL_",
+    settingsgen: StaticInfoType.SETTINGS.name,
+}
+
+
+def _get_generator_static_infos(generator, static_infos: dict) -> dict:
+    # Only the static info used by a generator is sent to its worker process.
+    prefix = _GENERATOR_INFO_PREFIXES[generator]
+    return {k: v for k, v in static_infos.items() if k.name.startswith(prefix)}
+
+
+def _count_generator_inputs(version: str, generator_static_infos: dict) -> int:
+    has_tui = FluentVersion(version) <= FluentVersion.v222 or bool(
+        generator_static_infos[tuigen]
+    )
+    return (
+        has_tui
+        + bool(generator_static_infos[datamodelgen])
+        + bool(generator_static_infos[settingsgen])
+    )
+
+
+def generate(
+    version: str,
+    static_infos: dict,
+    verbose: bool = False,
+    max_workers: int | None = None,
+):
+    """Generate Fluent API classes.
+
+    The TUI, datamodel and settings API classes are generated concurrently in separate
+    processes. A generated file is rewritten only if its content has changed.
+
+    Parameters
+    ----------
+    version : str
+        Fluent version used in the generated file names.
+    static_infos : dict
+        Static info fetched from Fluent, keyed by ``StaticInfoType``.
+    verbose : bool, optional
+        Whether to print the paths of the generated files. The default is ``False``.
+    max_workers : int, optional
+        Maximum number of worker processes. The classes are generated serially in
+        the current process if it is ``1`` or if only one generator has static
+        info to process. By default, one process is used for each generator, up to the
+        number of CPUs.
+    """
+    generators = (tuigen, datamodelgen, settingsgen)
+    generator_static_infos = {
+        x: _get_generator_static_infos(x, static_infos) for x in generators
+    }
+    if max_workers is None:
+        max_workers = min(len(generators), os.cpu_count() or 1)
+    if max_workers == 1 or _count_generator_inputs(version, generator_static_infos) < 2:
+        # Worker processes are not worth starting for a single worker or generator.
+        api_trees = [
+            x.generate(version, generator_static_infos[x], verbose) for x in generators
+        ]
+    else:
+        import ansys.fluent.core as pyfluent
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(pyfluent.CODEGEN_OUTDIR,),
+        ) as executor:
+            futures = [
+                executor.submit(x.generate, version, generator_static_infos[x], verbose)
+                for x in generators
+            ]
+            api_trees = [x.result() for x in futures]
     api_tree = {"<meshing_session>": {}, "<solver_session>": {}}
-    _update_first_level(api_tree, tuigen.generate(version, static_infos, verbose))
-    _update_first_level(api_tree, datamodelgen.generate(version, static_infos, verbose))
-    _update_first_level(api_tree, settingsgen.generate(version, static_infos, verbose))
+    for x in api_trees:
+        _update_first_level(api_tree, x)
     api_tree_file = get_api_tree_file_name(version)
     Path(api_tree_file).parent.mkdir(parents=True, exist_ok=True)
     with open(api_tree_file, "wb") as f:
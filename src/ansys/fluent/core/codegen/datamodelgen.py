@@ -32,7 +32,7 @@ from typing import Any, Dict
 
 import ansys.fluent.core as pyfluent
 from ansys.fluent.core import FluentMode, launch_fluent
-from ansys.fluent.core.codegen import StaticInfoType
+from ansys.fluent.core.codegen import StaticInfoType, _write_if_changed
 from ansys.fluent.core.codegen.data.meshing_utilities_examples import (
     meshing_utility_examples,
 )
@@ -230,6 +230,7 @@ class DataModelGenerator:
         self._server_static_infos = static_infos
         self._static_info: Dict[str, DataModelStaticInfo] = {}
         self._verbose = verbose
+        self._meshing_utilities_stub = None
         if StaticInfoType.DATAMODEL_WORKFLOW in static_infos:
             self._static_info["workflow"] = DataModelStaticInfo(
                 StaticInfoType.DATAMODEL_WORKFLOW,
@@ -457,32 +458,28 @@ class DataModelGenerator:
             f.write(f'{indent}        """\n')
             f.write(f"{indent}        pass\n\n")
             api_tree[parameter_name] = "Parameter"
-        if "meshing_utilities" in f.name:
-            stub_file = self._static_info["MeshingUtilities"].stub_file
-            stub_file.unlink(missing_ok=True)
-            with open(stub_file, "w", encoding="utf8") as file:
-                file.write("#\n")
-                file.write("# This is an auto-generated file.  DO NOT EDIT!\n")
-                file.write("#\n")
-                file.write("# pylint: disable=line-too-long\n\n")
-                file.write(
-                    "from ansys.fluent.core.services.datamodel_se import PyMenu\n"
+        if level == 0 and self._meshing_utilities_stub is not None:
+            file = self._meshing_utilities_stub
+            file.write("#\n")
+            file.write("# This is an auto-generated file.  DO NOT EDIT!\n")
+            file.write("#\n")
+            file.write("# pylint: disable=line-too-long\n\n")
+            file.write("from ansys.fluent.core.services.datamodel_se import PyMenu\n")
+            file.write("from typing import Any\n")
+            file.write("\n\n")
+            file.write("class Root(PyMenu):\n")
+            for k in commands:
+                _write_command_query_stub(
+                    k,
+                    info["commands"][k]["commandinfo"],
+                    file,
+                )
+            for k in queries:
+                _write_command_query_stub(
+                    k,
+                    info["queries"][k]["queryinfo"],
+                    file,
                 )
-                file.write("from typing import Any\n")
-                file.write("\n\n")
-                file.write("class Root(PyMenu):\n")
-                for k in commands:
-                    _write_command_query_stub(
-                        k,
-                        info["commands"][k]["commandinfo"],
-                        file,
-                    )
-                for k in queries:
-                    _write_command_query_stub(
-                        k,
-                        info["queries"][k]["queryinfo"],
-                        file,
-                    )
         for k in commands:
             f.write(f"{indent}    class {k}(PyCommand):\n")
             f.write(f'{indent}        """\n')
@@ -542,41 +539,47 @@ class DataModelGenerator:
             if self._verbose:
                 print(f"{str(info.file_name)}")
             if info.static_info is None:
+                info.file_name.unlink(missing_ok=True)
                 continue
-            with open(info.file_name, "w", encoding="utf8") as f:
-                f.write("#\n")
-                f.write("# This is an auto-generated file.  DO NOT EDIT!\n")
-                f.write("#\n")
-                f.write("# pylint: disable=line-too-long\n\n")
-                f.write("from ansys.fluent.core.services.datamodel_se import (\n")
-                f.write("    PyMenu,\n")
-                f.write("    PyParameter,\n")
-                f.write("    PyTextual,\n")
-                f.write("    PyNumerical,\n")
-                f.write("    PyDictionary,\n")
-                f.write("    PyNamedObjectContainer,\n")
-                f.write("    PyCommand,\n")
-                f.write("    PyQuery,\n")
-                f.write("    PyCommandArguments,\n")
-                f.write("    PyTextualCommandArgumentsSubItem,\n")
-                f.write("    PyNumericalCommandArgumentsSubItem,\n")
-                f.write("    PyDictionaryCommandArgumentsSubItem,\n")
-                f.write("    PyParameterCommandArgumentsSubItem,\n")
-                f.write("    PySingletonCommandArgumentsSubItem\n")
-                f.write(")\n\n\n")
-                api_tree_val = {
-                    name: self._write_static_info("Root", info.static_info, f)
-                }
-                for mode in info.modes:
-                    if mode in ("solver", "meshing"):
-                        key = f"<{mode}_session>"
-                        api_tree[key].update(api_tree_val)
+            f = StringIO()
+            f.write("#\n")
+            f.write("# This is an auto-generated file.  DO NOT EDIT!\n")
+            f.write("#\n")
+            f.write("# pylint: disable=line-too-long\n\n")
+            f.write("from ansys.fluent.core.services.datamodel_se import (\n")
+            f.write("    PyMenu,\n")
+            f.write("    PyParameter,\n")
+            f.write("    PyTextual,\n")
+            f.write("    PyNumerical,\n")
+            f.write("    PyDictionary,\n")
+            f.write("    PyNamedObjectContainer,\n")
+            f.write("    PyCommand,\n")
+            f.write("    PyQuery,\n")
+            f.write("    PyCommandArguments,\n")
+            f.write("    PyTextualCommandArgumentsSubItem,\n")
+            f.write("    PyNumericalCommandArgumentsSubItem,\n")
+            f.write("    PyDictionaryCommandArgumentsSubItem,\n")
+            f.write("    PyParameterCommandArgumentsSubItem,\n")
+            f.write("    PySingletonCommandArgumentsSubItem\n")
+            f.write(")\n\n\n")
+            if name == "MeshingUtilities":
+                self._meshing_utilities_stub = StringIO()
+            api_tree_val = {name: self._write_static_info("Root", info.static_info, f)}
+            # Unchanged files are not rewritten so that their modification times are
+            # kept.
+            _write_if_changed(info.file_name, f.getvalue())
+            if self._meshing_utilities_stub is not None:
+                _write_if_changed(
+                    info.stub_file, self._meshing_utilities_stub.getvalue()
+                )
+                self._meshing_utilities_stub = None
+            for mode in info.modes:
+                if mode in ("solver", "meshing"):
+                    key = f"<{mode}_session>"
+                    api_tree[key].update(api_tree_val)
         return api_tree
 
     def _delete_generated_files(self):
-        for _, info in self._static_info.items():
-            if info.file_name.exists():
-                info.file_name.unlink()
         if Path(_MESHING_DM_DOC_DIR).exists():
             shutil.rmtree(Path(_MESHING_DM_DOC_DIR))
         if Path(_SOLVER_DM_DOC_DIR).exists():
@@ -23,16 +23,19 @@
 """Module to generate the classes corresponding to the Fluent settings API."""
 
 import argparse
-import hashlib
 from io import StringIO
 import keyword
-import pickle
 import time
 from typing import IO
 
 import ansys.fluent.core as pyfluent
 from ansys.fluent.core import launch_fluent
-from ansys.fluent.core.codegen import StaticInfoType, walk_api
+from ansys.fluent.core.codegen import (
+    StaticInfoType,
+    _gethash,
+    _write_if_changed,
+    walk_api,
+)
 from ansys.fluent.core.solver import _docstrings
 from ansys.fluent.core.solver.flobject import (
     ListObject,
@@ -127,6 +130,7 @@ def _populate_data(cls, api_tree: dict, version: str) -> dict:
     data["child_aliases"] = getattr(cls, "_child_aliases", {})
     data["return_type"] = getattr(cls, "return_type", None)
     data["deprecated_version"] = getattr(cls, "_deprecated_version", None)
+    data["units_quantity"] = getattr(cls, "_units_quantity", None)
     child_classes = data.setdefault("child_classes", {})
     for k, v in cls._child_classes.items():
         if k in command_names:
@@ -156,12 +160,6 @@ def _populate_data(cls, api_tree: dict, version: str) -> dict:
     return data
 
 
-def _gethash(obj_info):
-    dhash = hashlib.sha256()
-    dhash.update(pickle.dumps(obj_info))
-    return dhash.hexdigest()
-
-
 # Store the top level class names and their data hash.
 # This is used to avoid name collisions and data duplication.
 _NAME_BY_HASH = {}
@@ -235,6 +233,10 @@ def _write_data(cls_name: str, python_name: str, data: dict, f: IO, f_stub: IO |
     if deprecated:
         s.write(f"    _deprecated_version = {deprecated!r}\n")
         s_stub.write("    _deprecated_version: str\n")
+    units_quantity = data["units_quantity"]
+    if units_quantity:
+        s.write(f"    _units_quantity = {units_quantity!r}\n")
+        s_stub.write("    _units_quantity: str\n")
     s.write(f"    fluent_name = {data['fluent_name']!r}\n")
     # _python_name preserves the original non-suffixed name of the class.
     s.write(f"    _python_name = {python_name!r}\n")
@@ -368,28 +370,32 @@ def generate(version: str, static_infos: dict, verbose: bool = False) -> None:
     if verbose:
         print(f"{str(output_file)}")
         print(f"{str(output_stub_file)}")
-    with open(output_file, "w") as f, open(output_stub_file, "w") as f_stub:
-        header = StringIO()
-        header.write("#\n")
-        header.write("# This is an auto-generated file.  DO NOT EDIT!\n")
-        header.write("#\n")
-        header.write("\n")
-        header.write("from ansys.fluent.core.solver.flobject import *\n\n")
-        header.write("from ansys.fluent.core.solver.flobject import (\n")
-        header.write("    _ChildNamedObjectAccessorMixin,\n")
-        header.write("    _NonCreatableNamedObjectMixin,\n")
-        header.write("    _InputFile,\n")
-        header.write("    _OutputFile,\n")
-        header.write("    _InOutFile,\n")
-        header.write("    _FlStringConstant,\n")
-        header.write(")\n\n")
-        f.write(header.getvalue())
-        f_stub.write(header.getvalue())
-        f_stub.write("from typing import Any, Final\n\n")
-        f.write(f'SHASH = "{shash}"\n\n')
-        name = data["name"]
-        _NAME_BY_HASH[_gethash(data)] = name
-        _write_data(name, name, data, f, f_stub)
+    f = StringIO()
+    f_stub = StringIO()
+    header = StringIO()
+    header.write("#\n")
+    header.write("# This is an auto-generated file.  DO NOT EDIT!\n")
+    header.write("#\n")
+    header.write("\n")
+    header.write("from ansys.fluent.core.solver.flobject import *\n\n")
+    header.write("from ansys.fluent.core.solver.flobject import (\n")
+    header.write("    _ChildNamedObjectAccessorMixin,\n")
+    header.write("    _NonCreatableNamedObjectMixin,\n")
+    header.write("    _InputFile,\n")
+    header.write("    _OutputFile,\n")
+    header.write("    _InOutFile,\n")
+    header.write("    _FlStringConstant,\n")
+    header.write(")\n\n")
+    f.write(header.getvalue())
+    f_stub.write(header.getvalue())
+    f_stub.write("from typing import Any, Final\n\n")
+    f.write(f'SHASH = "{shash}"\n\n')
+    name = data["name"]
+    _NAME_BY_HASH[_gethash(data)] = name
+    _write_data(name, name, data, f, f_stub)
+    # Unchanged files are not rewritten so that their modification times are kept.
+    written = _write_if_changed(output_file, f.getvalue())
+    written_stub = _write_if_changed(output_stub_file, f_stub.getvalue())
     file_size = output_file.stat().st_size / 1024 / 1024
     file_size_stub = output_stub_file.stat().st_size / 1024 / 1024
     print(
@@ -397,7 +403,10 @@ def generate(version: str, static_infos: dict, verbose: bool = False) -> None:
     )
     print(f"{output_file.name} size: {file_size:.2f} MB")
     print(f"{output_stub_file.name} size: {file_size_stub:.2f} MB")
-    _check_written_docstrings(version, output_file, verbose)
+    if not written and not written_stub:
+        print(f"{output_file.name} and {output_stub_file.name} are unchanged.")
+    if written:
+        _check_written_docstrings(version, output_file, verbose)
     return {"<solver_session>": api_tree}
 
 
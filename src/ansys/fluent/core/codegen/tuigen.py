@@ -35,6 +35,7 @@ Usage
 """
 
 import argparse
+from io import StringIO
 import logging
 import os
 from pathlib import Path
@@ -50,7 +51,7 @@ from defusedxml.ElementTree import parse
 
 import ansys.fluent.core as pyfluent
 from ansys.fluent.core import FluentMode, launch_fluent
-from ansys.fluent.core.codegen import StaticInfoType
+from ansys.fluent.core.codegen import StaticInfoType, _write_if_changed
 from ansys.fluent.core.codegen.data.fluent_gui_help_patch import XML_HELP_PATCH
 from ansys.fluent.core.docker.utils import get_ghcr_fluent_image_name
 from ansys.fluent.core.services.datamodel_tui import (
@@ -206,8 +207,6 @@ class TUIGenerator:
         self._mode = mode
         self._version = version
         self._tui_file = _get_tui_filepath(mode, version)
-        if Path(self._tui_file).exists():
-            Path(self._tui_file).unlink()
         self._tui_doc_dir = _get_tui_docdir(mode)
         self._tui_heading = mode + ".tui"
         self._tui_module = "ansys.fluent.core." + self._tui_heading + f"_{version}"
@@ -289,7 +288,7 @@ class TUIGenerator:
         Path(self._tui_file).parent.mkdir(exist_ok=True)
         if self._verbose:
             print(f"{str(self._tui_file)}")
-        with open(self._tui_file, "w", encoding="utf8") as self.__writer:
+        with StringIO() as self.__writer:
             if FluentVersion(self._version) == FluentVersion.v222:
                 with open(
                     (
@@ -324,6 +323,7 @@ class TUIGenerator:
             )
             self._main_menu.name = "main_menu"
             api_tree["tui"] = self._write_menu_to_tui_file(self._main_menu)
+            _write_if_changed(self._tui_file, self.__writer.getvalue())
         return api_tree
 
 
@@ -48,28 +48,68 @@ class SurfaceDataType(Enum):
 
 
 class SurfaceFieldDataRequest(NamedTuple):
-    """Container storing parameters for surface data request."""
+    """Container storing parameters for surface data request.
+
+    ``dtype`` sets the floating-point type of the returned vertices, centroids and
+    normals. ``stride`` keeps every ``stride``-th face, and ``target_count`` keeps at
+    most about ``target_count`` faces per surface. The vertices of decimated
+    surfaces are reduced to those of the kept faces.
+    """
 
     data_types: List[SurfaceDataType] | List[str]
     surfaces: List[int | str | object]
     overset_mesh: bool | None = False
     flatten_connectivity: bool = False
+    csr_connectivity: bool = False
+    dtype: npt.DTypeLike | None = None
+    stride: int = 1
+    target_count: int | None = None
+
+
+class CSRConnectivity(NamedTuple):
+    """Faces connectivity in compressed sparse row (CSR) format.
+
+    The vertex indices of face ``i`` are ``indices[offsets[i] : offsets[i + 1]]``.
+    """
+
+    offsets: npt.NDArray[np.int64]
+    indices: npt.NDArray[np.int32]
+
+    @property
+    def n_faces(self) -> int:
+        """Number of faces."""
+        return len(self.offsets) - 1
 
 
 class ScalarFieldDataRequest(NamedTuple):
-    """Container storing parameters for scalar field data request."""
+    """Container storing parameters for scalar field data request.
+
+    ``dtype``, ``stride`` and ``target_count`` are applied as for
+    ``SurfaceFieldDataRequest``. Only element values (``node_value=False``) can be
+    decimated, so that they match the faces of a decimated surface.
+    """
 
     field_name: str
     surfaces: List[int | str | object]
     node_value: bool | None = True
     boundary_value: bool | None = True
+    dtype: npt.DTypeLike | None = None
+    stride: int = 1
+    target_count: int | None = None
 
 
 class VectorFieldDataRequest(NamedTuple):
-    """Container storing parameters for vector field data request."""
+    """Container storing parameters for vector field data request.
+
+    ``dtype``, ``stride`` and ``target_count`` are applied as for
+    ``SurfaceFieldDataRequest``.
+    """
 
     field_name: str
     surfaces: List[int | str | object]
+    dtype: npt.DTypeLike | None = None
+    stride: int = 1
+    target_count: int | None = None
 
 
 class PathlinesFieldDataRequest(NamedTuple):
@@ -413,7 +453,20 @@ class _AllowedNames:
 
     def is_valid(self, name, respect_data_valid=True):
         """Checks validity."""
-        return name in self(respect_data_valid)
+        return name in self(respect_data_valid) or (
+            self._refresh() and name in self(respect_data_valid)
+        )
+
+    def _refresh(self) -> bool:
+        """Clear the cached field information so that it is fetched again.
+
+        Returns ``False`` if there is no cache to clear.
+        """
+        clear_cache = getattr(self._field_info, "clear_cache", None)
+        if self._info or clear_cache is None:
+            return False
+        clear_cache()
+        return True
 
 
 # this can be switched to False in scenarios where the field_data request inputs are
@@ -469,7 +522,10 @@ class _AllowedSurfaceNames(_AllowedNames):
             raise RuntimeError("Failed to retrieve valid surface names.") from e
 
         if validate_inputs and surface_name not in valid_names:
-            raise DisallowedValuesError("surface", surface_name, valid_names)
+            if self._refresh():
+                valid_names = self()
+            if surface_name not in valid_names:
+                raise DisallowedValuesError("surface", surface_name, valid_names)
 
         return surface_name
 
@@ -525,10 +581,6 @@ class _AllowedVectorFieldNames(_AllowedFieldNames):
             )
         )
 
-    def is_valid(self, name, respect_data_valid=True):
-        """Checks validity."""
-        return name in self(respect_data_valid)
-
 
 class SurfaceData:
     """
@@ -537,7 +589,7 @@ class SurfaceData:
     Attributes
     ----------
     vertices: npt.NDArray[np.float64] | None
-    connectivity: list[npt.NDArray[np.float64]] | None
+    connectivity: list[npt.NDArray[np.int32]] | npt.NDArray[np.int32] | CSRConnectivity | None
     face_centroids: npt.NDArray[np.float64] | None
     face_normals: npt.NDArray[np.float64] | None
     """
@@ -548,9 +600,9 @@ class SurfaceData:
         self.vertices: npt.NDArray[np.float64] | None = self._surf_data.get(
             SurfaceDataType.Vertices
         )
-        self.connectivity: list[npt.NDArray[np.int32]] | None = self._surf_data.get(
-            SurfaceDataType.FacesConnectivity
-        )
+        self.connectivity: (
+            list[npt.NDArray[np.int32]] | npt.NDArray[np.int32] | CSRConnectivity | None
+        ) = self._surf_data.get(SurfaceDataType.FacesConnectivity)
         self.face_centroids: npt.NDArray[np.float64] | None = self._surf_data.get(
             SurfaceDataType.FacesCentroid
         )
@@ -605,10 +657,26 @@ class _ReturnFieldData:
         surfaces: List[int | str | object],
         surface_ids: List[int],
         scalar_field_data: np.array,
+        node_value: bool | None = False,
+        dtype: npt.DTypeLike | None = None,
+        stride: int | None = 1,
+        target_count: int | None = None,
     ) -> Dict[int | str, np.array]:
         surfaces = get_surfaces_from_objects(surfaces)
+        if node_value and (stride not in (None, 1) or target_count is not None):
+            raise ValueError(
+                "Only element values of scalar fields can be decimated. Pass "
+                "'node_value=False' to decimate the scalar field data."
+            )
         return {
-            surface: scalar_field_data[surface_ids[count]][field_name]
+            surface: _reduce_precision(
+                _decimate(
+                    scalar_field_data[surface_ids[count]][field_name],
+                    stride,
+                    target_count,
+                ),
+                dtype,
+            )
             for count, surface in enumerate(surfaces)
         }
 
@@ -620,17 +688,28 @@ class _ReturnFieldData:
         surface_data: np.array | List[np.array],
         deprecated_flag: bool | None = False,
         flatten_connectivity: bool = False,
+        csr_connectivity: bool = False,
+        dtype: npt.DTypeLike | None = None,
+        stride: int | None = 1,
+        target_count: int | None = None,
     ) -> Dict[int | str, Dict[SurfaceDataType, np.array | List[np.array]]]:
         surfaces = get_surfaces_from_objects(surfaces)
         ret_surf_data = {}
         for count, surface in enumerate(surfaces):
             ret_surf_data[surface] = {}
+            data = _decimate_surface_data(
+                surface_data[surface_ids[count]], stride, target_count
+            )
             for data_type in data_types:
                 if data_type == SurfaceDataType.FacesConnectivity:
-                    if flatten_connectivity:
-                        ret_surf_data[surface][data_type] = surface_data[
-                            surface_ids[count]
-                        ][SurfaceDataType.FacesConnectivity.value]
+                    if csr_connectivity:
+                        ret_surf_data[surface][data_type] = get_csr_connectivity(
+                            data[SurfaceDataType.FacesConnectivity.value]
+                        )
+                    elif flatten_connectivity:
+                        ret_surf_data[surface][data_type] = data[
+                            SurfaceDataType.FacesConnectivity.value
+                        ]
                     else:
                         warnings.warn(
                             "Structured face connectivity output is deprecated and will be replaced by the flat format "
@@ -640,15 +719,13 @@ class _ReturnFieldData:
                         )
                         ret_surf_data[surface][data_type] = (
                             _transform_faces_connectivity_data(
-                                surface_data[surface_ids[count]][
-                                    SurfaceDataType.FacesConnectivity.value
-                                ]
+                                data[SurfaceDataType.FacesConnectivity.value]
                             )
                         )
                 else:
-                    ret_surf_data[surface][data_type] = surface_data[
-                        surface_ids[count]
-                    ][data_type.value].reshape(-1, 3)
+                    ret_surf_data[surface][data_type] = _reduce_precision(
+                        data[data_type.value].reshape(-1, 3), dtype
+                    )
             if deprecated_flag is False:
                 ret_surf_data[surface] = SurfaceData(ret_surf_data[surface])
         return ret_surf_data
@@ -659,10 +736,20 @@ class _ReturnFieldData:
         surfaces: List[int | str | object],
         surface_ids: List[int],
         vector_field_data: np.array,
+        dtype: npt.DTypeLike | None = None,
+        stride: int | None = 1,
+        target_count: int | None = None,
     ) -> Dict[int | str, np.array]:
         surfaces = get_surfaces_from_objects(surfaces)
         return {
-            surface: vector_field_data[surface_ids[count]][field_name].reshape(-1, 3)
+            surface: _reduce_precision(
+                _decimate(
+                    vector_field_data[surface_ids[count]][field_name].reshape(-1, 3),
+                    stride,
+                    target_count,
+                ),
+                dtype,
+            )
             for count, surface in enumerate(surfaces)
         }
 
@@ -739,6 +826,220 @@ def get_surfaces_from_objects(surfaces: List[int | str | object]):
     return updated_surfaces
 
 
+def get_csr_connectivity(data: npt.ArrayLike) -> CSRConnectivity:
+    """
+    Convert flat faces connectivity data into compressed sparse row (CSR) format.
+
+    Each face in the flat array is represented by:
+    [N, v0, v1, ..., vN], where:
+      - N is the number of vertices in the face
+      - v0...vN are the vertex indices
+
+    Parameters
+    ----------
+    data : array-like of int
+        Flat array containing faces connectivity data, as returned for a
+        ``SurfaceFieldDataRequest`` with ``flatten_connectivity=True``.
+
+    Returns
+    -------
+    CSRConnectivity
+        Offsets and vertex indices of the faces.
+
+    Raises
+    ------
+    ValueError
+        If the data is not valid flat faces connectivity data.
+
+    Examples
+    --------
+    >>> flat_data = np.array([4, 4, 5, 12, 11, 3, 1, 2, 3], dtype=np.int32)
+    >>> get_csr_connectivity(flat_data)
+    CSRConnectivity(offsets=array([0, 4, 7]), indices=array([ 4,  5, 12, 11,  1,  2,  3], dtype=int32))
+    """
+    data = np.asarray(data)
+    size = len(data)
+    starts = _get_face_starts(data)
+    counts = data[starts].astype(np.int64)
+    if size and starts[-1] + 1 + counts[-1] != size:
+        raise ValueError("Invalid faces connectivity data.")
+    offsets = np.zeros(len(starts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    is_index = np.ones(size, dtype=bool)
+    is_index[starts] = False
+    return CSRConnectivity(offsets=offsets, indices=data[is_index])
+
+
+def _get_face_starts(data: np.ndarray) -> np.ndarray:
+    """Get the positions of the vertex counts in flat faces connectivity data."""
+    size = len(data)
+    if not size:
+        return np.zeros(0, dtype=np.int64)
+    # All faces usually have the same number of vertices.
+    stride = int(data[0]) + 1
+    if stride > 1 and size % stride == 0 and np.all(data[::stride] == stride - 1):
+        return np.arange(0, size, stride, dtype=np.int64)
+    # Only the positions with small values can be vertex counts, which leaves about
+    # one candidate position per face. All positions are candidates if a face has
+    # more vertices.
+    candidates = np.flatnonzero((data > 0) & (data <= _MAX_FACE_VERTICES_HINT))
+    if len(candidates) and candidates[0] == 0:
+        starts = _follow_faces(data, candidates)
+        if starts[-1] + 1 + data[starts[-1]] == size:
+            return starts
+    return _follow_faces(data, np.arange(size, dtype=np.int64))
+
+
+_MAX_FACE_VERTICES_HINT = 64
+
+
+def _follow_faces(data: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """Follow the chain of faces from the first candidate position.
+
+    The chain is followed by pointer jumping, which doubles the number of found faces
+    in every step.
+    """
+    n_candidates = len(candidates)
+    next_positions = candidates + 1 + np.maximum(data[candidates], 0)
+    jump = np.searchsorted(candidates, next_positions)
+    is_candidate = jump < n_candidates
+    is_candidate[is_candidate] = (
+        candidates[jump[is_candidate]] == next_positions[is_candidate]
+    )
+    jump[~is_candidate] = n_candidates
+    jump = np.append(jump, n_candidates)
+    is_start = np.zeros(n_candidates + 1, dtype=bool)
+    is_start[0] = True
+    found = np.zeros(1, dtype=np.int64)
+    while True:
+        found = jump[found]
+        found = found[found < n_candidates]
+        if not len(found):
+            return candidates[np.flatnonzero(is_start[:n_candidates])]
+        is_start[found] = True
+        found = np.flatnonzero(is_start)
+        jump = jump[jump]
+
+
+def _get_decimation_step(
+    n_items: int, stride: int | None = 1, target_count: int | None = None
+) -> int:
+    """Get the step between the items kept by a decimation."""
+    stride = 1 if stride is None else stride
+    if stride < 1:
+        raise ValueError(f"'stride' must be a positive integer, got {stride}.")
+    if target_count is None:
+        return stride
+    if target_count < 1:
+        raise ValueError(
+            f"'target_count' must be a positive integer, got {target_count}."
+        )
+    return max(stride, -(-n_items // target_count))
+
+
+def _decimate(
+    data: np.ndarray, stride: int | None = 1, target_count: int | None = None
+) -> np.ndarray:
+    """Keep every ``stride``-th item, and at most about ``target_count`` items."""
+    if stride in (None, 1) and target_count is None:
+        return data
+    return data[:: _get_decimation_step(len(data), stride, target_count)]
+
+
+def _reduce_precision(data: np.ndarray, dtype: npt.DTypeLike | None) -> np.ndarray:
+    """Convert floating-point data to ``dtype``, leaving any other data unchanged."""
+    if dtype is None or data.dtype.kind != "f":
+        return data
+    dtype = np.dtype(dtype)
+    if dtype.kind != "f":
+        raise ValueError(f"'dtype' must be a floating-point type, got {dtype}.")
+    return data.astype(dtype, copy=False)
+
+
+def _decimate_faces_connectivity(
+    data: np.ndarray, step: int, renumber: bool = False
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """Keep every ``step``-th face of flat faces connectivity data.
+
+    Returns the flat connectivity data of the kept faces. If ``renumber`` is
+    ``True``, the vertices are renumbered to the sorted indices of the vertices used
+    by the kept faces, which are returned as well.
+    """
+    csr = get_csr_connectivity(data)
+    counts = np.diff(csr.offsets)[::step]
+    starts = csr.offsets[:-1][::step]
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    positions = (
+        np.arange(offsets[-1], dtype=np.int64)
+        - np.repeat(offsets[:-1], counts)
+        + np.repeat(starts, counts)
+    )
+    indices = csr.indices[positions]
+    used = None
+    if renumber:
+        used, indices = np.unique(indices, return_inverse=True)
+    flat = np.empty(len(counts) + len(indices), dtype=data.dtype)
+    count_positions = offsets[:-1] + np.arange(len(counts))
+    is_index = np.ones(len(flat), dtype=bool)
+    is_index[count_positions] = False
+    flat[count_positions] = counts
+    flat[is_index] = indices
+    return flat, used
+
+
+def _decimate_surface_data(
+    surface_data: Dict[str, np.ndarray],
+    stride: int | None = 1,
+    target_count: int | None = None,
+) -> Dict[str, np.ndarray]:
+    """Decimate the faces of the surface data of a single surface.
+
+    The data is keyed by the values of ``SurfaceDataType``. If both the vertices and
+    the faces connectivity are present, the vertices are reduced to those used by the
+    kept faces and the connectivity is renumbered accordingly.
+    """
+    if stride in (None, 1) and target_count is None:
+        return surface_data
+    faces = surface_data.get(SurfaceDataType.FacesConnectivity.value)
+    vertices = surface_data.get(SurfaceDataType.Vertices.value)
+    if faces is not None:
+        n_faces = len(_get_face_starts(np.asarray(faces)))
+    else:
+        face_data = [
+            surface_data[data_type.value]
+            for data_type in (
+                SurfaceDataType.FacesCentroid,
+                SurfaceDataType.FacesNormal,
+            )
+            if data_type.value in surface_data
+        ]
+        n_faces = len(face_data[0]) // 3 if face_data else None
+    decimated = dict(surface_data)
+    if n_faces is None:
+        if vertices is not None:
+            decimated[SurfaceDataType.Vertices.value] = _decimate(
+                vertices.reshape(-1, 3), stride, target_count
+            )
+        return decimated
+    step = _get_decimation_step(n_faces, stride, target_count)
+    if step == 1:
+        return surface_data
+    for data_type in (SurfaceDataType.FacesCentroid, SurfaceDataType.FacesNormal):
+        if data_type.value in surface_data:
+            decimated[data_type.value] = surface_data[data_type.value].reshape(-1, 3)[
+                ::step
+            ]
+    if faces is not None:
+        faces, used = _decimate_faces_connectivity(
+            np.asarray(faces), step, renumber=vertices is not None
+        )
+        decimated[SurfaceDataType.FacesConnectivity.value] = faces
+        if used is not None:
+            decimated[SurfaceDataType.Vertices.value] = vertices.reshape(-1, 3)[used]
+    return decimated
+
+
 def _transform_faces_connectivity_data(data):
     """
     Transform flat face connectivity data into structured face-wise format.
@@ -769,10 +1070,6 @@ def _transform_faces_connectivity_data(data):
     >>> _transform_faces_connectivity_data(flat_data)
     [array([ 4,  5, 12, 11]), array([1, 2, 3])]
     """
-    faces_data = []
-    i = 0
-    while i < len(data):
-        end = i + 1 + data[i]
-        faces_data.append(data[i + 1 : end])
-        i = end
-    return faces_data
+    offsets, indices = get_csr_connectivity(data)
+    offsets = offsets.tolist()
+    return [indices[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
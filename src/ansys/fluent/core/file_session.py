@@ -27,6 +27,7 @@ import warnings
 
 from deprecated.sphinx import deprecated
 import numpy as np
+import numpy.typing as npt
 
 from ansys.api.fluent.v0.field_data_pb2 import DataLocation
 from ansys.fluent.core import PyFluentDeprecationWarning
@@ -41,12 +42,16 @@ from ansys.fluent.core.field_data_interfaces import (
     VectorFieldDataRequest,
     _AllowedScalarFieldNames,
     _AllowedSurfaceNames,
+    _decimate,
+    _decimate_surface_data,
+    _reduce_precision,
     _ReturnFieldData,
     _ScalarFields,
     _SurfaceIds,
     _SurfaceNames,
     _transform_faces_connectivity_data,
     _VectorFields,
+    get_csr_connectivity,
 )
 from ansys.fluent.core.filereader.case_file import CaseFile
 from ansys.fluent.core.filereader.data_file import (
@@ -54,6 +59,7 @@ from ansys.fluent.core.filereader.data_file import (
     _to_scalar_field_name,
     _to_vector_field_name,
 )
+from ansys.fluent.core.filereader.data_file_series import DataFileSeries
 from ansys.fluent.core.utils.deprecate import all_deprecators
 
 
@@ -127,6 +133,10 @@ class BatchFieldData:
             kwargs.get("surfaces"),
             self.get_surface_ids(kwargs.get("surfaces")),
             scalar_field_data,
+            node_value=kwargs.get("node_value"),
+            dtype=kwargs.get("dtype"),
+            stride=kwargs.get("stride"),
+            target_count=kwargs.get("target_count"),
         )
 
     def _get_surface_data(
@@ -140,6 +150,10 @@ class BatchFieldData:
             self.get_surface_ids(kwargs.get("surfaces")),
             surface_data,
             flatten_connectivity=kwargs.get("flatten_connectivity"),
+            csr_connectivity=kwargs.get("csr_connectivity"),
+            dtype=kwargs.get("dtype"),
+            stride=kwargs.get("stride"),
+            target_count=kwargs.get("target_count"),
         )
 
     def _get_vector_field_data(
@@ -152,6 +166,9 @@ class BatchFieldData:
             kwargs.get("surfaces"),
             self.get_surface_ids(kwargs.get("surfaces")),
             vector_field_data,
+            dtype=kwargs.get("dtype"),
+            stride=kwargs.get("stride"),
+            target_count=kwargs.get("target_count"),
         )
 
     def _get_pathlines_field_data(
@@ -675,6 +692,7 @@ class FileFieldData(FieldDataSource):
         surfaces: List[int | str],
         overset_mesh: bool | None = False,
         flatten_connectivity: bool = False,
+        csr_connectivity: bool = False,
     ):
         """Get surface data (vertices and faces connectivity).
 
@@ -688,6 +706,8 @@ class FileFieldData(FieldDataSource):
             Whether to provide the overset method. The default is ``False``.
         flatten_connectivity: bool, optional
             Whether to provide faces connectivity data in flattened format.
+        csr_connectivity: bool, optional
+            Whether to provide faces connectivity data in CSR format.
 
         Returns
         -------
@@ -701,6 +721,7 @@ class FileFieldData(FieldDataSource):
             surfaces=surfaces,
             overset_mesh=overset_mesh,
             flatten_connectivity=flatten_connectivity,
+            csr_connectivity=csr_connectivity,
         )
 
     def _get_surface_data(
@@ -709,6 +730,10 @@ class FileFieldData(FieldDataSource):
         surfaces: List[int | str],
         overset_mesh: bool | None = False,
         flatten_connectivity: bool = False,
+        csr_connectivity: bool = False,
+        dtype: npt.DTypeLike | None = None,
+        stride: int | None = 1,
+        target_count: int | None = None,
     ):
         for d_type in data_types:
             if isinstance(d_type, str):
@@ -716,21 +741,54 @@ class FileFieldData(FieldDataSource):
                 data_types.append(SurfaceDataType(d_type))
 
         surface_ids = self.get_surface_ids(surfaces=surfaces)
+        mesh = self._file_session._case_file.get_mesh()
+
+        if stride not in (None, 1) or target_count is not None:
+            # The vertices and the connectivity are decimated together so that they
+            # stay consistent between requests.
+            surfaces_data = [
+                _decimate_surface_data(
+                    {
+                        SurfaceDataType.Vertices.value: mesh.get_vertices(surface_id),
+                        SurfaceDataType.FacesConnectivity.value: mesh.get_connectivity(
+                            surface_id
+                        ),
+                    },
+                    stride,
+                    target_count,
+                )
+                for surface_id in surface_ids
+            ]
+
+            def get_vertices(count):
+                return surfaces_data[count][SurfaceDataType.Vertices.value]
+
+            def get_connectivity(count):
+                return surfaces_data[count][SurfaceDataType.FacesConnectivity.value]
+
+        else:
+
+            def get_vertices(count):
+                return mesh.get_vertices(surface_ids[count])
+
+            def get_connectivity(count):
+                return mesh.get_connectivity(surface_ids[count])
 
         if SurfaceDataType.Vertices in data_types:
             return {
-                surface: self._file_session._case_file.get_mesh()
-                .get_vertices(surface_ids[count])
-                .reshape(-1, 3)
+                surface: _reduce_precision(get_vertices(count).reshape(-1, 3), dtype)
                 for count, surface in enumerate(surfaces)
             }
 
         if SurfaceDataType.FacesConnectivity in data_types:
-            if flatten_connectivity:
+            if csr_connectivity:
                 return {
-                    surface: self._file_session._case_file.get_mesh().get_connectivity(
-                        surface_ids[count]
-                    )
+                    surface: get_csr_connectivity(get_connectivity(count))
+                    for count, surface in enumerate(surfaces)
+                }
+            elif flatten_connectivity:
+                return {
+                    surface: get_connectivity(count)
                     for count, surface in enumerate(surfaces)
                 }
             else:
@@ -741,11 +799,7 @@ class FileFieldData(FieldDataSource):
                     PyFluentDeprecationWarning,
                 )
                 return {
-                    surface: _transform_faces_connectivity_data(
-                        self._file_session._case_file.get_mesh().get_connectivity(
-                            surface_ids[count]
-                        )
-                    )
+                    surface: _transform_faces_connectivity_data(get_connectivity(count))
                     for count, surface in enumerate(surfaces)
                 }
 
@@ -814,12 +868,15 @@ class FileFieldData(FieldDataSource):
         surfaces: List[int | str],
         node_value: bool | None = True,
         boundary_value: bool | None = True,
+        dtype: npt.DTypeLike | None = None,
+        stride: int | None = 1,
+        target_count: int | None = None,
     ):
         surface_ids = self.get_surface_ids(surfaces=surfaces)
         if len(self._file_session._data_file.get_phases()) > 1:
             if not field_name.startswith("phase-"):
                 raise InvalidMultiPhaseFieldName()
-            return {
+            scalar_field_data = {
                 surface: self._file_session._data_file.get_face_scalar_field_data(
                     field_name.split(":")[0],
                     field_name.split(":")[1],
@@ -828,12 +885,16 @@ class FileFieldData(FieldDataSource):
                 for count, surface in enumerate(surfaces)
             }
         else:
-            return {
+            scalar_field_data = {
                 surface: self._file_session._data_file.get_face_scalar_field_data(
                     "phase-1", field_name, surface_ids[count]
                 )
                 for count, surface in enumerate(surfaces)
             }
+        return {
+            surface: _reduce_precision(_decimate(data, stride, target_count), dtype)
+            for surface, data in scalar_field_data.items()
+        }
 
     @all_deprecators(
         deprecate_arg_mappings=[
@@ -890,6 +951,9 @@ class FileFieldData(FieldDataSource):
         self,
         field_name: str,
         surfaces: List[int | str],
+        dtype: npt.DTypeLike | None = None,
+        stride: int | None = 1,
+        target_count: int | None = None,
     ):
         field_name = _to_vector_field_name(field_name)
         surface_ids = self.get_surface_ids(surfaces=surfaces)
@@ -902,19 +966,23 @@ class FileFieldData(FieldDataSource):
         if len(self._file_session._data_file.get_phases()) > 1:
             if not field_name.startswith("phase-"):
                 raise InvalidMultiPhaseFieldName()
-            return {
+            vector_field_data = {
                 surface: self._file_session._data_file.get_face_vector_field_data(
                     field_name.split(":")[0], surface_ids[count]
                 ).reshape(-1, 3)
                 for count, surface in enumerate(surfaces)
             }
         else:
-            return {
+            vector_field_data = {
                 surface: self._file_session._data_file.get_face_vector_field_data(
                     "phase-1", surface_ids[count]
                 ).reshape(-1, 3)
                 for count, surface in enumerate(surfaces)
             }
+        return {
+            surface: _reduce_precision(_decimate(data, stride, target_count), dtype)
+            for surface, data in vector_field_data.items()
+        }
 
     @all_deprecators(
         deprecate_arg_mappings=[
@@ -1203,6 +1271,129 @@ class FileSession:
         return self.fields.field_data
 
 
+class FileSessionSeries:
+    """File session to read the data files of a transient run.
+
+    The case file is read once and shared by the sessions of all the time steps.
+
+    Examples
+    --------
+    >>> from ansys.fluent.core.file_session import FileSessionSeries
+    >>> with FileSessionSeries("transient.cas.h5", "transient_results") as series:
+    >>>     last_step = series[-1]
+    >>>     last_step.fields.field_data.get_field_data(request)
+    >>>     pressure = series.get_scalar_field_data("SV_P", ["wall"])
+    """
+
+    def __init__(
+        self,
+        case_file_name,
+        data_files,
+        pattern: str = "*.dat.h5",
+        max_workers: int | None = None,
+    ):
+        """__init__ method of FileSessionSeries class.
+
+        Parameters
+        ----------
+        case_file_name : str
+            Case file shared by all the time steps.
+        data_files : str | os.PathLike | list[str | os.PathLike]
+            Directory holding the data files of the time steps, or the list of the
+            data files in time step order.
+        pattern : str, optional
+            Glob pattern of the data files in the directory. The default is
+            ``"*.dat.h5"``.
+        max_workers : int, optional
+            Maximum number of worker processes reading field data. ``0`` reads the
+            field data in the calling process. The default is the number of CPUs.
+        """
+        self._case_file = CaseFile(case_file_name)
+        self._data_files = DataFileSeries(
+            data_files,
+            case_file_handle=self._case_file,
+            pattern=pattern,
+            max_workers=max_workers,
+        )
+
+    @property
+    def data_file_names(self):
+        """Data files of the time steps."""
+        return self._data_files.data_file_names
+
+    def __len__(self) -> int:
+        return len(self._data_files)
+
+    def __getitem__(self, index: int) -> FileSession:
+        """Get the file session of a time step, which reads its data file lazily."""
+        session = FileSession()
+        session._case_file = self._case_file
+        session._data_file = self._data_files[index]
+        return session
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def get_scalar_field_data(
+        self,
+        field_name: str,
+        surfaces: List[int | str],
+        steps: List[int] | None = None,
+    ) -> Dict[int, Dict[int | str, np.ndarray]]:
+        """Get scalar field data on surfaces at several time steps.
+
+        The data files are read in parallel, see ``DataFileSeries``.
+
+        Parameters
+        ----------
+        field_name : str
+            Name of the scalar field.
+        surfaces : List[int | str]
+            List of surface IDS or surface names.
+        steps : List[int], optional
+            Indices of the time steps in the series. The default is all the time
+            steps.
+
+        Returns
+        -------
+        Dict[int, Dict[int | str, np.ndarray]]
+            Scalar field data for each time step index and surface.
+
+        Raises
+        ------
+        InvalidMultiPhaseFieldName
+            If field name does not have prefix ``phase-`` for multi-phase cases.
+        """
+        session = self[0]
+        surface_ids = _get_surface_ids(session.fields.field_info, surfaces)
+        phase_name = "phase-1"
+        if len(session._data_file.get_phases()) > 1:
+            if not field_name.startswith("phase-"):
+                raise InvalidMultiPhaseFieldName()
+            phase_name, field_name = field_name.split(":")
+        data = self._data_files.get_face_scalar_field_data(
+            phase_name, field_name, surface_ids, steps=steps
+        )
+        return {
+            step: {
+                surface: step_data[surface_ids[count]]
+                for count, surface in enumerate(surfaces)
+            }
+            for step, step_data in data.items()
+        }
+
+    def close(self) -> None:
+        """Shut down the worker processes and close the open data files."""
+        self._data_files.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+
 def _get_surface_ids(
     field_info: FileFieldInfo,
     surfaces: List[int | str],
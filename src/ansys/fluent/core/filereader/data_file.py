@@ -196,18 +196,13 @@ class DataFile:
         -------
             Numpy array containing scalar field data for a particular phase, field and surface.
         """
-        field_name = _to_scalar_field_name(field_name)
-        if ":" in field_name:
-            field_name = field_name.split(":")[1]
         min_id, max_id = self._case_file_handle.get_mesh().get_surface_locs(surface_id)
-        field_data = self._field_data[phase_name]["faces"][field_name]
-        for field_array_name in field_data:
-            field_array = field_data[field_array_name]
-            array_min_id = int(field_array.attrs["minId"][0] - 1)
-            array_max_id = int(field_array.attrs["maxId"][0] - 1)
-            if min_id >= array_min_id and max_id <= array_max_id:
-                return field_array[min_id - array_min_id : max_id + 1 - array_min_id]
-        return np.zeros(max_id + 1 - min_id)
+        field_array, locs = _get_face_field_array(
+            self._field_data[phase_name]["faces"], field_name, min_id, max_id
+        )
+        if field_array is None:
+            return np.zeros(max_id + 1 - min_id)
+        return field_array[locs]
 
     def get_face_vector_field_data(self, phase_name: str, surface_id: int) -> np.array:
         """Gets vector field data for face.
@@ -235,6 +230,29 @@ class DataFile:
         return vector_data
 
 
+def _get_face_field_name(field_name: str) -> str:
+    """Get the name of a face field in the data file."""
+    field_name = _to_scalar_field_name(field_name)
+    if ":" in field_name:
+        field_name = field_name.split(":")[1]
+    return field_name
+
+
+def _get_face_field_array(faces, field_name: str, min_id: int, max_id: int) -> tuple:
+    """Get the dataset and the slice holding the face values of a field.
+
+    The dataset is ``None`` if the face range is not stored in the data file.
+    """
+    field_data = faces[_get_face_field_name(field_name)]
+    for field_array_name in field_data:
+        field_array = field_data[field_array_name]
+        array_min_id = int(field_array.attrs["minId"][0] - 1)
+        array_max_id = int(field_array.attrs["maxId"][0] - 1)
+        if min_id >= array_min_id and max_id <= array_max_id:
+            return field_array, np.s_[min_id - array_min_id : max_id + 1 - array_min_id]
+    return None, None
+
+
 def _get_data_file_name_from_flprj(flprj_file):
     with open(flprj_file, "r") as file:
         content = file.read()
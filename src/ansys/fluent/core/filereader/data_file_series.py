@@ -0,0 +1,343 @@
+# Copyright (C) 2021 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Reader for the data files of a transient Fluent run.
+
+The data files of the time steps share a single case file, which is read once. The
+data files are opened lazily and the field data of several time steps can be read
+in parallel in worker processes.
+
+Example
+-------
+
+.. code-block:: python
+
+    >>> from ansys.fluent.core.filereader.case_file import CaseFile
+    >>> from ansys.fluent.core.filereader.data_file_series import DataFileSeries
+
+    >>> case_file = CaseFile(case_file_name="transient.cas.h5")
+    >>> with DataFileSeries("transient_results", case_file_handle=case_file) as series:
+    >>>     pressure = series.get_face_scalar_field_data("phase-1", "SV_P", [3, 4])
+    >>>     pressure[-1][3]  # pressure on surface 3 at the last time step
+"""
+
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+import os
+from pathlib import Path
+import re
+import sys
+
+import numpy as np
+
+from .data_file import DataFile, _get_face_field_array, _get_face_field_name
+
+try:
+    import h5py
+except ModuleNotFoundError as exc:
+    raise ModuleNotFoundError(
+        "Missing dependencies, use 'pip install ansys-fluent-core[reader]' to install them."
+    ) from exc
+
+_MAX_OPEN_DATA_FILES = 16
+
+
+class _SharedMemory(shared_memory.SharedMemory):
+    """Shared memory block which lives as long as the arrays viewing it."""
+
+    def __del__(self):
+        try:
+            self.close()
+        except (BufferError, OSError):
+            # Arrays still view the block, which is unmapped when they are freed.
+            pass
+
+
+def _natural_sort_key(path: Path) -> list:
+    """Sort key which orders ``step-10`` after ``step-9``."""
+    return [int(x) if x.isdigit() else x for x in re.split(r"(\d+)", path.name)]
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Attach to a shared memory block without registering it for cleanup.
+
+    The block is unlinked by the process which created it. A worker with its own
+    resource tracker would otherwise unlink the block and warn about a leak when it
+    exits. Unregistering the block after attaching is not an option, as it removes
+    the registration of the creating process when the tracker is shared.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+def _read_face_fields(
+    data_file_name: str,
+    phase_name: str,
+    field_name: str,
+    regions: list[tuple[int, int, int]],
+    shared_memory_name: str,
+    dtype: str,
+    size: int,
+) -> None:
+    """Read the face values of a field into a shared memory block.
+
+    This runs in the worker processes. Each region is a tuple of the minimum and
+    maximum face indices of a surface and the offset of its values in the block.
+    """
+    block = _attach_shared_memory(shared_memory_name)
+    try:
+        out = np.frombuffer(block.buf, dtype=dtype, count=size)
+        with h5py.File(data_file_name, "r") as data_file:
+            faces = data_file["results"]["1"][phase_name]["faces"]
+            for min_id, max_id, offset in regions:
+                values = out[offset : offset + max_id + 1 - min_id]
+                field_array, locs = _get_face_field_array(
+                    faces, field_name, min_id, max_id
+                )
+                if field_array is None:
+                    values[:] = 0
+                else:
+                    field_array.read_direct(values, source_sel=locs)
+        del out, values
+    finally:
+        block.close()
+
+
+class DataFileSeries(Sequence):
+    """Class to read the data files of a transient run.
+
+    Each item of the series is the ``DataFile`` of a time step. The data files are
+    opened on first access and only the most recently used ones are kept open.
+
+    Methods
+    -------
+    get_face_scalar_field_data(phase_name, field_name, surface_ids, steps)
+        Get the scalar field data for faces at several time steps.
+    close()
+        Shut down the worker processes.
+    """
+
+    def __init__(
+        self,
+        data_files: str | os.PathLike | list[str | os.PathLike],
+        case_file_handle=None,
+        pattern: str = "*.dat.h5",
+        max_workers: int | None = None,
+    ):
+        """Index the data files of a transient run.
+
+        Parameters
+        ----------
+        data_files : str | os.PathLike | list[str | os.PathLike]
+            Directory holding the data files of the time steps, or the list of the
+            data files in time step order.
+        case_file_handle : CaseFile, optional
+            Case file shared by all the time steps.
+        pattern : str, optional
+            Glob pattern of the data files in the directory. The matching files are
+            ordered by the step numbers in their names. The default is
+            ``"*.dat.h5"``.
+        max_workers : int, optional
+            Maximum number of worker processes reading field data. ``0`` reads the
+            field data in the calling process. The default is the number of CPUs.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the directory does not exist or holds no data file.
+        """
+        if isinstance(data_files, (str, os.PathLike)):
+            data_dir = Path(data_files)
+            if not data_dir.is_dir():
+                raise FileNotFoundError(f"The directory {data_dir} cannot be found.")
+            data_file_names = sorted(data_dir.glob(pattern), key=_natural_sort_key)
+            if not data_file_names:
+                raise FileNotFoundError(
+                    f"No data file matching {pattern} found in {data_dir}."
+                )
+        else:
+            data_file_names = [Path(x) for x in data_files]
+        self._data_file_names = data_file_names
+        self._case_file_handle = case_file_handle
+        self._max_workers = max_workers
+        self._executor = None
+        self._data_files = OrderedDict()
+
+    @property
+    def data_file_names(self) -> list[Path]:
+        """Data files of the time steps."""
+        return list(self._data_file_names)
+
+    def __len__(self) -> int:
+        return len(self._data_file_names)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = range(len(self))[index]
+        data_file = self._data_files.pop(index, None)
+        if data_file is None:
+            data_file = DataFile(
+                str(self._data_file_names[index]),
+                case_file_handle=self._case_file_handle,
+            )
+            if len(self._data_files) >= _MAX_OPEN_DATA_FILES:
+                self._data_files.popitem(last=False)
+        self._data_files[index] = data_file
+        return data_file
+
+    def get_face_scalar_field_data(
+        self,
+        phase_name: str,
+        field_name: str,
+        surface_ids: list[int],
+        steps: list[int] | None = None,
+    ) -> dict[int, dict[int, np.ndarray]]:
+        """Gets scalar field data for faces at several time steps.
+
+        Unless ``max_workers`` is ``0``, the data files are read in worker processes
+        which write the field data into shared memory. The returned arrays are views
+        of the shared memory, which is released when they are freed.
+
+        Parameters
+        ----------
+        phase_name : str
+            Name of the phase.
+        field_name : str
+            Name of the field.
+        surface_ids : List[int]
+            List of surface IDs.
+        steps : List[int], optional
+            Indices of the time steps in the series. The default is all the time
+            steps.
+
+        Returns
+        -------
+        Dict[int, Dict[int, np.ndarray]]
+            Field data for each time step index and surface ID.
+        """
+        steps = range(len(self)) if steps is None else steps
+        steps = [range(len(self))[step] for step in steps]
+        if self._max_workers == 0 or len(steps) * len(surface_ids) <= 1:
+            return {
+                step: {
+                    surface_id: self[step].get_face_scalar_field_data(
+                        phase_name, field_name, surface_id
+                    )
+                    for surface_id in surface_ids
+                }
+                for step in steps
+            }
+        mesh = self._case_file_handle.get_mesh()
+        surface_locs = {
+            surface_id: mesh.get_surface_locs(surface_id) for surface_id in surface_ids
+        }
+        dtype = self._get_face_field_dtype(steps[0], phase_name, field_name)
+        offsets = {}
+        size = 0
+        for step in steps:
+            for surface_id, (min_id, max_id) in surface_locs.items():
+                offsets[step, surface_id] = size
+                size += max_id + 1 - min_id
+        block = _SharedMemory(create=True, size=max(size * dtype.itemsize, 1))
+        try:
+            executor = self._get_executor()
+            # Split the surfaces too when there are fewer steps than workers.
+            split_surfaces = len(steps) < (self._max_workers or os.cpu_count() or 1)
+            jobs = []
+            for step in steps:
+                regions = [
+                    (min_id, max_id, offsets[step, surface_id])
+                    for surface_id, (min_id, max_id) in surface_locs.items()
+                ]
+                for job_regions in (
+                    [[x] for x in regions] if split_surfaces else [regions]
+                ):
+                    jobs.append(
+                        executor.submit(
+                            _read_face_fields,
+                            str(self._data_file_names[step]),
+                            phase_name,
+                            field_name,
+                            job_regions,
+                            block.name,
+                            dtype.str,
+                            size,
+                        )
+                    )
+            try:
+                for job in jobs:
+                    job.result()
+            except BaseException:
+                for job in jobs:
+                    job.cancel()
+                raise
+        finally:
+            # The block stays mapped in this process after it is unlinked.
+            block.unlink()
+        data = np.frombuffer(block.buf, dtype=dtype, count=size)
+        return {
+            step: {
+                surface_id: data[
+                    offsets[step, surface_id] : offsets[step, surface_id]
+                    + max_id
+                    + 1
+                    - min_id
+                ]
+                for surface_id, (min_id, max_id) in surface_locs.items()
+            }
+            for step in steps
+        }
+
+    def _get_face_field_dtype(
+        self, step: int, phase_name: str, field_name: str
+    ) -> np.dtype:
+        faces = self[step]._field_data[phase_name]["faces"]
+        field_data = faces[_get_face_field_name(field_name)]
+        return next(iter(field_data.values())).dtype
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker processes and close the open data files."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+        self._data_files.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
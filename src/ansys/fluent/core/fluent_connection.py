@@ -24,6 +24,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import ctypes
 from ctypes import c_int, sizeof
 from dataclasses import dataclass
@@ -49,6 +50,13 @@ from ansys.fluent.core.services.app_utilities import (
     AppUtilitiesService,
     AppUtilitiesV252,
 )
+from ansys.fluent.core.services.interceptors import (
+    AioChannelProfileInterceptor,
+    AioErrorStateInterceptor,
+    AioGrpcErrorInterceptor,
+    AioTracingInterceptor,
+    ChannelProfileInterceptor,
+)
 from ansys.fluent.core.services.scheme_eval import SchemeEvalService
 from ansys.fluent.core.utils.execution import timeout_exec, timeout_loop
 from ansys.fluent.core.utils.file_transfer_service import ContainerFileTransferStrategy
@@ -250,6 +258,147 @@ class FluentConnectionProperties:
         return vars(self)
 
 
+@dataclass(frozen=True)
+class ChannelProfile:
+    """Tuning of the gRPC channel to a Fluent server.
+
+    The default profile matches the channel used when no profile is specified. The
+    compression and the deadlines can be specified for all the calls or per gRPC
+    service or method, using keys like ``"FieldData"``, ``"Settings/SetVar"`` or
+    ``"grpcRemoting.FieldData/GetFields"``. The most specific key applies.
+
+    Parameters
+    ----------
+    keepalive_time : float, optional
+        Interval in seconds between the keepalive pings sent to the server. By default,
+        no keepalive ping is sent. Fluent, like other gRPC servers, may close the
+        connection if the pings are sent more often than every 5 minutes while no
+        call is active.
+    keepalive_timeout : float, optional
+        Time in seconds to wait for the acknowledgement of a keepalive ping before
+        closing the connection. By default, the gRPC default of 20 seconds is used.
+    keepalive_without_calls : bool, optional
+        Whether to send keepalive pings while no call is active, which keeps idle
+        connections through NAT gateways and firewalls. The default is ``False``.
+    compression : grpc.Compression or dict[str, grpc.Compression], optional
+        Compression of the messages sent to the server, either for all the calls or
+        per service or method. The compression of the messages sent back is decided
+        by the server. By default, the messages are not compressed.
+    timeout : float or dict[str, float], optional
+        Default deadline in seconds of the calls with a single response, either for
+        all of them or per service or method. Long-running commands, like iterating
+        the solver, are subject to it as well. Streaming calls, like the transcript,
+        never get a default deadline. By default, the calls have no deadline.
+
+    Examples
+    --------
+    >>> import grpc
+    >>> import ansys.fluent.core as pyfluent
+    >>> profile = pyfluent.ChannelProfile(
+    >>>     keepalive_time=300,
+    >>>     keepalive_without_calls=True,
+    >>>     compression={"FieldData": grpc.Compression.Gzip, "Settings": grpc.Compression.Gzip},
+    >>>     timeout={"FieldData": 600},
+    >>> )
+    >>> solver = pyfluent.connect_to_fluent(ip=ip, port=port, channel_profile=profile)
+    """
+
+    keepalive_time: float | None = None
+    keepalive_timeout: float | None = None
+    keepalive_without_calls: bool = False
+    compression: grpc.Compression | dict[str, grpc.Compression] | None = None
+    timeout: float | dict[str, float] | None = None
+
+    @classmethod
+    def remote(cls) -> ChannelProfile:
+        """Get a profile for Fluent servers reached over a slower network.
+
+        Idle connections are kept alive, and the field data and settings state sent
+        to the server are compressed with gzip.
+        """
+        return cls(
+            keepalive_time=300,
+            keepalive_timeout=20,
+            keepalive_without_calls=True,
+            compression={
+                "FieldData": grpc.Compression.Gzip,
+                "Settings": grpc.Compression.Gzip,
+            },
+        )
+
+    def get_channel_options(self) -> list[tuple[str, Any]]:
+        """Get the gRPC channel options of the profile."""
+        options = []
+        if self.keepalive_time is not None:
+            options.append(("grpc.keepalive_time_ms", int(self.keepalive_time * 1000)))
+        if self.keepalive_timeout is not None:
+            options.append(
+                ("grpc.keepalive_timeout_ms", int(self.keepalive_timeout * 1000))
+            )
+        if self.keepalive_without_calls:
+            options += [
+                ("grpc.keepalive_permit_without_calls", 1),
+                ("grpc.http2.max_pings_without_data", 0),
+            ]
+        return options
+
+    def get_channel_compression(self) -> grpc.Compression | None:
+        """Get the compression of all the calls, if it does not depend on the
+        service or method."""
+        if not isinstance(self.compression, dict):
+            return self.compression
+
+    @staticmethod
+    def _get_method_value(values: Any, method: str | bytes) -> Any:
+        if not isinstance(values, dict):
+            return values
+        if isinstance(method, bytes):
+            method = method.decode()
+        service, name = method.lstrip("/").rsplit("/", 1)
+        short_service = service.rsplit(".", 1)[-1]
+        for key in (f"{service}/{name}", f"{short_service}/{name}", service):
+            if key in values:
+                return values[key]
+        return values.get(short_service)
+
+    def get_compression(self, method: str | bytes) -> grpc.Compression | None:
+        """Get the compression of the calls of a gRPC method.
+
+        Parameters
+        ----------
+        method : str
+            Full name of the gRPC method, like ``"/grpcRemoting.FieldData/GetFields"``.
+        """
+        return self._get_method_value(self.compression, method)
+
+    def get_timeout(self, method: str | bytes) -> float | None:
+        """Get the default deadline of the calls of a gRPC method.
+
+        Parameters
+        ----------
+        method : str
+            Full name of the gRPC method, like ``"/grpcRemoting.FieldData/GetFields"``.
+        """
+        return self._get_method_value(self.timeout, method)
+
+    def intercept_channel(self, channel: grpc.Channel) -> grpc.Channel:
+        """Apply the per-call settings of the profile to a channel.
+
+        Parameters
+        ----------
+        channel : grpc.Channel
+            Channel to the Fluent server.
+
+        Returns
+        -------
+        grpc.Channel
+            Channel applying the default deadlines and compression of the profile.
+        """
+        if self.compression is not None or self.timeout is not None:
+            return grpc.intercept_channel(channel, ChannelProfileInterceptor(self))
+        return channel
+
+
 def _get_ip_and_port(ip: str | None = None, port: int | None = None) -> (str, int):
     if not ip:
         ip = os.getenv("PYFLUENT_FLUENT_IP", "127.0.0.1")
@@ -260,16 +409,69 @@ def _get_ip_and_port(ip: str | None = None, port: int | None = None) -> (str, in
     return ip, port
 
 
-def _get_channel(ip: str, port: int):
+def _get_channel(ip: str, port: int, channel_profile: ChannelProfile | None = None):
     # Same maximum message length is used in the server
     max_message_length = _get_max_c_int_limit()
-    return grpc.insecure_channel(
+    channel_profile = channel_profile or ChannelProfile()
+    channel = grpc.insecure_channel(
         f"{ip}:{port}",
         options=[
             ("grpc.max_send_message_length", max_message_length),
             ("grpc.max_receive_message_length", max_message_length),
-        ],
+        ]
+        + channel_profile.get_channel_options(),
     )
+    return channel_profile.intercept_channel(channel)
+
+
+def _get_aio_channel(
+    ip: str,
+    port: int,
+    fluent_error_state,
+    channel_profile: ChannelProfile | None = None,
+):
+    # Same maximum message length is used in the server
+    max_message_length = _get_max_c_int_limit()
+    channel_profile = channel_profile or ChannelProfile()
+    interceptors = [
+        AioGrpcErrorInterceptor(),
+        AioErrorStateInterceptor(fluent_error_state),
+        AioTracingInterceptor(),
+    ]
+    if channel_profile.timeout is not None:
+        interceptors.append(AioChannelProfileInterceptor(channel_profile))
+    return grpc.aio.insecure_channel(
+        f"{ip}:{port}",
+        options=[
+            ("grpc.max_send_message_length", max_message_length),
+            ("grpc.max_receive_message_length", max_message_length),
+        ]
+        + channel_profile.get_channel_options(),
+        compression=channel_profile.get_channel_compression(),
+        interceptors=interceptors,
+    )
+
+
+def _close_aio_channel(loop: asyncio.AbstractEventLoop, channel) -> None:
+    # A grpc.aio channel must be closed on the event loop it was created on.
+    if loop.is_closed():
+        return
+    try:
+        if not loop.is_running():
+            loop.run_until_complete(channel.close())
+        elif _get_running_loop() is loop:
+            loop.create_task(channel.close())
+        else:
+            asyncio.run_coroutine_threadsafe(channel.close(), loop)
+    except Exception as ex:
+        logger.debug(f"Failed to close the asyncio channel: {ex}")
+
+
+def _get_running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
 
 
 class _ConnectionInterface:
@@ -382,6 +584,7 @@ class FluentConnection:
         inside_container: bool | None = None,
         container: ContainerT | None = None,
         compose_config: ComposeConfig | None = None,
+        channel_profile: ChannelProfile | None = None,
     ):
         """Initialize a Session.
 
@@ -423,6 +626,10 @@ class FluentConnection:
             a container.
         compose_config: ComposeConfig, optional
             Configuration for Docker Compose or Podman Compose.
+        channel_profile: ChannelProfile, optional
+            Keepalive, compression and default deadlines of the gRPC channel. When
+            ``channel`` is specified, only the compression and the deadlines are
+            applied.
 
         Raises
         ------
@@ -433,13 +640,20 @@ class FluentConnection:
         self._error_state = ErrorState()
         self._data_valid = False
         self._channel_str = None
+        self._aio_channels = weakref.WeakKeyDictionary()
+        self._aio_services = weakref.WeakKeyDictionary()
         self._slurm_job_id = None
         self.finalizer_cbs = []
+        self._channel_profile = channel_profile
         if channel is not None:
-            self._channel = channel
+            self._channel = (
+                channel_profile.intercept_channel(channel)
+                if channel_profile
+                else channel
+            )
         else:
             ip, port = _get_ip_and_port(ip, port)
-            self._channel = _get_channel(ip, port)
+            self._channel = _get_channel(ip, port, channel_profile)
             self._channel_str = f"{ip}:{port}"
         self._metadata: List[Tuple[str, str]] = (
             [("password", password)] if password else []
@@ -523,6 +737,7 @@ class FluentConnection:
             self._remote_instance,
             self._file_transfer_service,
             self._exit_event,
+            self._aio_channels,
         )
         FluentConnection._monitor_thread.cbs.append(self._finalizer)
 
@@ -655,6 +870,47 @@ class FluentConnection:
         """
         return service(self._channel, self._metadata, *args)
 
+    def create_grpc_aio_service(self, service, *args):
+        """Create a gRPC service using an asyncio channel.
+
+        The asyncio channel and the service are created once for each running event
+        loop.
+
+        Parameters
+        ----------
+        service : Any
+            service class
+        args : Any, optional
+            additional arguments, by default empty
+
+        Returns
+        -------
+        Any
+            service object
+
+        Raises
+        ------
+        RuntimeError
+            If there is no running event loop or if the connection was created from
+            an existing channel.
+        """
+        loop = asyncio.get_running_loop()
+        if loop not in self._aio_channels:
+            if self._channel_str is None:
+                raise RuntimeError(
+                    "The asyncio API requires a connection created from an IP "
+                    "address and a port."
+                )
+            ip, port = self._channel_str.rsplit(":", 1)
+            self._aio_channels[loop] = _get_aio_channel(
+                ip, port, self._error_state, self._channel_profile
+            )
+            self._aio_services[loop] = {}
+        services = self._aio_services[loop]
+        if service not in services:
+            services[service] = service(self._aio_channels[loop], self._metadata, *args)
+        return services[service]
+
     def wait_process_finished(self, wait: float | int | bool = 60):
         """Returns ``True`` if local Fluent processes have finished, ``False`` if they
         are still running when wait limit (default 60 seconds) is reached. Immediately
@@ -820,6 +1076,7 @@ class FluentConnection:
         remote_instance,
         file_transfer_service,
         exit_event,
+        aio_channels=None,
     ) -> None:
         logger.debug("FluentConnection exit method called.")
         if channel:
@@ -833,6 +1090,11 @@ class FluentConnection:
             channel.close()
             channel = None
 
+        if aio_channels:
+            for loop, aio_channel in list(aio_channels.items()):
+                _close_aio_channel(loop, aio_channel)
+            aio_channels.clear()
+
         if remote_instance:
             remote_instance.delete()
 
@@ -22,12 +22,18 @@
 
 """Public objects and functions under launcher."""
 
+from ..utils import lazy_module_attrs
 from ..utils.fluent_version import FluentVersion  # noqa: F401
-from .fluent_container import (  # noqa: F401
-    configure_container_dict,
-    start_fluent_container,
-)
-from .launch_options import LaunchMode  # noqa: F401
-from .launcher import create_launcher  # noqa: F401
-from .pim_launcher import launch_remote_fluent  # noqa: F401
-from .process_launch_string import get_fluent_exe_path  # noqa: F401
+
+# Public objects which are imported from their modules on first access.
+_LAZY_ATTRS = {
+    "configure_container_dict": f"{__name__}.fluent_container",
+    "start_fluent_container": f"{__name__}.fluent_container",
+    "LaunchMode": f"{__name__}.launch_options",
+    "create_launcher": f"{__name__}.launcher",
+    "launch_remote_fluent": f"{__name__}.pim_launcher",
+    "get_fluent_exe_path": f"{__name__}.process_launch_string",
+    "SessionPool": f"{__name__}.session_pool",
+}
+
+__getattr__, __dir__ = lazy_module_attrs(globals(), _LAZY_ATTRS)
@@ -41,7 +41,7 @@ import os
 import time
 from typing import Any
 
-from ansys.fluent.core.fluent_connection import FluentConnection
+from ansys.fluent.core.fluent_connection import ChannelProfile, FluentConnection
 from ansys.fluent.core.launcher.fluent_container import (
     configure_container_dict,
     dict_to_str,
@@ -110,6 +110,7 @@ class DockerLauncher:
         file_transfer_service: Any | None = None,
         use_docker_compose: bool | None = None,
         use_podman_compose: bool | None = None,
+        channel_profile: ChannelProfile | None = None,
     ):
         """
         Launch a Fluent session in container mode.
@@ -167,6 +168,8 @@ class DockerLauncher:
             Whether to use Docker Compose to launch Fluent.
         use_podman_compose: bool
             Whether to use Podman Compose to launch Fluent.
+        channel_profile : ChannelProfile, optional
+            Keepalive, compression and default deadlines of the gRPC channel to Fluent.
 
         Returns
         -------
@@ -249,6 +252,7 @@ class DockerLauncher:
             inside_container=True,
             container=container,
             compose_config=self._compose_config,
+            channel_profile=self.argvals["channel_profile"],
         )
 
         self.argvals["compose_config"] = self._compose_config
@@ -32,7 +32,7 @@ import os
 from typing import Any, Dict
 
 import ansys.fluent.core as pyfluent
-from ansys.fluent.core.fluent_connection import FluentConnection
+from ansys.fluent.core.fluent_connection import ChannelProfile, FluentConnection
 from ansys.fluent.core.launcher.container_launcher import DockerLauncher
 from ansys.fluent.core.launcher.launch_options import (
     Dimension,
@@ -176,6 +176,7 @@ def launch_fluent(
     file_transfer_service: Any | None = None,
     use_docker_compose: bool | None = None,
     use_podman_compose: bool | None = None,
+    channel_profile: ChannelProfile | None = None,
 ) -> Meshing | PureMeshing | Solver | SolverIcing | SlurmFuture | dict:
     """Launch Fluent locally in server mode or connect to a running Fluent server
     instance.
@@ -305,6 +306,9 @@ def launch_fluent(
         Whether to use Docker Compose to launch Fluent.
     use_podman_compose: bool
         Whether to use Podman Compose to launch Fluent.
+    channel_profile : ChannelProfile, optional
+        Keepalive, compression and default deadlines of the gRPC channel to Fluent.
+        See :class:`~ansys.fluent.core.fluent_connection.ChannelProfile`.
 
     Returns
     -------
@@ -377,6 +381,7 @@ def connect_to_fluent(
     password: str | None = None,
     start_watchdog: bool | None = None,
     file_transfer_service: Any | None = None,
+    channel_profile: ChannelProfile | None = None,
 ) -> Meshing | PureMeshing | Solver | SolverIcing:
     """Connect to an existing Fluent server instance.
 
@@ -413,6 +418,9 @@ def connect_to_fluent(
         that any local Fluent connections are properly closed (or terminated if frozen) when Python process ends.
     file_transfer_service : optional
         File transfer service. Uploads/downloads files to/from the server.
+    channel_profile : ChannelProfile, optional
+        Keepalive, compression and default deadlines of the gRPC channel to Fluent.
+        See :class:`~ansys.fluent.core.fluent_connection.ChannelProfile`.
 
     Returns
     -------
@@ -428,6 +436,7 @@ def connect_to_fluent(
         port=port,
         password=password,
         cleanup_on_exit=cleanup_on_exit,
+        channel_profile=channel_profile,
     )
     new_session = _get_running_session_mode(fluent_connection)
 
@@ -40,7 +40,7 @@ import logging
 import os
 from typing import Any, Dict
 
-from ansys.fluent.core.fluent_connection import FluentConnection
+from ansys.fluent.core.fluent_connection import ChannelProfile, FluentConnection
 from ansys.fluent.core.launcher.launch_options import (
     Dimension,
     FluentLinuxGraphicsDriver,
@@ -82,6 +82,7 @@ class PIMLauncher:
         gpu: bool | None = None,
         start_watchdog: bool | None = None,
         file_transfer_service: Any | None = None,
+        channel_profile: ChannelProfile | None = None,
     ):
         """
         Launch a Fluent session in `PIM <https://pypim.docs.pyansys.com/version/stable/>`_ mode.
@@ -125,6 +126,8 @@ class PIMLauncher:
             GUI-less Fluent sessions started by PyFluent are properly closed when the current Python process ends.
         file_transfer_service : Any, optional
             Service for uploading/downloading files to/from the server.
+        channel_profile : ChannelProfile, optional
+            Keepalive, compression and default deadlines of the gRPC channel to Fluent.
 
         Returns
         -------
@@ -283,6 +286,9 @@ def create_fluent_connection(
         cleanup_on_exit=cleanup_on_exit,
         remote_instance=instance,
         slurm_job_id=launcher_args.get("slurm_job_id") if launcher_args else None,
+        channel_profile=(
+            launcher_args.get("channel_profile") if launcher_args else None
+        ),
     )
 
 
@@ -0,0 +1,434 @@
+# Copyright (C) 2021 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Provides a pool of pre-launched Fluent sessions.
+
+Launching Fluent takes tens of seconds. ``SessionPool`` keeps a fixed number of idle
+sessions of a given configuration launched and health-checked in the background so
+that a session can be handed out immediately.
+
+Examples
+--------
+
+>>> from ansys.fluent.core.launcher.session_pool import SessionPool
+>>> from ansys.fluent.core.launcher.launch_options import FluentMode, Precision
+
+>>> pool = SessionPool(size=2, mode=FluentMode.SOLVER, precision=Precision.DOUBLE, processor_count=4)
+>>> solver = pool.acquire()
+>>> solver.settings.file.read_case(file_name="elbow.cas.h5")
+>>> pool.release(solver)
+
+>>> with pool.session() as solver:
+...     solver.settings.file.read_case(file_name="elbow.cas.h5")
+
+>>> pool.close()
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable
+
+from ansys.fluent.core.launcher.launch_options import (
+    FluentMode,
+    LaunchMode,
+    Precision,
+    _get_fluent_launch_mode,
+)
+from ansys.fluent.core.launcher.launcher import create_launcher
+from ansys.fluent.core.launcher.slurm_launcher import SlurmFuture
+
+logger = logging.getLogger("pyfluent.launcher")
+
+# Interval in seconds at which a waiting ``acquire`` retries the failed launches.
+_ACQUIRE_RETRY_INTERVAL = 1.0
+
+
+class SessionPoolClosed(RuntimeError):
+    """Raised when a closed session pool is used."""
+
+    def __init__(self):
+        """Initialize SessionPoolClosed."""
+        super().__init__("The session pool is closed.")
+
+
+def _is_healthy(session) -> bool:
+    try:
+        return bool(session.is_active() and session.is_server_healthy())
+    except Exception:
+        return False
+
+
+class SessionPool:
+    """Keeps a number of idle Fluent sessions pre-launched and health-checked.
+
+    Sessions are launched through the standalone, container, PIM or Slurm launchers
+    (see :func:`~ansys.fluent.core.launcher.launcher.create_launcher`). The pool
+    launches a replacement in the background whenever a session is acquired,
+    discarded or found unhealthy, so that ``size`` idle sessions are available
+    whenever possible.
+
+    If ``reset_session`` is given, acquired sessions are handed back to the pool for
+    reuse and still count toward ``size``. No replacement is launched for them, and
+    the pool then holds at most ``size`` sessions in total.
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        fluent_launch_mode: LaunchMode | None = None,
+        mode: FluentMode | str | None = None,
+        precision: Precision | str | None = None,
+        processor_count: int | None = None,
+        reset_session: Callable[[Any], None] | None = None,
+        max_uses: int | None = None,
+        health_check_interval: float | None = 30.0,
+        **launcher_kwargs,
+    ):
+        """Create the pool and start launching its sessions in the background.
+
+        Parameters
+        ----------
+        size : int, optional
+            Number of idle sessions to keep launched. If ``reset_session`` is given,
+            the acquired sessions count toward this number. The default is ``1``.
+        fluent_launch_mode : LaunchMode, optional
+            Launch mode used for every session of the pool. The default is ``None``,
+            in which case the launch mode is inferred from ``launcher_kwargs`` in the
+            same way as in :func:`~ansys.fluent.core.launcher.launcher.launch_fluent`.
+        mode : FluentMode or str, optional
+            Launch mode of Fluent to point to a specific session type.
+        precision : Precision or str, optional
+            Floating point precision of the pooled sessions.
+        processor_count : int, optional
+            Number of processors of each pooled session.
+        reset_session : Callable, optional
+            Callable invoked with a released session to bring it back to a clean
+            state so that it can be handed out again. The default is ``None``, in
+            which case released sessions are exited and replaced by fresh ones.
+        max_uses : int, optional
+            Maximum number of times a session is handed out before it is recycled.
+            The default is ``None``, in which case there is no limit.
+        health_check_interval : float, optional
+            Interval in seconds between health checks of the idle sessions. The
+            default is ``30``. If ``None``, idle sessions are only checked when
+            they are acquired.
+        **launcher_kwargs : dict, optional
+            Additional keyword arguments passed to the launcher, for example
+            ``product_version``, ``container_dict`` or ``scheduler_options``.
+
+        Raises
+        ------
+        ValueError
+            If ``size`` is less than ``1``.
+        """
+        if size < 1:
+            raise ValueError("The size of a session pool must be at least 1.")
+        if fluent_launch_mode is None:
+            fluent_launch_mode = _get_fluent_launch_mode(
+                start_container=launcher_kwargs.pop("start_container", None),
+                container_dict=launcher_kwargs.get("container_dict"),
+                scheduler_options=launcher_kwargs.get("scheduler_options"),
+            )
+        self._size = size
+        self._fluent_launch_mode = fluent_launch_mode
+        self._launcher_kwargs = {
+            k: v
+            for k, v in dict(
+                mode=mode,
+                precision=precision,
+                processor_count=processor_count,
+                **launcher_kwargs,
+            ).items()
+            if v is not None
+        }
+        self._reset_session = reset_session
+        self._max_uses = max_uses
+        self._idle = queue.Queue()
+        self._uses = {}
+        # Ids of the acquired sessions which are going to be reused.
+        self._checked_out = set()
+        self._pending = 0
+        # Number of idle sessions taken out of the queue by a health check.
+        self._under_check = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        self._last_launch_error = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=size, thread_name_prefix="pyfluent-session-pool"
+        )
+        self._stop_health_check = threading.Event()
+        self._health_check_thread = None
+        self._refill()
+        if health_check_interval:
+            self._health_check_thread = threading.Thread(
+                target=self._run_health_check,
+                args=(health_check_interval,),
+                daemon=True,
+            )
+            self._health_check_thread.start()
+
+    @property
+    def size(self) -> int:
+        """Number of idle sessions the pool keeps launched."""
+        return self._size
+
+    @property
+    def idle_count(self) -> int:
+        """Number of idle sessions currently available."""
+        return self._idle.qsize()
+
+    @property
+    def closed(self) -> bool:
+        """Whether the pool is closed."""
+        return self._closed
+
+    def _launch(self):
+        launcher = create_launcher(self._fluent_launch_mode, **self._launcher_kwargs)
+        session = launcher()
+        if isinstance(session, SlurmFuture):
+            session = session.result()
+        return session
+
+    def _launch_into_pool(self):
+        try:
+            session = self._launch()
+        except Exception as ex:
+            logger.warning(f"Session pool failed to launch Fluent: {ex}")
+            with self._lock:
+                self._pending -= 1
+                self._last_launch_error = ex
+            return
+        with self._lock:
+            self._pending -= 1
+            if not self._closed:
+                self._uses[id(session)] = 0
+                self._idle.put(session)
+                return
+        self._exit(session)
+
+    def _refill(self):
+        with self._lock:
+            if self._closed:
+                return
+            missing = (
+                self._size
+                - self._idle.qsize()
+                - self._pending
+                - self._under_check
+                - len(self._checked_out)
+            )
+            self._pending += max(missing, 0)
+        for _ in range(missing):
+            self._executor.submit(self._launch_into_pool)
+
+    def _is_reusable(self, session) -> bool:
+        uses = self._uses.get(id(session), 0)
+        return self._reset_session is not None and (
+            self._max_uses is None or uses < self._max_uses
+        )
+
+    def _exit(self, session):
+        self._uses.pop(id(session), None)
+        try:
+            session.exit()
+        except Exception as ex:
+            logger.debug(f"Exception while exiting a pooled session: {ex}")
+
+    def _run_health_check(self, interval: float):
+        while not self._stop_health_check.wait(interval):
+            self.check_health()
+
+    def check_health(self) -> None:
+        """Exit unhealthy idle sessions and launch replacements."""
+        sessions = []
+        with self._lock:
+            while True:
+                try:
+                    sessions.append(self._idle.get_nowait())
+                except queue.Empty:
+                    break
+            self._under_check += len(sessions)
+        for session in sessions:
+            healthy = _is_healthy(session)
+            with self._lock:
+                self._under_check -= 1
+                if healthy and not self._closed:
+                    self._idle.put(session)
+                    continue
+            if not healthy:
+                logger.info("Discarding unhealthy session from the session pool.")
+            self._exit(session)
+        self._refill()
+
+    def acquire(self, timeout: float | None = None):
+        """Hand out an idle session, waiting for one to be launched if necessary.
+
+        Failed launches are retried while waiting.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time in seconds to wait for a session. The default is ``None``,
+            in which case there is no limit to the wait time.
+
+        Returns
+        -------
+        :obj:`~typing.Union` [:class:`Meshing<ansys.fluent.core.session_meshing.Meshing>`, \
+        :class:`~ansys.fluent.core.session_pure_meshing.PureMeshing`, \
+        :class:`~ansys.fluent.core.session_solver.Solver`, \
+        :class:`~ansys.fluent.core.session_solver_icing.SolverIcing`]
+            Session instance.
+
+        Raises
+        ------
+        SessionPoolClosed
+            If the pool is closed.
+        TimeoutError
+            If no healthy session became available within ``timeout`` seconds.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            if self._closed:
+                raise SessionPoolClosed()
+            self._refill()
+            remaining = None if deadline is None else max(deadline - time.time(), 0)
+            wait = (
+                _ACQUIRE_RETRY_INTERVAL
+                if remaining is None
+                else min(remaining, _ACQUIRE_RETRY_INTERVAL)
+            )
+            try:
+                session = self._idle.get(timeout=wait)
+            except queue.Empty:
+                if remaining is None or remaining > wait:
+                    # Go around to launch again the sessions which failed to launch.
+                    continue
+                message = (
+                    f"No Fluent session became available within {timeout} seconds."
+                )
+                if self._last_launch_error:
+                    message += f" Last launch error: {self._last_launch_error}"
+                raise TimeoutError(message) from None
+            if _is_healthy(session):
+                break
+            logger.info("Discarding unhealthy session from the session pool.")
+            self._exit(session)
+        with self._lock:
+            self._uses[id(session)] = self._uses.get(id(session), 0) + 1
+            if self._is_reusable(session):
+                self._checked_out.add(id(session))
+        self._refill()
+        return session
+
+    def release(self, session, recycle: bool = False) -> None:
+        """Return a session to the pool.
+
+        If it can be reused, the session is reset with ``reset_session`` and kept
+        as an idle session. Otherwise, it is exited and a fresh session is launched
+        in the background.
+
+        Parameters
+        ----------
+        session : :obj:`~typing.Union` [:class:`Meshing<ansys.fluent.core.session_meshing.Meshing>`, \
+        :class:`~ansys.fluent.core.session_pure_meshing.PureMeshing`, \
+        :class:`~ansys.fluent.core.session_solver.Solver`, \
+        :class:`~ansys.fluent.core.session_solver_icing.SolverIcing`]
+            Session previously returned by :meth:`acquire`.
+        recycle : bool, optional
+            Whether to exit the session instead of resetting it. The default is
+            ``False``.
+        """
+        with self._lock:
+            keep = (
+                not recycle
+                and not self._closed
+                and id(session) in self._checked_out
+                and self._is_reusable(session)
+            )
+            if not keep:
+                self._checked_out.discard(id(session))
+        if keep:
+            try:
+                self._reset_session(session)
+            except Exception as ex:
+                logger.warning(f"Failed to reset a pooled session: {ex}")
+                keep = False
+        keep = keep and _is_healthy(session)
+        with self._lock:
+            self._checked_out.discard(id(session))
+            keep = keep and not self._closed
+            if keep:
+                self._idle.put(session)
+        if not keep:
+            self._exit(session)
+        self._refill()
+
+    @contextmanager
+    def session(self, timeout: float | None = None, recycle: bool = False):
+        """Context manager which acquires a session and releases it on exit.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time in seconds to wait for a session.
+        recycle : bool, optional
+            Whether to exit the session on release instead of resetting it.
+        """
+        session = self.acquire(timeout=timeout)
+        try:
+            yield session
+        finally:
+            self.release(session, recycle=recycle)
+
+    def close(self, wait: bool = True) -> None:
+        """Exit all idle sessions and stop launching new ones.
+
+        Sessions that are currently acquired are exited when they are released.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Whether to wait for the in-flight launches to finish. The default is
+            ``True``.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._stop_health_check.set()
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        while True:
+            try:
+                self._exit(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any):
+        self.close()
@@ -59,19 +59,38 @@ are optional and should be specified in a similar manner to Fluent's scheduler o
 
 >>> slurm_solver_launcher = create_launcher(LaunchMode.SLURM)
 >>> slurm_solver_session = slurm_solver_launcher()
+
+# Launching many sessions
+
+The states of all Slurm jobs are queried by a shared monitor in one batched
+``squeue`` call per polling interval, irrespective of the number of futures.
+
+>>> from ansys.fluent.core.launcher.slurm_launcher import as_completed
+>>> slurm_futures = [slurm_solver_launcher() for _ in range(100)]
+>>> for slurm in as_completed(slurm_futures):
+...     session = slurm.result()
 """
 
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    FIRST_EXCEPTION,
+    Future,
+    ThreadPoolExecutor,
+)
 import inspect
 import logging
 import os
 from pathlib import Path
 import shutil
 import subprocess
+import threading
 import time
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Iterable, Iterator, NamedTuple
 
+import ansys.fluent.core as pyfluent
 from ansys.fluent.core.exceptions import InvalidArgument
+from ansys.fluent.core.fluent_connection import ChannelProfile
 from ansys.fluent.core.launcher.launch_options import (
     Dimension,
     FluentLinuxGraphicsDriver,
@@ -150,6 +169,59 @@ class _SlurmWrapper:
         out = subprocess.check_output(["squeue", "-j", f"{job_id}", "-o", '"%T"', "-h"])
         return out.decode().strip().strip('"')
 
+    @staticmethod
+    def get_states(job_ids: Iterable[int]) -> dict[int, str]:
+        """Return states of multiple jobs using a single ``squeue`` call.
+
+        Parameters
+        ----------
+        job_ids : Iterable[int]
+            Job ids.
+
+        Returns
+        -------
+        dict[int, str]
+            Mapping from job id to any of ``""``, ``"PENDING"``, ``"RUNNING"``,
+            ``"CANCELLED"`` or ``"COMPLETED"``. Jobs which have left the queue are
+            mapped to ``""``.
+
+        Raises
+        ------
+        subprocess.CalledProcessError
+            If the state of a job cannot be queried, for example because the Slurm
+            controller does not respond.
+        """
+        job_ids = list(job_ids)
+        if not job_ids:
+            return {}
+        proc = subprocess.run(
+            ["squeue", "-j", ",".join(map(str, job_ids)), "-o", "%i %T", "-h"],
+            capture_output=True,
+        )
+        if proc.returncode != 0:
+            # Some Slurm versions reject the whole query if any of the jobs has
+            # left the queue.
+            return {job_id: _SlurmWrapper._query_state(job_id) for job_id in job_ids}
+        states = dict.fromkeys(job_ids, "")
+        for line in proc.stdout.decode().splitlines():
+            job_id, _, state = line.strip().partition(" ")
+            if job_id.isdigit() and int(job_id) in states:
+                states[int(job_id)] = state.strip()
+        return states
+
+    @staticmethod
+    def _query_state(job_id: int) -> str:
+        args = ["squeue", "-j", f"{job_id}", "-o", "%T", "-h"]
+        proc = subprocess.run(args, capture_output=True)
+        if proc.returncode != 0:
+            if b"Invalid job id" in proc.stderr:
+                # The job has left the queue.
+                return ""
+            raise subprocess.CalledProcessError(
+                proc.returncode, args, proc.stdout, proc.stderr
+            )
+        return proc.stdout.decode().strip()
+
     @staticmethod
     def cancel(job_id: int) -> None:
         """Cancel a job.
@@ -162,6 +234,141 @@ class _SlurmWrapper:
         subprocess.run(["scancel", f"{job_id}"])
 
 
+_FINISHED_STATES = ("", "CANCELLED", "COMPLETED")
+
+
+class SlurmJobMonitor:
+    """Shared monitor of the states of Slurm jobs.
+
+    The states of all tracked jobs are queried together in one ``squeue`` call,
+    at most once per polling interval, and are served to every ``SlurmFuture``
+    from the monitor's cache. Jobs which have finished are no longer queried. If a
+    query fails, the previous states are kept and the query is retried after the
+    polling interval.
+    """
+
+    def __init__(self, interval: float | None = None):
+        """Initialize SlurmJobMonitor.
+
+        Parameters
+        ----------
+        interval : float, optional
+            Minimum time in seconds between two ``squeue`` calls. The default is
+            ``None``, in which case ``pyfluent.SLURM_JOB_MONITOR_INTERVAL`` is used.
+        """
+        self._interval = interval
+        self._states = {}
+        self._tracked = set()
+        self._last_refresh = None
+        self._error = None
+        self._lock = threading.Lock()
+        self._changed = threading.Condition()
+
+    @property
+    def interval(self) -> float:
+        """Minimum time in seconds between two ``squeue`` calls."""
+        if self._interval is None:
+            return pyfluent.SLURM_JOB_MONITOR_INTERVAL
+        return self._interval
+
+    @interval.setter
+    def interval(self, interval: float | None):
+        self._interval = interval
+
+    def track(self, job_id: int) -> None:
+        """Start tracking the state of a job."""
+        with self._lock:
+            self._tracked.add(job_id)
+            self._last_refresh = None
+
+    def get_state(self, job_id: int) -> str:
+        """Return the state of a job, querying Slurm if the cached state is stale.
+
+        Parameters
+        ----------
+        job_id : int
+            Job id.
+
+        Returns
+        -------
+        str
+            Any of ``""``, ``"PENDING"``, ``"RUNNING"``, ``"CANCELLED"`` or
+            ``"COMPLETED"``.
+
+        Raises
+        ------
+        subprocess.CalledProcessError
+            If the state of the job has never been queried successfully.
+        """
+        if job_id not in self._tracked and job_id not in self._states:
+            self.track(job_id)
+        self.refresh()
+        with self._lock:
+            if job_id in self._states:
+                return self._states[job_id]
+            if self._error is not None:
+                raise self._error
+            # The first query of the job is still running in another thread.
+            return "PENDING"
+
+    def refresh(self, force: bool = False) -> None:
+        """Query the states of all unfinished jobs in a single ``squeue`` call.
+
+        Parameters
+        ----------
+        force : bool, optional
+            Whether to query Slurm even if the polling interval has not elapsed.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if (
+                not force
+                and self._last_refresh is not None
+                and now - self._last_refresh < self.interval
+            ):
+                return
+            self._last_refresh = now
+            job_ids = sorted(self._tracked)
+        if not job_ids:
+            return
+        # squeue can be slow, so the other futures are not blocked while it runs.
+        try:
+            states = _SlurmWrapper.get_states(job_ids)
+        except subprocess.CalledProcessError as ex:
+            logger.warning(f"Failed to query the states of the Slurm jobs: {ex}")
+            with self._lock:
+                self._error = ex
+            return
+        with self._lock:
+            self._error = None
+            changed = False
+            for job_id, state in states.items():
+                changed = changed or self._states.get(job_id) != state
+                self._states[job_id] = state
+                if state in _FINISHED_STATES:
+                    self._tracked.discard(job_id)
+        if changed:
+            self.notify()
+
+    def notify(self) -> None:
+        """Wake up the threads waiting for a change."""
+        with self._changed:
+            self._changed.notify_all()
+
+    def wait_for_change(self, timeout: float | None = None) -> None:
+        """Wait until a job state changes, a launch completes or the timeout elapses."""
+        with self._changed:
+            self._changed.wait(timeout)
+
+
+_monitor = SlurmJobMonitor()
+
+
+def get_slurm_job_monitor() -> SlurmJobMonitor:
+    """Return the Slurm job monitor shared by all ``SlurmFuture`` instances."""
+    return _monitor
+
+
 class SlurmFuture:
     """Encapsulates asynchronous launch of Fluent within a Slurm environment.
 
@@ -169,10 +376,15 @@ class SlurmFuture:
     `future object <https://docs.python.org/3/library/asyncio-future.html#future-object>`_.
     """
 
-    def __init__(self, future: Future, job_id: int):
+    def __init__(
+        self, future: Future, job_id: int, monitor: SlurmJobMonitor | None = None
+    ):
         """Initialize SlurmFuture."""
         self._future = future
         self._job_id = job_id
+        self._monitor = monitor or get_slurm_job_monitor()
+        self._monitor.track(job_id)
+        self._future.add_done_callback(lambda _: self._monitor.notify())
 
     def __enter__(self):
         return self
@@ -181,10 +393,14 @@ class SlurmFuture:
         self.cancel()
 
     def _get_state(self) -> str:
-        return _SlurmWrapper.get_state(self._job_id)
+        return self._monitor.get_state(self._job_id)
 
     def _cancel(self):
         _SlurmWrapper.cancel(self._job_id)
+        self._monitor.track(self._job_id)
+
+    def _is_completed(self) -> bool:
+        return self._future.done() or self.done()
 
     def cancel(self, timeout: int = 60) -> bool:
         """Attempt to cancel the Fluent launch within timeout seconds.
@@ -220,7 +436,7 @@ class SlurmFuture:
     def done(self) -> bool:
         """Return ``True`` if the Fluent launch was successfully cancelled or Fluent was
         finished running, otherwise ``False``."""
-        return self._get_state() in ["", "CANCELLED", "COMPLETED"]
+        return self._get_state() in _FINISHED_STATES
 
     def result(
         self, timeout: int = None
@@ -279,6 +495,102 @@ class SlurmFuture:
         self._future.add_done_callback(fn)
 
 
+def as_completed(
+    fs: Iterable[SlurmFuture], timeout: float | None = None
+) -> Iterator[SlurmFuture]:
+    """Return an iterator over the futures which yields each future as soon as
+    Fluent is launched or the Slurm job is finished.
+
+    The states of the Slurm jobs are queried in a single ``squeue`` call per
+    polling interval of the shared Slurm job monitor.
+
+    Parameters
+    ----------
+    fs : Iterable[SlurmFuture]
+        Futures to wait for.
+    timeout : float, optional
+        Maximum time in seconds to wait. The default is ``None``, in which case
+        there is no limit to the wait time.
+
+    Yields
+    ------
+    SlurmFuture
+        Completed futures.
+
+    Raises
+    ------
+    TimeoutError
+        If all the futures are not completed within timeout seconds.
+    """
+    pending = list(dict.fromkeys(fs))
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while pending:
+        completed = [f for f in pending if f._is_completed()]
+        for f in completed:
+            pending.remove(f)
+            yield f
+        if not pending:
+            return
+        wait_time = min(f._monitor.interval for f in pending)
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"{len(pending)} (of {len(pending) + len(completed)}) futures unfinished."
+                )
+            wait_time = min(wait_time, remaining)
+        pending[0]._monitor.wait_for_change(wait_time)
+
+
+class DoneAndNotDoneFutures(NamedTuple):
+    """Sets of completed and uncompleted futures returned by :func:`wait`."""
+
+    done: set[SlurmFuture]
+    not_done: set[SlurmFuture]
+
+
+def wait(
+    fs: Iterable[SlurmFuture],
+    timeout: float | None = None,
+    return_when: str = ALL_COMPLETED,
+) -> DoneAndNotDoneFutures:
+    """Wait for the futures to complete, with the same semantics as
+    :func:`concurrent.futures.wait`.
+
+    Parameters
+    ----------
+    fs : Iterable[SlurmFuture]
+        Futures to wait for.
+    timeout : float, optional
+        Maximum time in seconds to wait. The default is ``None``, in which case
+        there is no limit to the wait time.
+    return_when : str, optional
+        Any of ``FIRST_COMPLETED``, ``FIRST_EXCEPTION`` or ``ALL_COMPLETED``. The
+        default is ``ALL_COMPLETED``.
+
+    Returns
+    -------
+    DoneAndNotDoneFutures
+        Named 2-tuple of sets of completed and uncompleted futures.
+    """
+    fs = set(fs)
+    done = set()
+    try:
+        for f in as_completed(fs, timeout=timeout):
+            done.add(f)
+            if return_when == FIRST_COMPLETED:
+                break
+            if (
+                return_when == FIRST_EXCEPTION
+                and f._future.done()
+                and f._future.exception() is not None
+            ):
+                break
+    except TimeoutError:
+        pass
+    return DoneAndNotDoneFutures(done, fs - done)
+
+
 class SlurmLauncher:
     """Instantiates Fluent session within a Slurm environment."""
 
@@ -310,6 +622,7 @@ class SlurmLauncher:
         start_watchdog: bool | None = None,
         scheduler_options: dict | None = None,
         file_transfer_service: Any | None = None,
+        channel_profile: ChannelProfile | None = None,
     ):
         """Launch Fluent session in standalone mode.
 
@@ -399,6 +712,8 @@ class SlurmLauncher:
             specified in a similar manner to Fluent's scheduler options.
         file_transfer_service : optional
             File transfer service for uploading and downloading files to and from the server.
+        channel_profile : ChannelProfile, optional
+            Keepalive, compression and default deadlines of the gRPC channel to Fluent.
 
         Returns
         -------
@@ -479,6 +794,7 @@ class SlurmLauncher:
             cleanup_on_exit=self._argvals["cleanup_on_exit"],
             start_transcript=self._argvals["start_transcript"],
             inside_container=False,
+            channel_profile=self._argvals["channel_profile"],
         )
         return session
 
@@ -42,6 +42,7 @@ from pathlib import Path
 import subprocess
 from typing import Any, Dict
 
+from ansys.fluent.core.fluent_connection import ChannelProfile
 from ansys.fluent.core.launcher.error_handler import (
     LaunchFluentError,
     _raise_non_gui_exception_in_windows,
@@ -105,6 +106,7 @@ class StandaloneLauncher:
         topy: str | list | None = None,
         start_watchdog: bool | None = None,
         file_transfer_service: Any | None = None,
+        channel_profile: ChannelProfile | None = None,
     ):
         """
         Launch a Fluent session in standalone mode.
@@ -173,6 +175,8 @@ class StandaloneLauncher:
             GUI-less Fluent sessions started by PyFluent are properly closed when the current Python process ends.
         file_transfer_service : Any
             Service for uploading/downloading files to/from the server.
+        channel_profile : ChannelProfile, optional
+            Keepalive, compression and default deadlines of the gRPC channel to Fluent.
 
         Raises
         ------
@@ -281,6 +285,7 @@ class StandaloneLauncher:
             session = self.new_session._create_from_server_info_file(
                 server_info_file_name=self._server_info_file_name,
                 file_transfer_service=self.file_transfer_service,
+                channel_profile=self.argvals["channel_profile"],
                 cleanup_on_exit=self.argvals["cleanup_on_exit"],
                 start_transcript=self.argvals["start_transcript"],
                 launcher_args=self.argvals,
@@ -27,10 +27,27 @@ variables like rpvars but instead through the high-level object-based
 interfaces: solver settings objects and task-based meshing workflow.
 """
 
-from typing import Any, List
+import copy
+from typing import Any, Dict, List
 
 import ansys.fluent.core.filereader.lispy as lispy
 from ansys.fluent.core.solver.error_message import allowed_name_error_message
+from ansys.fluent.core.streaming_services.events_streaming import (
+    MeshingEvent,
+    SolverEvent,
+)
+
+_RP_VARS_CHANGING_EVENTS = (
+    SolverEvent.ITERATION_ENDED,
+    SolverEvent.TIMESTEP_ENDED,
+    SolverEvent.CALCULATIONS_ENDED,
+    SolverEvent.DATA_LOADED,
+    SolverEvent.SOLUTION_INITIALIZED,
+    SolverEvent.CASE_LOADED,
+    SolverEvent.SETTINGS_CLEARED,
+    MeshingEvent.CASE_LOADED,
+    MeshingEvent.SETTINGS_CLEARED,
+)
 
 
 class RPVars:
@@ -38,9 +55,14 @@ class RPVars:
 
     _allowed_values = None
 
-    def __init__(self, eval_fn):
+    def __init__(self, eval_fn, events=None):
         """Initialize RPVars."""
         self._eval_fn = eval_fn
+        self._events = events
+        self._cache_enabled = False
+        self._cache = None
+        self._cache_generation = 0
+        self._cache_callback_ids = []
 
     def __call__(self, var: str | None = None, val: Any | None = None) -> Any:
         """Set or get a specific rpvar, or get the full rpvar state.
@@ -97,7 +119,107 @@ class RPVars:
             )
         return RPVars._allowed_values
 
-    def _get_var(self, var: str):
+    def get_vars(self, names: List[str]) -> Dict[str, Any]:
+        """Get the values of several rpvars in a single evaluation.
+
+        Parameters
+        ----------
+        names : List[str]
+            Names of the rpvars.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Values of the rpvars.
+
+        Examples
+        --------
+        >>> solver.rp_vars.get_vars(["number-of-iterations", "rp-lam?"])
+        {'number-of-iterations': 100, 'rp-lam?': False}
+        """
+        for var in names:
+            self._check_var(var)
+        if self._cache_enabled:
+            cache = self._get_cache()
+            if all(var in cache for var in names):
+                return {var: copy.deepcopy(cache[var]) for var in names}
+        if not names:
+            return {}
+        cmd = " ".join(f"(rpgetvar {RPVars._var(var)})" for var in names)
+        return dict(zip(names, self._execute(f"(list {cmd})")))
+
+    def set_vars(self, values: Dict[str, Any]) -> None:
+        """Set several rpvars in a single evaluation.
+
+        Parameters
+        ----------
+        values : Dict[str, Any]
+            Values of the rpvars keyed by their names.
+
+        Examples
+        --------
+        >>> solver.rp_vars.set_vars({"number-of-iterations": 100, "rp-lam?": True})
+        """
+        if not values:
+            return
+        cmd = " ".join(RPVars._set_var_cmd(var, val) for var, val in values.items())
+        try:
+            self._execute(f"(begin {cmd})")
+        finally:
+            self.clear_cache()
+
+    @property
+    def cache_enabled(self) -> bool:
+        """Whether reads are served from a local snapshot of the rpvars."""
+        return self._cache_enabled
+
+    def enable_cache(self) -> None:
+        """Serve reads from a local snapshot of all the rpvars.
+
+        The snapshot is fetched in a single evaluation by the first read. It is
+        discarded when rpvars are set through this object, and when the solver
+        completes an iteration, a time step or a calculation, loads a case or data,
+        initializes the solution or clears the settings. Call ``clear_cache()``
+        after rpvars are changed by other means, for example by TUI commands or
+        settings objects.
+        """
+        self._cache_enabled = True
+        if self._events is not None and not self._cache_callback_ids:
+            self._register_cache_callbacks()
+
+    def disable_cache(self) -> None:
+        """Disable the local snapshot of the rpvars."""
+        self._cache_enabled = False
+        self.clear_cache()
+        for callback_id in self._cache_callback_ids:
+            self._events.unregister_callback(callback_id)
+        self._cache_callback_ids = []
+
+    def clear_cache(self) -> None:
+        """Discard the local snapshot of the rpvars."""
+        self._cache_generation += 1
+        self._cache = None
+
+    def _register_cache_callbacks(self) -> None:
+        # Iteration and time step callbacks pause the solver until they are
+        # processed, so they are only registered while the cache is enabled.
+        self._cache_callback_ids.extend(
+            self._events.register_weak_callback(
+                _RP_VARS_CHANGING_EVENTS, self.clear_cache
+            )
+        )
+
+    def _get_cache(self) -> Dict[str, Any]:
+        cache = self._cache
+        if cache is None:
+            generation = self._cache_generation
+            cache = self._fetch_vars()
+            # Do not keep a snapshot which was fetched across a change.
+            if self._cache_enabled and generation == self._cache_generation:
+                self._cache = cache
+        return cache
+
+    def _check_var(self, var: str) -> None:
         if var not in self.allowed_values():
             raise RuntimeError(
                 allowed_name_error_message(
@@ -107,17 +229,35 @@ class RPVars:
                 )
             )
 
+    def _get_var(self, var: str):
+        self._check_var(var)
+        if self._cache_enabled:
+            cache = self._get_cache()
+            if var in cache:
+                return copy.deepcopy(cache[var])
+
         cmd = f"(rpgetvar {RPVars._var(var)})"
         return self._execute(cmd)
 
     def _get_vars(self):
+        if self._cache_enabled:
+            return copy.deepcopy(self._get_cache())
+        return self._fetch_vars()
+
+    def _fetch_vars(self):
         list_val = self._execute("(cx-send 'rp-variables)")
         return {val[0]: val[1] for val in list_val}
 
     def _set_var(self, var: str, val):
+        try:
+            return self._execute(RPVars._set_var_cmd(var, val))
+        finally:
+            self.clear_cache()
+
+    @staticmethod
+    def _set_var_cmd(var: str, val) -> str:
         prefix = "'" if isinstance(val, (list, tuple)) else ""
-        cmd = f"(rpsetvar {RPVars._var(var)} {prefix}{lispy.to_string(val)})"
-        return self._execute(cmd)
+        return f"(rpsetvar {RPVars._var(var)} {prefix}{lispy.to_string(val)})"
 
     def _execute(self, cmd: str):
         scheme_val = self._eval_fn(cmd)
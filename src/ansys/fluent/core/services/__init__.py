@@ -22,45 +22,47 @@
 
 """Provides a module to create gRPC services."""
 
-from ansys.fluent.core.services.app_utilities import AppUtilities
-from ansys.fluent.core.services.batch_ops import BatchOpsService
-from ansys.fluent.core.services.datamodel_se import (
-    DatamodelService as DatamodelService_SE,
-)
-from ansys.fluent.core.services.datamodel_tui import (
-    DatamodelService as DatamodelService_TUI,
-)
-from ansys.fluent.core.services.deprecated_field_data import DeprecatedFieldData
-from ansys.fluent.core.services.events import EventsService
-from ansys.fluent.core.services.field_data import LiveFieldData, _FieldInfo
-from ansys.fluent.core.services.health_check import HealthCheckService
-from ansys.fluent.core.services.monitor import MonitorsService
-from ansys.fluent.core.services.reduction import Reduction
-from ansys.fluent.core.services.scheme_eval import SchemeEval
-from ansys.fluent.core.services.settings import SettingsService
-from ansys.fluent.core.services.solution_variables import (
-    SolutionVariableData,
-    SolutionVariableService,
-)
-from ansys.fluent.core.services.transcript import TranscriptService
+from ansys.fluent.core.utils import lazy_module_attrs
+
+# The service modules are imported on first use as they pull in the gRPC stubs.
+_LAZY_ATTRS = {
+    "AppUtilities": f"{__name__}.app_utilities",
+    "BatchOpsService": f"{__name__}.batch_ops",
+    "DatamodelService_SE": (f"{__name__}.datamodel_se", "DatamodelService"),
+    "DatamodelService_TUI": (f"{__name__}.datamodel_tui", "DatamodelService"),
+    "DeprecatedFieldData": f"{__name__}.deprecated_field_data",
+    "EventsService": f"{__name__}.events",
+    "LiveFieldData": f"{__name__}.field_data",
+    "_FieldInfo": f"{__name__}.field_data",
+    "HealthCheckService": f"{__name__}.health_check",
+    "MonitorsService": f"{__name__}.monitor",
+    "Reduction": f"{__name__}.reduction",
+    "SchemeEval": f"{__name__}.scheme_eval",
+    "SettingsService": f"{__name__}.settings",
+    "SolutionVariableData": f"{__name__}.solution_variables",
+    "SolutionVariableService": f"{__name__}.solution_variables",
+    "TranscriptService": f"{__name__}.transcript",
+}
+
+__getattr__, __dir__ = lazy_module_attrs(globals(), _LAZY_ATTRS)
 
 _service_cls_by_name = {
-    "app_utilities": AppUtilities,
-    "health_check": HealthCheckService,
-    "datamodel": DatamodelService_SE,
-    "tui": DatamodelService_TUI,
-    "settings": SettingsService,
-    "scheme_eval": SchemeEval,
-    "events": EventsService,
-    "field_data": LiveFieldData,
-    "field_data_old": DeprecatedFieldData,
-    "field_info": _FieldInfo,
-    "monitors": MonitorsService,
-    "reduction": Reduction,
-    "svar": SolutionVariableService,
-    "svar_data": SolutionVariableData,
-    "transcript": TranscriptService,
-    "batch_ops": BatchOpsService,
+    "app_utilities": "AppUtilities",
+    "health_check": "HealthCheckService",
+    "datamodel": "DatamodelService_SE",
+    "tui": "DatamodelService_TUI",
+    "settings": "SettingsService",
+    "scheme_eval": "SchemeEval",
+    "events": "EventsService",
+    "field_data": "LiveFieldData",
+    "field_data_old": "DeprecatedFieldData",
+    "field_info": "_FieldInfo",
+    "monitors": "MonitorsService",
+    "reduction": "Reduction",
+    "svar": "SolutionVariableService",
+    "svar_data": "SolutionVariableData",
+    "transcript": "TranscriptService",
+    "batch_ops": "BatchOpsService",
 }
 
 
@@ -69,7 +71,7 @@ class service_creator:
 
     def __init__(self, service_name: str):
         """Initialize service_creator."""
-        self._service_cls = _service_cls_by_name[service_name]
+        self._service_cls = __getattr__(_service_cls_by_name[service_name])
 
     def create(self, *args, **kwargs):
         """Create a gRPC service."""
@@ -51,7 +51,7 @@ class AppUtilitiesService:
             GrpcErrorInterceptor(),
             ErrorStateInterceptor(fluent_error_state),
             TracingInterceptor(),
-            BatchInterceptor(),
+            BatchInterceptor(channel),
         )
         self._stub = AppUtilitiesGrpcModule.AppUtilitiesStub(intercept_channel)
         self._metadata = metadata
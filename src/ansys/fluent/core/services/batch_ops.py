@@ -22,9 +22,10 @@
 
 """Batch RPC service."""
 
+from concurrent.futures import Future, ThreadPoolExecutor
+import functools
 import inspect
 import logging
-from types import ModuleType
 from typing import TypeVar
 import weakref
 
@@ -39,6 +40,39 @@ _TBatchOps = TypeVar("_TBatchOps", bound="BatchOps")
 network_logger: logging.Logger = logging.getLogger("pyfluent.networking")
 
 
+@functools.cache
+def _get_batchable_methods() -> dict[tuple[str, str, str], type[Message] | None]:
+    """Get the response classes of the gRPC methods which can be batched.
+
+    The index is keyed by package, service and method names and is built once from
+    the generated proto modules.
+    """
+    methods = {}
+    proto_files = [
+        x[1]
+        for x in inspect.getmembers(api, inspect.ismodule)
+        if hasattr(x[1], "DESCRIPTOR")
+    ]
+    for file in proto_files:
+        file_desc = file.DESCRIPTOR
+        for service_desc in file_desc.services_by_name.values():
+            for method_desc in service_desc.methods_by_name.values():
+                method = method_desc.name
+                key = (file_desc.package, service_desc.name, method)
+                # TODO Add custom option in .proto files to identify getters
+                if (
+                    method.startswith("Get")
+                    or method.startswith("get")
+                    or method_desc.client_streaming
+                    or method_desc.server_streaming
+                    or methods.get(key)
+                ):
+                    continue
+                # TODO Get the response_cls from message_factory
+                methods[key] = getattr(file, method_desc.output_type.name, None)
+    return methods
+
+
 class BatchOpsService:
     """Class wrapping methods in batch RPC service."""
 
@@ -88,16 +122,24 @@ class BatchOps:
 
     will throw a ``KeyError`` as ``solver.results.graphics.mesh["mesh-1"]`` attempts to
     access the ``mesh-1`` mesh object which has not been created yet.
+
+    Each session has its own batch context, so operations on other sessions are
+    not queued. For long sequences of operations, ``flush_size`` sends the queued
+    operations in the background while later operations are being queued:
+
+    >>> with pyfluent.BatchOps(solver, flush_size=100):
+    >>>     for i in range(1000):
+    >>>         solver.results.graphics.mesh[f"mesh-{i}"] = {}
     """
 
-    _proto_files: list[ModuleType] | None = None
+    _instances = weakref.WeakValueDictionary()
 
     def _instance():
         return None
 
     @classmethod
     def instance(cls) -> _TBatchOps | None:
-        """Get the BatchOps instance.
+        """Get the most recently created BatchOps instance.
 
         Returns
         -------
@@ -106,6 +148,13 @@ class BatchOps:
         """
         return cls._instance()
 
+    @classmethod
+    def _get_active(cls, channel: grpc.Channel | None = None) -> _TBatchOps | None:
+        """Get the BatchOps instance which is batching the calls on the channel."""
+        batch_ops = cls._instances.get(id(channel)) if channel else cls.instance()
+        if batch_ops and batch_ops.batching:
+            return batch_ops
+
     class Op:
         """Class to create a single batch operation."""
 
@@ -119,44 +168,11 @@ class BatchOps:
                 method=method,
                 request_body=request_body,
             )
-            if not BatchOps._proto_files:
-                BatchOps._proto_files = [
-                    x[1]
-                    for x in inspect.getmembers(api, inspect.ismodule)
-                    if hasattr(x[1], "DESCRIPTOR")
-                ]
-            self._supported = False
-            self.response_cls = None
-            for file in BatchOps._proto_files:
-                file_desc = file.DESCRIPTOR
-                if file_desc.package == package:
-                    service_desc = file_desc.services_by_name.get(service)
-                    if service_desc:
-                        # TODO Add custom option in .proto files to identify getters
-                        if not method.startswith("Get") and not method.startswith(
-                            "get"
-                        ):
-                            method_desc = service_desc.methods_by_name.get(method)
-                            if (
-                                method_desc
-                                and not method_desc.client_streaming
-                                and not method_desc.server_streaming
-                            ):
-                                self._supported = True
-                                response_cls_name = method_desc.output_type.name
-                                # TODO Get the response_cls from message_factory
-                                try:
-                                    self.response_cls = getattr(file, response_cls_name)
-                                    break
-                                except AttributeError:
-                                    pass
+            methods = _get_batchable_methods()
+            key = (package, service, method)
+            self._supported = key in methods
+            self.response_cls = methods.get(key)
             if self._supported:
-                self._request = batch_ops_pb2.ExecuteRequest(
-                    package=package,
-                    service=service,
-                    method=method,
-                    request_body=request_body,
-                )
                 self._status = None
                 self._result = None
             self.queued = False
@@ -171,18 +187,42 @@ class BatchOps:
             self._status = status
             self._result = obj
 
-    def __new__(cls, session) -> _TBatchOps:
-        if cls.instance() is None:
+    def __new__(cls, session, flush_size: int | None = None) -> _TBatchOps:
+        channel = session._fluent_connection._channel
+        instance = cls._instances.get(id(channel))
+        if instance is None:
             instance = super(BatchOps, cls).__new__(cls)
+            instance._channel = channel
             instance._service: BatchOpsService = session._batch_ops_service
+            instance._settings_service = getattr(session, "_settings_service", None)
             instance._ops: list[BatchOps.Op] = []
+            instance._executor = None
+            instance._flushes: list[Future] = []
             instance.batching = False
-            cls._instance = weakref.ref(instance)
-        return cls.instance()
+            cls._instances[id(channel)] = instance
+        cls._instance = weakref.ref(instance)
+        return instance
+
+    def __init__(self, session, flush_size: int | None = None) -> None:
+        """Create the batch context of the session.
+
+        Parameters
+        ----------
+        session : BaseSession
+            Session whose operations are batched. Each session has a single batch
+            context.
+        flush_size : int, optional
+            If specified, the queued operations are sent to Fluent in batches of
+            this size while further operations are queued. Otherwise, all the
+            operations are sent when exiting the ``with`` block.
+        """
+        if not self.batching:
+            self.flush_size = flush_size
 
     def __enter__(self) -> _TBatchOps:
         """Entering the with block."""
         self.clear_ops()
+        self._flushes = []
         self.batching = True
         return self
 
@@ -190,11 +230,53 @@ class BatchOps:
         """Exiting from the with block."""
         network_logger.debug("Executing batch operations")
         self.batching = False
-        if not exc_type:
-            requests = (x._request for x in self._ops)
-            responses = self._service.execute(requests)
-            for i, response in enumerate(responses):
-                self._ops[i].update_result(response.status, response.response_body)
+        try:
+            if not exc_type:
+                self._flush()
+            for flush in self._flushes:
+                if not exc_type:
+                    flush.result()
+                elif flush.exception() is not None:
+                    # Do not hide the exception raised within the with block.
+                    network_logger.error(
+                        f"Batch operations failed: {flush.exception()}"
+                    )
+        finally:
+            self._flushes = []
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            if self._settings_service is not None:
+                from ansys.fluent.core.solver import flobject
+
+                # The batched operations may have changed any settings.
+                flobject._get_settings_change_tracker(
+                    self._settings_service
+                ).all_changed()
+
+    def _flush(self) -> None:
+        ops, self._ops = self._ops, []
+        if not ops:
+            return
+        if not self.flush_size:
+            self._execute(ops)
+            return
+        if self._executor is None:
+            # A single worker preserves the order of the batches.
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="pyfluent-batch-ops"
+            )
+        previous = self._flushes[-1] if self._flushes else None
+        self._flushes.append(self._executor.submit(self._execute, ops, previous))
+
+    def _execute(self, ops: list[Op], previous: Future | None = None) -> None:
+        if previous is not None and previous.exception() is not None:
+            # Do not execute the later operations if a batch has failed.
+            return
+        network_logger.debug(f"Sending {len(ops)} batch operations")
+        responses = self._service.execute(x._request for x in ops)
+        for op, response in zip(ops, responses):
+            op.update_result(response.status, response.response_body)
 
     def add_op(self, package: str, service: str, method: str, request: Message) -> Op:
         """Queue a single batch operation. Only the non-getter operations will be
@@ -224,6 +306,8 @@ class BatchOps:
             )
             self._ops.append(op)
             op.queued = True
+            if self.flush_size and len(self._ops) >= self.flush_size:
+                self._flush()
         return op
 
     def clear_ops(self) -> None:
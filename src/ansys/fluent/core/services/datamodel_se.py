@@ -192,7 +192,7 @@ class DatamodelServiceImpl:
             GrpcErrorInterceptor(),
             ErrorStateInterceptor(fluent_error_state),
             TracingInterceptor(),
-            BatchInterceptor(),
+            BatchInterceptor(channel),
         )
         self._stub = DataModelGrpcModule.DataModelStub(intercept_channel)
         self._metadata = metadata
@@ -22,6 +22,7 @@
 
 """Wrappers over TUI-based datamodel gRPC service of Fluent."""
 
+from concurrent.futures import ThreadPoolExecutor
 import keyword
 import logging
 from typing import Any
@@ -44,6 +45,10 @@ Path = list[str]
 
 logger: logging.Logger = logging.getLogger("pyfluent.tui")
 
+# Maximum number of concurrent queries while collecting the static info of the TUI
+# from the individual menus.
+_STATIC_INFO_MAX_WORKERS = 16
+
 
 class DatamodelServiceImpl:
     """Class wrapping the TUI-based datamodel gRPC service of Fluent."""
@@ -59,7 +64,7 @@ class DatamodelServiceImpl:
             GrpcErrorInterceptor(),
             ErrorStateInterceptor(self._fluent_error_state),
             TracingInterceptor(),
-            BatchInterceptor(),
+            BatchInterceptor(self._channel),
         )
         self._stub = DataModelGrpcModule.DataModelStub(intercept_channel)
         self._metadata = metadata
@@ -154,6 +159,11 @@ class DatamodelService:
         self._impl = DatamodelServiceImpl(channel, metadata, fluent_error_state)
         self._app_utilities = app_utilities
         self._scheme_eval = scheme_eval
+        self._static_info = None
+        self._child_names = {}
+        self._child_names_generation = 0
+        # Called after every command.
+        self._command_callbacks = []
 
     def get_attribute_value(
         self, path: str, attribute: str, include_unavailable: bool
@@ -176,7 +186,13 @@ class DatamodelService:
                 _convert_value_to_gvalue(v, request.args.fields[k])
         else:
             _convert_value_to_gvalue(args, request.args.fields["tui_args"])
-        return self._impl.execute_command(request)
+        try:
+            return self._impl.execute_command(request)
+        finally:
+            # Commands can add or remove runtime menus.
+            self.clear_cache()
+            for callback in self._command_callbacks:
+                callback()
 
     def execute_query(self, path: str, *args, **kwargs) -> Any:
         """Execute the query."""
@@ -197,6 +213,70 @@ class DatamodelService:
         # Note: MessageToDict's parameter names are different in different protobuf versions
         return MessageToDict(response.info, True)
 
+    def get_static_menu_info(self, path: Path) -> dict[str, Any] | None:
+        """Get the static info of a menu from the static info of the whole TUI.
+
+        The static info of the whole TUI is fetched once per session.
+
+        Parameters
+        ----------
+        path : Path
+            Path of the menu as a list of TUI menu names.
+
+        Returns
+        -------
+        dict[str, Any] | None
+            Static info of the menu, or ``None`` if the menu is not in the static
+            info, for example a menu created at runtime.
+        """
+        if self._static_info is None:
+            try:
+                self._static_info = self.get_static_info("")
+            except RuntimeError:
+                self._static_info = {}
+        info = self._static_info
+        for name in path:
+            info = info.get("menus", {}).get(name)
+            if info is None:
+                return None
+        return info
+
+    def get_child_names(self, path: str) -> list[str]:
+        """Get the names of the available child menus of a menu.
+
+        The names are cached until ``clear_cache()`` is called, which happens after
+        every TUI command and when the session reports that a case or data is
+        loaded, the solution is initialized or the settings are cleared.
+
+        Parameters
+        ----------
+        path : str
+            gRPC path of the menu.
+
+        Returns
+        -------
+        list[str]
+            Names of the available child menus.
+        """
+        try:
+            return self._child_names[path]
+        except KeyError:
+            pass
+        generation = self._child_names_generation
+        attribute = DataModelProtoModule.Attribute.Name(
+            DataModelProtoModule.Attribute.CHILD_NAMES
+        ).lower()
+        child_names = self.get_attribute_value(path, attribute, False)
+        # Do not keep names which were fetched across a change.
+        if generation == self._child_names_generation:
+            self._child_names[path] = child_names
+        return child_names
+
+    def clear_cache(self) -> None:
+        """Discard the cached names of the available child menus."""
+        self._child_names_generation += 1
+        self._child_names = {}
+
 
 class PyMenu:
     """Pythonic wrapper of TUI-based DatamodelService class. Use this class instead of
@@ -300,29 +380,54 @@ class PyMenu:
             return _get_static_info_at_level(self)
 
 
-def _get_static_info_at_level(menu: PyMenu) -> dict[str, Any]:
-    info = {}
-    info["help"] = menu.get_doc_string(include_unavailable=True)
-    info["menus"] = {}
-    info["commands"] = {}
-    child_names = menu.get_child_names(include_unavailable=True)
-    if child_names:
-        for child_name in child_names:
-            if child_name:
-                child_menu = PyMenu(
-                    menu._service,
-                    menu._version,
-                    menu._mode,
-                    menu._path + ("" if menu._path.endswith("/") else "/") + child_name,
-                )
-                child_info = _get_static_info_at_level(child_menu)
-                if child_info.pop("is_command", False):
-                    info["commands"][child_name] = child_info
-                else:
-                    info["menus"][child_name] = child_info
-    else:
-        info["is_command"] = True
-    return info
+def _get_static_info_at_level(
+    menu: PyMenu, max_workers: int | None = None
+) -> dict[str, Any]:
+    """Get the static info of a menu from the help strings and child names of the
+    menu and of all its descendants.
+
+    This is used when Fluent cannot provide the static info in a single request.
+    The menus are queried level by level, with the queries of a level, like the
+    top-level menus, sent concurrently.
+    """
+
+    def query(path):
+        child_menu = PyMenu(menu._service, menu._version, menu._mode, path)
+        return (
+            child_menu.get_doc_string(include_unavailable=True),
+            child_menu.get_child_names(include_unavailable=True),
+        )
+
+    root_info = {}
+    # Each entry holds the path, the info dict and the parent info dict of a node.
+    level = [(menu._path, root_info, None)]
+    with ThreadPoolExecutor(
+        max_workers=max_workers or _STATIC_INFO_MAX_WORKERS,
+        thread_name_prefix="pyfluent-tui-static-info",
+    ) as executor:
+        while level:
+            next_level = []
+            results = executor.map(query, [path for path, _, _ in level])
+            for (path, info, parent_info), (help_string, child_names) in zip(
+                level, results
+            ):
+                info["help"] = help_string
+                info["menus"] = {}
+                info["commands"] = {}
+                if parent_info is not None:
+                    child_name = path.rsplit("/", 1)[-1]
+                    key = "menus" if child_names else "commands"
+                    parent_info[key][child_name] = info
+                elif not child_names:
+                    info["is_command"] = True
+                for child_name in child_names or []:
+                    if child_name:
+                        child_path = (
+                            path + ("" if path.endswith("/") else "/") + child_name
+                        )
+                        next_level.append((child_path, {}, info))
+            level = next_level
+    return root_info
 
 
 class TUIMethod:
@@ -343,6 +448,17 @@ class TUIMethod:
             *args, **kwargs
         )
 
+    def __getattr__(self, name: str) -> Any:
+        # Some runtime submenus are generated as methods during codegen. They are
+        # resolved as menus only when their children are accessed.
+        if name.startswith("_"):
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{name}'"
+            )
+        return getattr(
+            TUIMenu(self._service, self._version, self._mode, self._path), name
+        )
+
 
 class TUIMenu:
     """Base class for the generated menu classes."""
@@ -357,39 +473,50 @@ class TUIMenu:
     def __dir__(self) -> list[str]:
         return [
             convert_tui_menu_to_func_name(x)
-            for x in PyMenu(
-                self._service, self._version, self._mode, self._path
-            ).get_child_names()
+            for x in self._service.get_child_names(
+                convert_path_to_grpc_path(self._path)
+            )
             if x not in ["exit", "switch_to_meshing_mode"]
         ]
 
+    def _get_static_child(self, name: str) -> tuple[str, bool] | None:
+        """Get the TUI name of a child in the static info and whether it is a
+        menu."""
+        info = self._service.get_static_menu_info(self._path)
+        if info:
+            for is_menu, children in (
+                (True, info.get("menus", {})),
+                (False, info.get("commands", {})),
+            ):
+                for tui_name in children:
+                    if convert_tui_menu_to_func_name(tui_name) == name:
+                        return tui_name, is_menu
+
     def __getattribute__(self, name) -> Any:
         if name in ["exit"] and not self._path:
             raise AttributeError(
                 f"'{self.__class__.__name__}' object has no attribute '{name}'"
             )
         try:
-            attr = super().__getattribute__(name)
-            if isinstance(attr, TUIMethod):
-                # some runtime submenus are generated as methods during codegen
-                path = self._path + [name]
-                if PyMenu(
-                    self._service, self._version, self._mode, path
-                ).get_child_names():
-                    return TUIMenu(self._service, self._version, self._mode, path)
-            return attr
+            return super().__getattribute__(name)
         except AttributeError as ex:
-            if name in dir(self):
-                # for runtime submenus and commands which are not available during codegen
-                path = self._path + [name]
-                if PyMenu(
-                    self._service, self._version, self._mode, path
-                ).get_child_names():
+            if name.startswith("_"):
+                raise ex
+            # for menus and commands which are not available during codegen
+            static_child = self._get_static_child(name)
+            if static_child:
+                tui_name, is_menu = static_child
+                path = self._path + [tui_name]
+                if is_menu:
                     return TUIMenu(self._service, self._version, self._mode, path)
-                else:
-                    return TUICommand(self._service, self._version, self._mode, path)
+            elif name in dir(self):
+                path = self._path + [name]
             else:
                 raise ex
+            # Runtime submenus are reported as commands in the static info.
+            if self._service.get_child_names(convert_path_to_grpc_path(path)):
+                return TUIMenu(self._service, self._version, self._mode, path)
+            return TUICommand(self._service, self._version, self._mode, path)
 
 
 class TUICommand(TUIMenu):
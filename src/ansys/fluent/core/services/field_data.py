@@ -21,19 +21,22 @@
 # SOFTWARE.
 
 """Wrappers over FieldData gRPC service of Fluent."""
+from collections import OrderedDict
 from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum
 from functools import reduce
 import logging
+import threading
 import time
-from typing import Callable, Dict, List, Tuple
+from typing import Awaitable, Callable, Dict, List, Tuple
 import warnings
 import weakref
 
 from deprecated.sphinx import deprecated
 import grpc
 import numpy as np
+import numpy.typing as npt
 
 from ansys.api.fluent.v0 import field_data_pb2 as FieldDataProtoModule
 from ansys.api.fluent.v0 import field_data_pb2_grpc as FieldGrpcModule
@@ -66,8 +69,13 @@ from ansys.fluent.core.services.interceptors import (
     ErrorStateInterceptor,
     GrpcErrorInterceptor,
     TracingInterceptor,
+    _get_python_exception,
 )
 from ansys.fluent.core.services.streaming import StreamingService
+from ansys.fluent.core.streaming_services.events_streaming import (
+    MeshingEvent,
+    SolverEvent,
+)
 from ansys.fluent.core.utils.deprecate import all_deprecators
 
 logger = logging.getLogger("pyfluent.field_data")
@@ -85,20 +93,39 @@ class FieldDataService(StreamingService):
     """FieldData service of Fluent."""
 
     def __init__(
-        self, channel: grpc.Channel, metadata: List[Tuple[str, str]], fluent_error_state
+        self,
+        channel: grpc.Channel,
+        metadata: List[Tuple[str, str]],
+        fluent_error_state,
+        create_aio_service: Callable[[], "AsyncFieldDataService"] | None = None,
     ):
         """__init__ method of FieldDataService class."""
+        self._create_aio_service = create_aio_service
         intercept_channel = grpc.intercept_channel(
             channel,
             GrpcErrorInterceptor(),
             ErrorStateInterceptor(fluent_error_state),
             TracingInterceptor(),
-            BatchInterceptor(),
+            BatchInterceptor(channel),
         )
         super().__init__(
             stub=FieldGrpcModule.FieldDataStub(intercept_channel), metadata=metadata
         )
 
+    @property
+    def aio(self) -> "AsyncFieldDataService":
+        """FieldData service of the running asyncio event loop.
+
+        Raises
+        ------
+        RuntimeError
+            If the asyncio API is not available for the session or if there is no
+            running event loop.
+        """
+        if self._create_aio_service is None:
+            raise RuntimeError("The asyncio API is not available for this session.")
+        return self._create_aio_service()
+
     def get_scalar_field_range(self, request):
         """GetRange RPC of FieldData service."""
         return self._stub.GetRange(request, metadata=self._metadata)
@@ -163,6 +190,52 @@ class FieldDataService(StreamingService):
         return elementss
 
 
+class AsyncFieldDataService:
+    """FieldData service of Fluent for asyncio code.
+
+    The channel must be an asyncio channel created by ``FluentConnection``.
+    """
+
+    def __init__(self, channel: grpc.aio.Channel, metadata: List[Tuple[str, str]]):
+        """__init__ method of AsyncFieldDataService class."""
+        self._stub = FieldGrpcModule.FieldDataStub(channel)
+        self._metadata = metadata
+
+    async def get_scalar_fields_info(self, request):
+        """GetFieldsInfo RPC of FieldData service."""
+        return await self._stub.GetFieldsInfo(request, metadata=self._metadata)
+
+    async def get_vector_fields_info(self, request):
+        """GetVectorFieldsInfo RPC of FieldData service."""
+        return await self._stub.GetVectorFieldsInfo(request, metadata=self._metadata)
+
+    async def get_surfaces_info(self, request):
+        """GetSurfacesInfo RPC of FieldData service."""
+        return await self._stub.GetSurfacesInfo(request, metadata=self._metadata)
+
+    async def get_fields(self, request) -> list:
+        """GetFields RPC of FieldData service.
+
+        The chunks are received without blocking the event loop and can be parsed
+        with ``ChunkParser``.
+
+        Raises
+        ------
+        RuntimeError
+            If the RPC fails or if no chunk is received.
+        """
+        call = self._stub.GetFields(request, metadata=self._metadata)
+        try:
+            chunks = [chunk async for chunk in call]
+        except grpc.aio.AioRpcError as ex:
+            raise _get_python_exception(ex, ex) from None
+        if not chunks:
+            raise RuntimeError(
+                "Unexpectedly encountered empty chunk during field extraction."
+            )
+        return chunks
+
+
 class _FieldInfo(BaseFieldInfo):
     def __init__(
         self,
@@ -172,6 +245,30 @@ class _FieldInfo(BaseFieldInfo):
         """__init__ method of FieldInfo class."""
         self._service = service
         self._is_data_valid = is_data_valid
+        self._cache = {}
+
+    def clear_cache(self) -> None:
+        """Clear the cached surfaces, scalar fields and vector fields information.
+
+        The cache is cleared automatically on case-loaded, data-loaded,
+        solution-initialized and settings-cleared events, and when a surface or
+        field name is not found in the cached information.
+        """
+        self._cache = {}
+
+    def _get_cached(self, key: str, fetch: Callable[[], Dict]) -> Dict:
+        info = self._cache.get(key)
+        if info is None:
+            info = self._cache[key] = fetch()
+        return info
+
+    async def _get_cached_async(
+        self, key: str, fetch: Callable[[], Awaitable[Dict]]
+    ) -> Dict:
+        info = self._cache.get(key)
+        if info is None:
+            info = self._cache[key] = await fetch()
+        return info
 
     def get_scalar_field_range(
         self, field: str, node_value: bool = False, surface_ids: List[int] = None
@@ -226,8 +323,25 @@ class _FieldInfo(BaseFieldInfo):
         return self._get_scalar_fields_info()
 
     def _get_scalar_fields_info(self) -> Dict[str, Dict]:
+        return self._get_cached("scalar_fields", self._fetch_scalar_fields_info)
+
+    def _fetch_scalar_fields_info(self) -> Dict[str, Dict]:
         request = FieldDataProtoModule.GetFieldsInfoRequest()
-        response = self._service.get_scalar_fields_info(request)
+        return self._parse_scalar_fields_info(
+            self._service.get_scalar_fields_info(request)
+        )
+
+    async def _get_scalar_fields_info_async(self) -> Dict[str, Dict]:
+        async def fetch():
+            request = FieldDataProtoModule.GetFieldsInfoRequest()
+            return self._parse_scalar_fields_info(
+                await self._service.aio.get_scalar_fields_info(request)
+            )
+
+        return await self._get_cached_async("scalar_fields", fetch)
+
+    @staticmethod
+    def _parse_scalar_fields_info(response) -> Dict[str, Dict]:
         return {
             field_info.solverName: {
                 "display_name": field_info.displayName,
@@ -253,8 +367,25 @@ class _FieldInfo(BaseFieldInfo):
         return self._get_vector_fields_info()
 
     def _get_vector_fields_info(self) -> Dict[str, Dict]:
+        return self._get_cached("vector_fields", self._fetch_vector_fields_info)
+
+    def _fetch_vector_fields_info(self) -> Dict[str, Dict]:
         request = FieldDataProtoModule.GetVectorFieldsInfoRequest()
-        response = self._service.get_vector_fields_info(request)
+        return self._parse_vector_fields_info(
+            self._service.get_vector_fields_info(request)
+        )
+
+    async def _get_vector_fields_info_async(self) -> Dict[str, Dict]:
+        async def fetch():
+            request = FieldDataProtoModule.GetVectorFieldsInfoRequest()
+            return self._parse_vector_fields_info(
+                await self._service.aio.get_vector_fields_info(request)
+            )
+
+        return await self._get_cached_async("vector_fields", fetch)
+
+    @staticmethod
+    def _parse_vector_fields_info(response) -> Dict[str, Dict]:
         return {
             vector_field_info.displayName: {
                 "x-component": vector_field_info.xComponent,
@@ -279,8 +410,23 @@ class _FieldInfo(BaseFieldInfo):
         return self._get_surfaces_info()
 
     def _get_surfaces_info(self) -> Dict[str, Dict]:
+        return self._get_cached("surfaces", self._fetch_surfaces_info)
+
+    def _fetch_surfaces_info(self) -> Dict[str, Dict]:
         request = FieldDataProtoModule.GetSurfacesInfoResponse()
-        response = self._service.get_surfaces_info(request)
+        return self._parse_surfaces_info(self._service.get_surfaces_info(request))
+
+    async def _get_surfaces_info_async(self) -> Dict[str, Dict]:
+        async def fetch():
+            request = FieldDataProtoModule.GetSurfacesInfoResponse()
+            return self._parse_surfaces_info(
+                await self._service.aio.get_surfaces_info(request)
+            )
+
+        return await self._get_cached_async("surfaces", fetch)
+
+    @staticmethod
+    def _parse_surfaces_info(response) -> Dict[str, Dict]:
         info = {
             surface_info.surfaceName: {
                 "surface_id": [surf.id for surf in surface_info.surfaceId],
@@ -524,6 +670,10 @@ class BaseFieldData:
             kwargs.get("surfaces"),
             self.get_surface_ids(kwargs.get("surfaces")),
             scalar_field_data,
+            node_value=kwargs.get("node_value"),
+            dtype=kwargs.get("dtype"),
+            stride=kwargs.get("stride"),
+            target_count=kwargs.get("target_count"),
         )
 
     def _get_surface_data(
@@ -537,6 +687,10 @@ class BaseFieldData:
             self.get_surface_ids(kwargs.get("surfaces")),
             surface_data,
             flatten_connectivity=kwargs.get("flatten_connectivity"),
+            csr_connectivity=kwargs.get("csr_connectivity"),
+            dtype=kwargs.get("dtype"),
+            stride=kwargs.get("stride"),
+            target_count=kwargs.get("target_count"),
         )
 
     def _get_vector_field_data(
@@ -549,6 +703,9 @@ class BaseFieldData:
             kwargs.get("surfaces"),
             self.get_surface_ids(kwargs.get("surfaces")),
             vector_field_data,
+            dtype=kwargs.get("dtype"),
+            stride=kwargs.get("stride"),
+            target_count=kwargs.get("target_count"),
         )
 
     def _get_pathlines_field_data(
@@ -994,6 +1151,20 @@ class Batch(FieldBatch):
             self._allowed_scalar_field_names,
         )
 
+    async def get_response_async(self) -> BatchFieldData:
+        """Get data for previously added requests without blocking the event loop.
+
+        This requires a running asyncio event loop. The returned data is the same as
+        that returned by ``get_response``.
+        """
+        chunks = await self._service.aio.get_fields(self._fields_request)
+        return BatchFieldData(
+            ChunkParser().extract_fields(iter(chunks)),
+            self._field_info,
+            self._allowed_surface_names,
+            self._allowed_scalar_field_names,
+        )
+
     def __call__(self):
         self.get_response()
 
@@ -1024,6 +1195,33 @@ class _FieldDataConstants:
     }
 
 
+class _FieldInfoSnapshot:
+    """Surfaces and fields information fetched beforehand.
+
+    It is used to validate the requests of the asyncio API without making blocking
+    calls. The information is never fetched again.
+    """
+
+    def __init__(
+        self,
+        surfaces: Dict[str, Dict],
+        scalar_fields: Dict[str, Dict],
+        vector_fields: Dict[str, Dict],
+    ):
+        self._surfaces = surfaces
+        self._scalar_fields = scalar_fields
+        self._vector_fields = vector_fields
+
+    def _get_surfaces_info(self) -> Dict[str, Dict]:
+        return self._surfaces
+
+    def _get_scalar_fields_info(self) -> Dict[str, Dict]:
+        return self._scalar_fields
+
+    def _get_vector_fields_info(self) -> Dict[str, Dict]:
+        return self._vector_fields
+
+
 def _get_surface_ids(
     field_info: _FieldInfo,
     allowed_surface_names,
@@ -1042,21 +1240,21 @@ def _get_surface_ids(
     """
     surface_ids = []
     updated_surfaces = get_surfaces_from_objects(surfaces)
+    allowed_surface_ids = _AllowedSurfaceIDs(field_info)
     for surf in updated_surfaces:
         if isinstance(surf, str):
+            # Validate first as that may refresh the cached surfaces information.
+            surface_name = allowed_surface_names.valid_name(surf)
             surface_ids.extend(
-                field_info._get_surfaces_info()[allowed_surface_names.valid_name(surf)][
-                    "surface_id"
-                ]
+                field_info._get_surfaces_info()[surface_name]["surface_id"]
             )
         else:
-            allowed_surf_ids = _AllowedSurfaceIDs(field_info)()
-            if surf in allowed_surf_ids:
+            if allowed_surface_ids.is_valid(surf):
                 surface_ids.append(surf)
             elif isinstance(surf, Iterable) and not isinstance(surf, (str, bytes)):
                 raise DisallowedValuesError("surface", surf, list(surf))
             else:
-                raise DisallowedValuesError("surface", surf, allowed_surf_ids)
+                raise DisallowedValuesError("surface", surf, allowed_surface_ids())
     return surface_ids
 
 
@@ -1081,11 +1279,17 @@ class ChunkParser:
         field_name : str
 
         field : numpy array
+    dtype : numpy.typing.DTypeLike, optional
+        Floating-point type to which floating-point fields are converted while they
+        are extracted. The default is to keep the type sent by Fluent.
     """
 
-    def __init__(self, callbacks_provider: object = None):
+    def __init__(
+        self, callbacks_provider: object = None, dtype: npt.DTypeLike | None = None
+    ):
         """__init__ method of ChunkParser class."""
         self._callbacks_provider = callbacks_provider
+        self._dtype = dtype
 
     def extract_fields(self, chunk_iterator) -> Dict[int, Dict[str, np.array]]:
         """Extracts field data received from Fluent.
@@ -1113,17 +1317,26 @@ class ChunkParser:
             )
 
         def _extract_field(field_datatype, field_size, chunk_iterator):
-            field_arr = np.empty(field_size, dtype=field_datatype)
+            field_arr = np.empty(
+                field_size,
+                dtype=(
+                    self._dtype
+                    if self._dtype is not None and np.dtype(field_datatype).kind == "f"
+                    else field_datatype
+                ),
+            )
             field_datatype_item_size = np.dtype(field_datatype).itemsize
             index = 0
             for chunk in chunk_iterator:
-                if chunk.bytePayload:
+                # Each access to the payload of a message copies it.
+                byte_payload = chunk.bytePayload
+                if byte_payload:
                     count = min(
-                        len(chunk.bytePayload) // field_datatype_item_size,
+                        len(byte_payload) // field_datatype_item_size,
                         field_size - index,
                     )
                     field_arr[index : index + count] = np.frombuffer(
-                        chunk.bytePayload, field_datatype, count=count
+                        byte_payload, field_datatype, count=count
                     )
                     index += count
                     if index == field_size:
@@ -1347,6 +1560,134 @@ class Mesh:
     elements: list[Element]
 
 
+_SOLUTION_DATA_CHANGING_EVENTS = (
+    SolverEvent.ITERATION_ENDED,
+    SolverEvent.TIMESTEP_ENDED,
+    SolverEvent.DATA_LOADED,
+    SolverEvent.SOLUTION_INITIALIZED,
+)
+
+_MESH_CHANGING_EVENTS = (
+    SolverEvent.CASE_LOADED,
+    SolverEvent.SETTINGS_CLEARED,
+    MeshingEvent.CASE_LOADED,
+    MeshingEvent.SETTINGS_CLEARED,
+)
+
+
+class FieldDataCache:
+    """Memory-bounded least-recently-used cache of field data results.
+
+    Results are cached per surface and keyed by the request parameters. The cache
+    tracks a solver generation, which advances whenever the solution data may have
+    changed, and a mesh generation, which advances whenever the mesh may have
+    changed. Advancing a generation discards the results which depend on it, and
+    results fetched during an older generation are not stored.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Maximum total size of the cached arrays in bytes.
+    """
+
+    def __init__(self, max_bytes: int):
+        """__init__ method of FieldDataCache class."""
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._solver_generation = 0
+        self._mesh_generation = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the cached arrays in bytes."""
+        return self._nbytes
+
+    @property
+    def generation(self) -> Tuple[int, int]:
+        """Current solver and mesh generations."""
+        return self._solver_generation, self._mesh_generation
+
+    def get(self, key) -> Dict[str, np.ndarray] | None:
+        """Get the cached result for the key or ``None`` if it is not cached."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(
+        self,
+        key,
+        value: Dict[str, np.ndarray],
+        generation: Tuple[int, int],
+        mesh_dependent: bool = False,
+    ) -> None:
+        """Cache a result fetched during the given generation.
+
+        The cached arrays are made read-only. Results of an older generation and
+        results larger than ``max_bytes`` are not cached.
+
+        Parameters
+        ----------
+        key : Hashable
+            Request parameters.
+        value : Dict[str, np.ndarray]
+            Arrays of a surface keyed by field name.
+        generation : Tuple[int, int]
+            Value of ``generation`` before the result was requested.
+        mesh_dependent : bool, optional
+            Whether the result only changes with the mesh.
+        """
+        nbytes = sum(array.nbytes for array in value.values())
+        if nbytes > self.max_bytes:
+            return
+        for array in value.values():
+            array.flags.writeable = False
+        with self._lock:
+            if generation != self.generation:
+                return
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._nbytes -= previous[1]
+            self._entries[key] = (value, nbytes, mesh_dependent)
+            self._nbytes += nbytes
+            while self._nbytes > self.max_bytes:
+                _, (_, evicted_nbytes, _) = self._entries.popitem(last=False)
+                self._nbytes -= evicted_nbytes
+
+    def advance_generation(self, mesh_changed: bool = False) -> None:
+        """Discard the results invalidated by a change of the solution data.
+
+        Parameters
+        ----------
+        mesh_changed : bool, optional
+            Whether the mesh has changed as well, which also discards the
+            results which only depend on the mesh.
+        """
+        with self._lock:
+            self._solver_generation += 1
+            if mesh_changed:
+                self._mesh_generation += 1
+            for key, (_, nbytes, mesh_dependent) in list(self._entries.items()):
+                if mesh_changed or not mesh_dependent:
+                    del self._entries[key]
+                    self._nbytes -= nbytes
+
+    def clear(self) -> None:
+        """Discard all cached results."""
+        self.advance_generation(mesh_changed=True)
+
+
 class LiveFieldData(BaseFieldData, FieldDataSource):
     """Provides access to Fluent field data on surfaces."""
 
@@ -1357,9 +1698,11 @@ class LiveFieldData(BaseFieldData, FieldDataSource):
         is_data_valid: Callable[[], bool],
         scheme_eval=None,
         get_zones_info: weakref.WeakMethod[Callable[[], list[ZoneInfo]]] | None = None,
+        events=None,
     ):
         """__init__ method of FieldData class."""
         self._service = service
+        self._events = events
         self._field_info = field_info
         self.is_data_valid = is_data_valid
         self.scheme = scheme_eval
@@ -1434,6 +1777,135 @@ class LiveFieldData(BaseFieldData, FieldDataSource):
         )
         self._returned_data = _ReturnFieldData()
         self._fetched_data = _FetchFieldData()
+        self._cache = None
+        self._cache_callback_ids = []
+
+    @property
+    def cache(self) -> FieldDataCache | None:
+        """Client-side cache of field data results or ``None`` if it is disabled."""
+        return self._cache
+
+    def enable_cache(
+        self, max_bytes: int = 256 * 1024 * 1024, dynamic_mesh: bool = False
+    ) -> FieldDataCache:
+        """Cache scalar field, vector field and surface data on the client.
+
+        Results are cached per surface until the solver completes an iteration or
+        a time step, loads data or initializes the solution. The geometry of
+        surfaces of mesh zones is kept until a case is loaded or the settings are
+        cleared, which is only valid for a static mesh. Pass ``dynamic_mesh=True``
+        if the mesh moves or deforms, for example with dynamic mesh or mesh motion,
+        so that the geometry is discarded together with the other results. The
+        returned arrays are read-only while the cache is enabled.
+
+        The solver pauses at the end of every iteration and time step until the
+        cache has processed the event. Call ``clear_cache()`` after a change which
+        does not raise a solver event, for example a modified custom field
+        function.
+
+        Parameters
+        ----------
+        max_bytes : int, optional
+            Maximum total size of the cached arrays in bytes. The least recently
+            used results are discarded first. The default is 256 MB.
+        dynamic_mesh : bool, optional
+            Whether the mesh can move or deform during the solution, in which case
+            the geometry of mesh zone surfaces is not kept across iterations and
+            time steps. The default is ``False``.
+
+        Returns
+        -------
+        FieldDataCache
+        """
+        self._cache = FieldDataCache(max_bytes)
+        if self._events is not None:
+            self._unregister_cache_callbacks()
+            self._register_cache_callbacks(dynamic_mesh)
+        return self._cache
+
+    def disable_cache(self) -> None:
+        """Disable the client-side cache of field data results."""
+        self._cache = None
+        self._unregister_cache_callbacks()
+
+    def _register_cache_callbacks(self, dynamic_mesh: bool) -> None:
+        # Iteration and time step callbacks pause the solver until they are
+        # processed, so they are only registered while the cache is enabled.
+        for event_types, mesh_changed in (
+            (_SOLUTION_DATA_CHANGING_EVENTS, dynamic_mesh),
+            (_MESH_CHANGING_EVENTS, True),
+        ):
+            self._cache_callback_ids.extend(
+                self._events.register_weak_callback(
+                    event_types, self._advance_cache_generation, mesh_changed
+                )
+            )
+
+    def _unregister_cache_callbacks(self) -> None:
+        for callback_id in self._cache_callback_ids:
+            self._events.unregister_callback(callback_id)
+        self._cache_callback_ids = []
+
+    def clear_cache(self) -> None:
+        """Discard all results held in the client-side cache."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _advance_cache_generation(self, mesh_changed: bool = False) -> None:
+        if self._cache is not None:
+            self._cache.advance_generation(mesh_changed)
+
+    def _get_mesh_surface_ids(self) -> set[int]:
+        return {
+            surface_id
+            for info in self._field_info._get_surfaces_info().values()
+            if info["type"] == "zone-surf"
+            for surface_id in info["surface_id"]
+        }
+
+    def _get_fields(
+        self,
+        surface_ids: List[int],
+        add_requests: Callable[
+            [FieldDataProtoModule.GetFieldsRequest, List[int]], None
+        ],
+        cache_key: Tuple | None = None,
+        mesh_dependent: bool = False,
+    ) -> Dict[int, Dict[str, np.array]]:
+        """Get the fields of the surfaces, reusing cached results when enabled."""
+        cache = self._cache
+        if cache is None or cache_key is None:
+            fields_request = get_fields_request()
+            add_requests(fields_request, surface_ids)
+            fields = ChunkParser().extract_fields(
+                self._service.get_fields(fields_request)
+            )
+            return next(iter(fields.values()))
+        mesh_surface_ids = self._get_mesh_surface_ids() if mesh_dependent else set()
+        generation = cache.generation
+        surfaces_data = {}
+        for surface_id in surface_ids:
+            data = cache.get((cache_key, surface_id))
+            if data is not None:
+                surfaces_data[surface_id] = data
+        missing_surface_ids = list(
+            dict.fromkeys(id for id in surface_ids if id not in surfaces_data)
+        )
+        if missing_surface_ids:
+            fields_request = get_fields_request()
+            add_requests(fields_request, missing_surface_ids)
+            fields = ChunkParser().extract_fields(
+                self._service.get_fields(fields_request)
+            )
+            for surface_id, data in next(iter(fields.values())).items():
+                cache.put(
+                    (cache_key, surface_id),
+                    data,
+                    generation,
+                    mesh_dependent=surface_id in mesh_surface_ids,
+                )
+                surfaces_data[surface_id] = data
+        return surfaces_data
 
     def new_batch(self):
         """Create a new field batch."""
@@ -1454,22 +1926,29 @@ class LiveFieldData(BaseFieldData, FieldDataSource):
     def _get_scalar_field_data(self, **kwargs):
         surfaces = kwargs.get("surfaces")
         surface_ids = self.get_surface_ids(surfaces)
-        fields_request = get_fields_request()
         field_name = self._allowed_scalar_field_names.valid_name(
             kwargs.get("field_name")
         )
-        fields_request.scalarFieldRequest.extend(
-            self._fetched_data._scalar_data(
-                field_name,
-                self.get_surface_ids(surfaces),
-                kwargs.get("node_value"),
-                kwargs.get("boundary_value"),
-            )
+        node_value = kwargs.get("node_value")
+        boundary_value = kwargs.get("boundary_value")
+        scalar_field_data = self._get_fields(
+            surface_ids,
+            lambda request, ids: request.scalarFieldRequest.extend(
+                self._fetched_data._scalar_data(
+                    field_name, ids, node_value, boundary_value
+                )
+            ),
+            cache_key=("scalar-field", field_name, node_value, boundary_value),
         )
-        fields = ChunkParser().extract_fields(self._service.get_fields(fields_request))
-        scalar_field_data = next(iter(fields.values()))
         return self._returned_data._scalar_data(
-            field_name, surfaces, surface_ids, scalar_field_data
+            field_name,
+            surfaces,
+            surface_ids,
+            scalar_field_data,
+            node_value=node_value,
+            dtype=kwargs.get("dtype"),
+            stride=kwargs.get("stride"),
+            target_count=kwargs.get("target_count"),
         )
 
     def _get_surface_data(
@@ -1477,16 +1956,16 @@ class LiveFieldData(BaseFieldData, FieldDataSource):
         **kwargs,
     ) -> Dict[int | str, Dict[SurfaceDataType, np.array | List[np.array]]]:
         surface_ids = self.get_surface_ids(kwargs.get("surfaces"))
-        fields_request = get_fields_request()
-        fields_request.surfaceRequest.extend(
-            self._fetched_data._surface_data(
-                kwargs.get("data_types"),
-                surface_ids,
-                kwargs.get("overset_mesh"),
-            )
+        data_types = kwargs.get("data_types")
+        overset_mesh = kwargs.get("overset_mesh")
+        surface_data = self._get_fields(
+            surface_ids,
+            lambda request, ids: request.surfaceRequest.extend(
+                self._fetched_data._surface_data(data_types, ids, overset_mesh)
+            ),
+            cache_key=("surface-data", frozenset(data_types), overset_mesh),
+            mesh_dependent=True,
         )
-        fields = ChunkParser().extract_fields(self._service.get_fields(fields_request))
-        surface_data = next(iter(fields.values()))
         if self._deprecated_flag:
             self._deprecated_flag = False
             return self._returned_data._surface_data(
@@ -1496,6 +1975,10 @@ class LiveFieldData(BaseFieldData, FieldDataSource):
                 surface_data,
                 deprecated_flag=True,
                 flatten_connectivity=kwargs.get("flatten_connectivity"),
+                csr_connectivity=kwargs.get("csr_connectivity"),
+                dtype=kwargs.get("dtype"),
+                stride=kwargs.get("stride"),
+                target_count=kwargs.get("target_count"),
             )
 
         return self._returned_data._surface_data(
@@ -1504,6 +1987,10 @@ class LiveFieldData(BaseFieldData, FieldDataSource):
             surface_ids,
             surface_data,
             flatten_connectivity=kwargs.get("flatten_connectivity"),
+            csr_connectivity=kwargs.get("csr_connectivity"),
+            dtype=kwargs.get("dtype"),
+            stride=kwargs.get("stride"),
+            target_count=kwargs.get("target_count"),
         )
 
     def _get_vector_field_data(
@@ -1514,23 +2001,26 @@ class LiveFieldData(BaseFieldData, FieldDataSource):
         field_name = self._allowed_vector_field_names.valid_name(
             kwargs.get("field_name")
         )
-        for surface_id in surface_ids:
-            self.scheme.string_eval(f"(surface? {surface_id})")
-        fields_request = get_fields_request()
-        fields_request.vectorFieldRequest.extend(
-            self._fetched_data._vector_data(
-                field_name,
-                surface_ids,
+
+        def add_requests(request, ids):
+            if ids:
+                self.scheme.string_eval(f"(map surface? '({' '.join(map(str, ids))}))")
+            request.vectorFieldRequest.extend(
+                self._fetched_data._vector_data(field_name, ids)
             )
+
+        vector_field_data = self._get_fields(
+            surface_ids, add_requests, cache_key=("vector-field", field_name)
         )
-        fields = ChunkParser().extract_fields(self._service.get_fields(fields_request))
-        vector_field_data = next(iter(fields.values()))
 
         return self._returned_data._vector_data(
             field_name,
             kwargs.get("surfaces"),
             surface_ids,
             vector_field_data,
+            dtype=kwargs.get("dtype"),
+            stride=kwargs.get("stride"),
+            target_count=kwargs.get("target_count"),
         )
 
     def _get_pathlines_field_data(
@@ -1593,6 +2083,83 @@ class LiveFieldData(BaseFieldData, FieldDataSource):
             flatten_connectivity=kwargs.get("flatten_connectivity"),
         )
 
+    async def get_field_data_async(
+        self,
+        obj: (
+            SurfaceFieldDataRequest
+            | ScalarFieldDataRequest
+            | VectorFieldDataRequest
+            | PathlinesFieldDataRequest
+        ),
+    ) -> Dict[int | str, Dict | np.array]:
+        """Get the surface, scalar, vector or path-lines field data on a surface
+        without blocking the event loop.
+
+        This requires a running asyncio event loop. The data is returned in the same
+        format as ``get_field_data`` but is not cached. The surface and field names
+        are validated against the surfaces and fields information, which is fetched
+        without blocking the event loop. Whether the solution data is available is
+        checked by Fluent only when the data is fetched.
+
+        Examples
+        --------
+        >>> async def get_temperature(solver):
+        >>>     return await solver.fields.field_data.get_field_data_async(
+        >>>         ScalarFieldDataRequest(field_name="temperature", surfaces=["inlet"])
+        >>>     )
+        """
+        field_info = await self._get_field_info_snapshot_async(obj)
+        batch = Batch(
+            self._service,
+            field_info,
+            _AllowedSurfaceIDs(field_info),
+            _AllowedSurfaceNames(field_info),
+            _AllowedScalarFieldNames(lambda: True, field_info),
+            _AllowedVectorFieldNames(lambda: True, field_info),
+        )
+        batch.add_requests(obj)
+        response = await batch.get_response_async()
+        return response.get_field_data(obj)
+
+    async def _get_field_info_snapshot_async(self, obj) -> _FieldInfoSnapshot:
+        surfaces = get_surfaces_from_objects(obj.surfaces)
+        field_names = [
+            _to_field_name_str(name)
+            for name in (
+                getattr(obj, "field_name", None),
+                getattr(obj, "additional_field_name", None),
+            )
+            if name
+        ]
+        is_vector = isinstance(obj, VectorFieldDataRequest)
+        for refresh in (False, True):
+            if refresh:
+                # Unknown names may have been added since the information was cached.
+                self._field_info.clear_cache()
+            surfaces_info = await self._field_info._get_surfaces_info_async()
+            scalar_fields_info, vector_fields_info = {}, {}
+            if is_vector:
+                vector_fields_info = (
+                    await self._field_info._get_vector_fields_info_async()
+                )
+            elif field_names:
+                scalar_fields_info = (
+                    await self._field_info._get_scalar_fields_info_async()
+                )
+            surface_ids = {
+                info["surface_id"][0]
+                for info in surfaces_info.values()
+                if info["surface_id"]
+            }
+            fields_info = vector_fields_info if is_vector else scalar_fields_info
+            if all(
+                surf in surfaces_info if isinstance(surf, str) else surf in surface_ids
+                for surf in surfaces
+                if isinstance(surf, (str, int))
+            ) and all(name in fields_info for name in field_names):
+                break
+        return _FieldInfoSnapshot(surfaces_info, scalar_fields_info, vector_fields_info)
+
     def get_scalar_field_data(
         self,
         field_name: str,
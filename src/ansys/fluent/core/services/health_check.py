@@ -65,7 +65,7 @@ class HealthCheckService:
             GrpcErrorInterceptor(),
             ErrorStateInterceptor(fluent_error_state),
             TracingInterceptor(),
-            BatchInterceptor(),
+            BatchInterceptor(channel),
         )
         self._stub = HealthCheckGrpcModule.HealthStub(intercept_channel)
         self._metadata = metadata
@@ -23,6 +23,7 @@
 """Interceptor classes to use with gRPC services."""
 
 import builtins
+import collections
 import logging
 import os
 from typing import Any
@@ -121,6 +122,34 @@ class ErrorStateInterceptor(grpc.UnaryUnaryClientInterceptor):
         return self._intercept_call(continuation, client_call_details, request)
 
 
+def _get_python_exception(call: grpc.Call, ex: Exception) -> Exception:
+    """Get the Python exception corresponding to the error of a gRPC call."""
+    new_ex_cls = RuntimeError
+    try:
+        from google.rpc import error_details_pb2
+        from grpc_status import rpc_status
+
+        status = rpc_status.from_call(call)
+        if status:
+            for detail in status.details:
+                if detail.Is(error_details_pb2.ErrorInfo.DESCRIPTOR):
+                    info = error_details_pb2.ErrorInfo()
+                    detail.Unpack(info)
+                    if info.domain == "Python":
+                        reason = info.reason
+                        ex_cls_name = _upper_snake_case_to_camel_case(reason)
+                        if hasattr(builtins, ex_cls_name):
+                            cls = getattr(builtins, ex_cls_name)
+                            if issubclass(cls, Exception):
+                                new_ex_cls = cls
+                                break
+    except DecodeError:
+        pass
+    new_ex = new_ex_cls(ex.details() if isinstance(ex, grpc.RpcError) else str(ex))
+    new_ex.__context__ = ex
+    return new_ex
+
+
 class GrpcErrorInterceptor(grpc.UnaryUnaryClientInterceptor):
     """Interceptor class to check Fluent server error state before gRPC calls are
     made."""
@@ -133,33 +162,7 @@ class GrpcErrorInterceptor(grpc.UnaryUnaryClientInterceptor):
     ) -> Any:
         response = continuation(client_call_details, request)
         if response.exception() is not None and response.code() != grpc.StatusCode.OK:
-            new_ex_cls = RuntimeError
-            try:
-                from google.rpc import error_details_pb2
-                from grpc_status import rpc_status
-
-                status = rpc_status.from_call(response)
-                if status:
-                    for detail in status.details:
-                        if detail.Is(error_details_pb2.ErrorInfo.DESCRIPTOR):
-                            info = error_details_pb2.ErrorInfo()
-                            detail.Unpack(info)
-                            if info.domain == "Python":
-                                reason = info.reason
-                                ex_cls_name = _upper_snake_case_to_camel_case(reason)
-                                if hasattr(builtins, ex_cls_name):
-                                    cls = getattr(builtins, ex_cls_name)
-                                    if issubclass(cls, Exception):
-                                        new_ex_cls = cls
-                                        break
-            except DecodeError:
-                pass
-            ex = response.exception()
-            new_ex = new_ex_cls(
-                ex.details() if isinstance(ex, grpc.RpcError) else str(ex)
-            )
-            new_ex.__context__ = ex
-            raise new_ex from None
+            raise _get_python_exception(response, response.exception()) from None
         return response
 
     def intercept_unary_unary(
@@ -172,6 +175,70 @@ class GrpcErrorInterceptor(grpc.UnaryUnaryClientInterceptor):
         return self._intercept_call(continuation, client_call_details, request)
 
 
+class AioTracingInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
+    """Interceptor class to trace gRPC calls made through an asyncio channel."""
+
+    async def intercept_unary_unary(
+        self,
+        continuation: Any,
+        client_call_details: grpc.aio.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        """Intercept unary-unary call for tracing."""
+        network_logger.debug(
+            f"GRPC_TRACE: RPC = {client_call_details.method}, request = {_truncate_grpc_str(request)}"
+        )
+        call = await continuation(client_call_details, request)
+        response = await call
+        # call _truncate_grpc_str early to get the size warning even when hiding secrets
+        response_str = _truncate_grpc_str(response)
+        if os.getenv("PYFLUENT_HIDE_LOG_SECRETS") != "1":
+            network_logger.debug(f"GRPC_TRACE: response = {response_str}")
+        return response
+
+
+class AioErrorStateInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
+    """Interceptor class to check Fluent server error state before gRPC calls are
+    made through an asyncio channel."""
+
+    def __init__(self, fluent_error_state) -> None:
+        """__init__ method of AioErrorStateInterceptor class."""
+        super().__init__()
+        self._fluent_error_state = fluent_error_state
+
+    async def intercept_unary_unary(
+        self,
+        continuation: Any,
+        client_call_details: grpc.aio.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        """Intercept unary-unary call for error state checking."""
+        if self._fluent_error_state.name == "fatal":
+            details = self._fluent_error_state.details
+            raise RuntimeError(
+                f"Fatal error identified on the Fluent server: {details}."
+            )
+        return await continuation(client_call_details, request)
+
+
+class AioGrpcErrorInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
+    """Interceptor class to convert the errors of gRPC calls made through an asyncio
+    channel."""
+
+    async def intercept_unary_unary(
+        self,
+        continuation: Any,
+        client_call_details: grpc.aio.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        """Intercept unary-unary call for error conversion."""
+        try:
+            call = await continuation(client_call_details, request)
+            return await call
+        except grpc.aio.AioRpcError as ex:
+            raise _get_python_exception(ex, ex) from None
+
+
 class BatchedFuture(grpc.Future):
     """Class implementing gRPC.Future interface.
 
@@ -219,9 +286,18 @@ class BatchedFuture(grpc.Future):
 class BatchInterceptor(grpc.UnaryUnaryClientInterceptor):
     """Interceptor class to batch gRPC calls."""
 
-    def __init__(self) -> None:
-        """__init__ method of BatchInterceptor class."""
+    def __init__(self, channel: grpc.Channel | None = None) -> None:
+        """__init__ method of BatchInterceptor class.
+
+        Parameters
+        ----------
+        channel : grpc.Channel, optional
+            Channel of the intercepted calls. The calls are batched only within the
+            batch context of the session connected through this channel. If not
+            specified, the most recently created batch context is used.
+        """
         super().__init__()
+        self._channel = channel
 
     def _intercept_call(
         self,
@@ -229,8 +305,8 @@ class BatchInterceptor(grpc.UnaryUnaryClientInterceptor):
         client_call_details: grpc.ClientCallDetails,
         request: Any,
     ) -> Any:
-        batchOps = BatchOps.instance()
-        if batchOps and batchOps.batching:
+        batchOps = BatchOps._get_active(self._channel)
+        if batchOps:
             qual_method = client_call_details.method
             package_and_service, method = qual_method.lstrip("/").split("/")
             package, service = package_and_service.rsplit(".", 1)
@@ -248,3 +324,129 @@ class BatchInterceptor(grpc.UnaryUnaryClientInterceptor):
     ) -> Any:
         """Intercept unary-unary call for batch operation."""
         return self._intercept_call(continuation, client_call_details, request)
+
+
+class _ClientCallDetails(
+    collections.namedtuple(
+        "_ClientCallDetails",
+        (
+            "method",
+            "timeout",
+            "metadata",
+            "credentials",
+            "wait_for_ready",
+            "compression",
+        ),
+    ),
+    grpc.ClientCallDetails,
+):
+    pass
+
+
+class ChannelProfileInterceptor(
+    grpc.UnaryUnaryClientInterceptor,
+    grpc.UnaryStreamClientInterceptor,
+    grpc.StreamUnaryClientInterceptor,
+    grpc.StreamStreamClientInterceptor,
+):
+    """Interceptor class to apply the default deadlines and compression of a channel
+    profile to gRPC calls."""
+
+    def __init__(self, channel_profile) -> None:
+        """__init__ method of ChannelProfileInterceptor class.
+
+        Parameters
+        ----------
+        channel_profile : ChannelProfile
+            Channel profile providing the default deadlines and compression.
+        """
+        super().__init__()
+        self._channel_profile = channel_profile
+
+    def _get_call_details(
+        self, client_call_details: grpc.ClientCallDetails, unary_response: bool
+    ) -> grpc.ClientCallDetails:
+        method = client_call_details.method
+        timeout = client_call_details.timeout
+        # Streaming calls like the transcript or the events are open for the whole
+        # session, so they never get a default deadline.
+        if timeout is None and unary_response:
+            timeout = self._channel_profile.get_timeout(method)
+        compression = getattr(client_call_details, "compression", None)
+        if compression is None:
+            compression = self._channel_profile.get_compression(method)
+        return _ClientCallDetails(
+            method,
+            timeout,
+            client_call_details.metadata,
+            client_call_details.credentials,
+            getattr(client_call_details, "wait_for_ready", None),
+            compression,
+        )
+
+    def intercept_unary_unary(
+        self,
+        continuation: Any,
+        client_call_details: grpc.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        """Intercept unary-unary call to apply the channel profile."""
+        return continuation(self._get_call_details(client_call_details, True), request)
+
+    def intercept_unary_stream(
+        self,
+        continuation: Any,
+        client_call_details: grpc.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        """Intercept unary-stream call to apply the channel profile."""
+        return continuation(self._get_call_details(client_call_details, False), request)
+
+    def intercept_stream_unary(
+        self,
+        continuation: Any,
+        client_call_details: grpc.ClientCallDetails,
+        request_iterator: Any,
+    ) -> Any:
+        """Intercept stream-unary call to apply the channel profile."""
+        return continuation(
+            self._get_call_details(client_call_details, True), request_iterator
+        )
+
+    def intercept_stream_stream(
+        self,
+        continuation: Any,
+        client_call_details: grpc.ClientCallDetails,
+        request_iterator: Any,
+    ) -> Any:
+        """Intercept stream-stream call to apply the channel profile."""
+        return continuation(
+            self._get_call_details(client_call_details, False), request_iterator
+        )
+
+
+class AioChannelProfileInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
+    """Interceptor class to apply the default deadlines of a channel profile to gRPC
+    calls made through an asyncio channel.
+
+    The calls of an asyncio channel cannot be compressed individually, so only the
+    channel-wide compression of the profile applies to them.
+    """
+
+    def __init__(self, channel_profile) -> None:
+        """__init__ method of AioChannelProfileInterceptor class."""
+        super().__init__()
+        self._channel_profile = channel_profile
+
+    async def intercept_unary_unary(
+        self,
+        continuation: Any,
+        client_call_details: grpc.aio.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        """Intercept unary-unary call to apply the channel profile."""
+        if client_call_details.timeout is None:
+            timeout = self._channel_profile.get_timeout(client_call_details.method)
+            if timeout is not None:
+                client_call_details = client_call_details._replace(timeout=timeout)
+        return await continuation(client_call_details, request)
@@ -44,7 +44,7 @@ class MonitorsService(StreamingService):
             channel,
             ErrorStateInterceptor(fluent_error_state),
             TracingInterceptor(),
-            BatchInterceptor(),
+            BatchInterceptor(channel),
         )
         self._stub = MonitorGrpcModule.MonitorStub(intercept_channel)
         self._metadata = metadata
@@ -57,7 +57,7 @@ class ReductionService:
             GrpcErrorInterceptor(),
             ErrorStateInterceptor(fluent_error_state),
             TracingInterceptor(),
-            BatchInterceptor(),
+            BatchInterceptor(channel),
         )
         self._stub = ReductionGrpcModule.ReductionStub(intercept_channel)
         self._metadata = metadata
@@ -32,6 +32,7 @@ Example
 0.7
 """
 
+import functools
 from typing import Any, Sequence
 
 from deprecated.sphinx import deprecated
@@ -64,7 +65,7 @@ class SchemeEvalService:
             GrpcErrorInterceptor(),
             ErrorStateInterceptor(fluent_error_state),
             TracingInterceptor(),
-            BatchInterceptor(),
+            BatchInterceptor(channel),
         )
         self.__stub = SchemeEvalGrpcModule.SchemeEvalStub(intercept_channel)
         self.__metadata = metadata
@@ -114,6 +115,12 @@ class Symbol:
         return self.str
 
 
+@functools.cache
+def _uses_pair_lists(version: str) -> bool:
+    """Whether the Fluent version represents Scheme lists as chains of pairs."""
+    return FluentVersion(version) < FluentVersion.v231
+
+
 def _convert_pair_to_scheme_pointer(
     val: tuple[Any, Any], p: SchemePointer, version: str
 ) -> None:
@@ -124,9 +131,11 @@ def _convert_pair_to_scheme_pointer(
 def _convert_list_of_pairs_to_scheme_pointer(
     val: list[tuple[Any, Any]], p: SchemePointer, version: str
 ) -> None:
-    if len(val) > 0:
-        _convert_pair_to_scheme_pointer(val[0], p.pair.car, version)
-        _convert_list_of_pairs_to_scheme_pointer(val[1:], p.pair.cdr, version)
+    # The chain of pairs is built in a loop as it can be longer than the
+    # recursion limit.
+    for item in val:
+        _convert_pair_to_scheme_pointer(item, p.pair.car, version)
+        p = p.pair.cdr
 
 
 def _convert_py_value_to_scheme_pointer(
@@ -147,51 +156,55 @@ def _convert_py_value_to_scheme_pointer(
         _convert_py_value_to_scheme_pointer(val[0], p.pair.car, version)
         _convert_py_value_to_scheme_pointer(val[1], p.pair.cdr, version)
     elif isinstance(val, list) or isinstance(val, tuple):
-        if FluentVersion(version) < FluentVersion.v231:
-            if val:
-                val = list(val)
-                _convert_py_value_to_scheme_pointer(val[0], p.pair.car, version)
-                _convert_py_value_to_scheme_pointer(val[1:], p.pair.cdr, version)
+        if _uses_pair_lists(version):
+            for item in val:
+                _convert_py_value_to_scheme_pointer(item, p.pair.car, version)
+                p = p.pair.cdr
         else:
+            items = p.list.item
             for item in val:
-                _convert_py_value_to_scheme_pointer(item, p.list.item.add(), version)
+                _convert_py_value_to_scheme_pointer(item, items.add(), version)
     elif isinstance(val, dict):
-        if FluentVersion(version) < FluentVersion.v231:
-            as_list = list(val.items())
-            if as_list:
-                _convert_pair_to_scheme_pointer(as_list[0], p.pair.car, version)
-                _convert_list_of_pairs_to_scheme_pointer(
-                    as_list[1:], p.pair.cdr, version
-                )
+        if _uses_pair_lists(version):
+            _convert_list_of_pairs_to_scheme_pointer(val.items(), p, version)
         else:
+            items = p.list.item
             for k, v in val.items():
-                item = p.list.item.add()
+                item = items.add()
                 _convert_py_value_to_scheme_pointer(k, item.pair.car, version)
                 _convert_py_value_to_scheme_pointer(v, item.pair.cdr, version)
 
 
+def _is_dict_item(x: Any) -> bool:
+    return isinstance(x, dict) or (
+        (isinstance(x, tuple) or isinstance(x, list)) and x and isinstance(x[0], str)
+    )
+
+
 def _convert_scheme_pointer_to_py_list(p: SchemePointer, version: str) -> dict | list:
-    val = []
-    val.append(_convert_scheme_pointer_to_py_value(p.pair.car, version))
-    if p.pair.cdr.HasField("pair"):
-        tail = _convert_scheme_pointer_to_py_list(p.pair.cdr, version)
-        val.extend([tail] if isinstance(tail, dict) else tail)
-    if all(
-        isinstance(x, dict)
-        or (
-            (isinstance(x, tuple) or isinstance(x, list))
-            and x
-            and isinstance(x[0], str)
-        )
-        for x in val
-    ):
-        d = {}
-        for x in val:
-            if isinstance(x, dict):
-                d.update(x)
-            else:
-                d[x[0]] = x[1:] if len(x) > 2 else x[1]
+    # The chain of pairs is walked in a loop as it can be longer than the
+    # recursion limit.
+    val = [_convert_scheme_pointer_to_py_value(p.pair.car, version)]
+    while p.pair.cdr.HasField("pair"):
+        p = p.pair.cdr
+        val.append(_convert_scheme_pointer_to_py_value(p.pair.car, version))
+    # The longest tail of dictionaries and keyed items is merged into a
+    # dictionary, which is the whole value if there is no other item.
+    start = len(val)
+    while start > 0 and _is_dict_item(val[start - 1]):
+        start -= 1
+    if start == len(val):
+        return val
+    d = {}
+    for x in val[start:]:
+        if isinstance(x, dict):
+            d.update(x)
+        else:
+            d[x[0]] = x[1:] if len(x) > 2 else x[1]
+    if start == 0:
         return d
+    del val[start:]
+    val.append(d)
     return val
 
 
@@ -210,7 +223,7 @@ def _convert_scheme_pointer_to_py_value(p: SchemePointer, version: str) -> Any:
     elif p.HasField("sym"):
         return Symbol(p.sym)
     elif p.HasField("pair"):
-        if FluentVersion(version) < FluentVersion.v231:
+        if _uses_pair_lists(version):
             if any(
                 p.pair.cdr.HasField(x)
                 for x in ["b", "fixednum", "flonum", "c", "str", "sym"]
@@ -227,18 +240,18 @@ def _convert_scheme_pointer_to_py_value(p: SchemePointer, version: str) -> Any:
             cdr = _convert_scheme_pointer_to_py_value(p.pair.cdr, version)
             return (car,) if cdr is None else (car, cdr)
     elif p.HasField("list"):
-        is_dict = all(item.HasField("pair") for item in p.list.item)
+        items = p.list.item
+        is_dict = all(item.HasField("pair") for item in items)
         if is_dict:
             return {
                 _convert_scheme_pointer_to_py_value(
                     item.pair.car, version
                 ): _convert_scheme_pointer_to_py_value(item.pair.cdr, version)
-                for item in p.list.item
+                for item in items
             }
         else:
             return [
-                _convert_scheme_pointer_to_py_value(item, version)
-                for item in p.list.item
+                _convert_scheme_pointer_to_py_value(item, version) for item in items
             ]
 
     return None
@@ -260,6 +273,9 @@ class SchemeEval:
     def __init__(self, service: SchemeEvalService) -> None:
         """__init__ method of SchemeEval class."""
         self.service = service
+        # Called after every evaluation or execution of scheme code, which can run
+        # TUI commands.
+        self._command_callbacks = []
         try:
             version = self.string_eval("(cx-version)")
             self.version = ".".join(version.strip("()").split())
@@ -282,19 +298,24 @@ class SchemeEval:
         Any
             Output scheme value represented as Python datatype
         """
-        if FluentVersion(self.version) < FluentVersion.v231:
-            request = SchemePointer()
-            _convert_py_value_to_scheme_pointer(val, request, self.version)
-            response = self.service.eval(request)
-            return _convert_scheme_pointer_to_py_value(response, self.version)
-        else:
-            request = SchemeEvalProtoModule.SchemeEvalRequest()
-            _convert_py_value_to_scheme_pointer(val, request.input, self.version)
-            metadata = []
-            if not suppress_prompts:
-                metadata.append(("no-suppress-prompts", "1"))
-            response = self.service.scheme_eval(request, metadata)
-            return _convert_scheme_pointer_to_py_value(response.output, self.version)
+        try:
+            if _uses_pair_lists(self.version):
+                request = SchemePointer()
+                _convert_py_value_to_scheme_pointer(val, request, self.version)
+                response = self.service.eval(request)
+                return _convert_scheme_pointer_to_py_value(response, self.version)
+            else:
+                request = SchemeEvalProtoModule.SchemeEvalRequest()
+                _convert_py_value_to_scheme_pointer(val, request.input, self.version)
+                metadata = []
+                if not suppress_prompts:
+                    metadata.append(("no-suppress-prompts", "1"))
+                response = self.service.scheme_eval(request, metadata)
+                return _convert_scheme_pointer_to_py_value(
+                    response.output, self.version
+                )
+        finally:
+            self._run_command_callbacks()
 
     def exec(
         self,
@@ -323,7 +344,10 @@ class SchemeEval:
         request.command.extend(commands)
         request.wait = wait
         request.silent = silent
-        response = self.service.exec(request)
+        try:
+            response = self.service.exec(request)
+        finally:
+            self._run_command_callbacks()
         return response.output
 
     def string_eval(self, input: str) -> str:
@@ -341,9 +365,16 @@ class SchemeEval:
         """
         request = SchemeEvalProtoModule.StringEvalRequest()
         request.input = input
-        response = self.service.string_eval(request)
+        try:
+            response = self.service.string_eval(request)
+        finally:
+            self._run_command_callbacks()
         return response.output
 
+    def _run_command_callbacks(self) -> None:
+        for callback in self._command_callbacks:
+            callback()
+
     @deprecated(version="0.32", reason="Use ``session.scheme``.")
     def scheme_eval(self, scm_input: str, suppress_prompts: bool = True) -> Any:
         """Evaluates a scheme expression in string format."""
@@ -24,7 +24,7 @@
 
 import collections.abc
 from functools import wraps
-from typing import Any
+from typing import Any, Callable
 
 import grpc
 
@@ -47,7 +47,7 @@ class _SettingsServiceImpl:
             GrpcErrorInterceptor(),
             ErrorStateInterceptor(fluent_error_state),
             TracingInterceptor(),
-            BatchInterceptor(),
+            BatchInterceptor(channel),
         )
         self.__stub = SettingsGrpcModule.SettingsStub(intercept_channel)
         self.__metadata = metadata
@@ -159,12 +159,33 @@ class SettingsService:
     """Service for accessing and modifying Fluent settings."""
 
     def __init__(
-        self, channel, metadata, app_utilities, scheme_eval, fluent_error_state
+        self,
+        channel,
+        metadata,
+        app_utilities,
+        scheme_eval,
+        fluent_error_state,
+        create_aio_service: Callable[[], "AsyncSettingsService"] | None = None,
     ) -> None:
         """__init__ method of SettingsService class."""
         self._service_impl = _SettingsServiceImpl(channel, metadata, fluent_error_state)
         self._app_utilities = app_utilities
         self._scheme_eval = scheme_eval
+        self._create_aio_service = create_aio_service
+
+    @property
+    def aio(self) -> "AsyncSettingsService":
+        """Settings service of the running asyncio event loop.
+
+        Raises
+        ------
+        RuntimeError
+            If the asyncio API is not available for the session or if there is no
+            running event loop.
+        """
+        if self._create_aio_service is None:
+            raise RuntimeError("The asyncio API is not available for this session.")
+        return self._create_aio_service()
 
     @_trace
     def _set_state_from_value(self, state: SettingsModule.Value, value: Any):
@@ -401,3 +422,115 @@ class SettingsService:
     def is_interactive_mode(self) -> bool:
         """Checks whether commands can be executed interactively."""
         return False
+
+
+class _AsyncSettingsServiceImpl:
+    def __init__(
+        self, channel: grpc.aio.Channel, metadata: list[tuple[str, str]]
+    ) -> None:
+        self.__stub = SettingsGrpcModule.SettingsStub(channel)
+        self.__metadata = metadata
+
+    async def set_var(
+        self, request: SettingsModule.SetVarRequest
+    ) -> SettingsModule.SetVarResponse:
+        """Set a variable."""
+        return await self.__stub.SetVar(request, metadata=self.__metadata)
+
+    async def get_var(
+        self, request: SettingsModule.GetVarRequest
+    ) -> SettingsModule.GetVarResponse:
+        """Get a variable."""
+        return await self.__stub.GetVar(request, metadata=self.__metadata)
+
+    async def get_object_names(
+        self, request: SettingsModule.GetObjectNamesRequest
+    ) -> SettingsModule.GetObjectNamesResponse:
+        """Get object names."""
+        return await self.__stub.GetObjectNames(request, metadata=self.__metadata)
+
+    async def execute_cmd(
+        self, request: SettingsModule.ExecuteCommandRequest
+    ) -> SettingsModule.ExecuteCommandResponse:
+        """Execute the command."""
+        return await self.__stub.ExecuteCommand(request, metadata=self.__metadata)
+
+    async def execute_query(
+        self, request: SettingsModule.ExecuteQueryRequest
+    ) -> SettingsModule.ExecuteQueryResponse:
+        """Execute the query."""
+        return await self.__stub.ExecuteQuery(request, metadata=self.__metadata)
+
+    async def get_attrs(
+        self, request: SettingsModule.GetAttrsRequest
+    ) -> SettingsModule.GetAttrsResponse:
+        """Get attributes."""
+        return await self.__stub.GetAttrs(request, metadata=self.__metadata)
+
+
+class AsyncSettingsService:
+    """Service for accessing and modifying Fluent settings from asyncio code.
+
+    The requests and the values are converted in the same way as in
+    ``SettingsService``. The channel must be an asyncio channel created by
+    ``FluentConnection``, which sets up the interceptors.
+    """
+
+    def __init__(self, channel, metadata) -> None:
+        """__init__ method of AsyncSettingsService class."""
+        self._service_impl = _AsyncSettingsServiceImpl(channel, metadata)
+
+    _set_state_from_value = SettingsService._set_state_from_value
+    _get_state_from_value = SettingsService._get_state_from_value
+    _parse_attrs = SettingsService._parse_attrs
+
+    async def set_var(self, path: str, value: Any) -> None:
+        """Set the value for the given path."""
+        request = _get_request_instance_for_path(SettingsModule.SetVarRequest, path)
+        self._set_state_from_value(request.value, value)
+        await self._service_impl.set_var(request)
+
+    async def get_var(self, path: str) -> Any:
+        """Get the value for the given path."""
+        request = _get_request_instance_for_path(SettingsModule.GetVarRequest, path)
+        response = await self._service_impl.get_var(request)
+        return self._get_state_from_value(response.value)
+
+    async def get_object_names(self, path: str) -> list[str]:
+        """Get a list of named objects."""
+        request = _get_request_instance_for_path(
+            SettingsModule.GetObjectNamesRequest, path
+        )
+        return (await self._service_impl.get_object_names(request)).names
+
+    async def execute_cmd(self, path: str, command: str, **kwds) -> Any:
+        """Execute a given command with the provided keyword arguments."""
+        request = _get_request_instance_for_path(
+            SettingsModule.ExecuteCommandRequest, path
+        )
+        request.command = command
+        self._set_state_from_value(request.args, kwds)
+        response = await self._service_impl.execute_cmd(request)
+        return self._get_state_from_value(response.reply)
+
+    async def execute_query(self, path: str, query: str, **kwds) -> Any:
+        """Execute a given query with the provided keyword arguments."""
+        request = _get_request_instance_for_path(
+            SettingsModule.ExecuteQueryRequest, path
+        )
+        request.query = query
+        self._set_state_from_value(request.args, kwds)
+        response = await self._service_impl.execute_query(request)
+        return self._get_state_from_value(response.reply)
+
+    async def get_attrs(
+        self, path: str, attrs: list[str], recursive: bool = False
+    ) -> Any:
+        """Return values of given attributes."""
+        request = _get_request_instance_for_path(SettingsModule.GetAttrsRequest, path)
+        request.attrs[:] = attrs
+        request.recursive = recursive
+        response = await self._service_impl.get_attrs(request)
+        if recursive:
+            return self._parse_attrs(response)
+        return self._get_state_from_value(response.values)
@@ -22,7 +22,7 @@
 
 """Wrappers over SVAR gRPC service of Fluent."""
 
-import math
+import threading
 from typing import Dict, List
 import warnings
 
@@ -236,6 +236,31 @@ class SolutionVariableInfo:
     ):
         """Initialize SolutionVariableInfo."""
         self._service = service
+        self._zones_info = None
+        self._variables_info = {}
+        self._cache_lock = threading.Lock()
+
+    def clear_cache(self) -> None:
+        """Clear the cached zones and solution variables information.
+
+        The cache is cleared automatically when a case or data file is loaded
+        or the solution is initialized.
+        """
+        with self._cache_lock:
+            self._zones_info = None
+            self._variables_info = {}
+
+    def _get_zone_variables_info(self, zone_id: int, domain_id: int):
+        key = (zone_id, domain_id)
+        svars_info = self._variables_info.get(key)
+        if svars_info is None:
+            request = SvarProtoModule.GetSvarsInfoRequest(
+                domainId=domain_id, zoneId=zone_id
+            )
+            svars_info = list(self._service.get_variables_info(request).svarsInfo)
+            with self._cache_lock:
+                self._variables_info[key] = svars_info
+        return svars_info
 
     def get_variables_info(
         self, zone_names: List[str], domain_name: str | None = "mixture"
@@ -259,17 +284,16 @@ class SolutionVariableInfo:
         allowed_domain_names = _AllowedDomainNames(self)
         solution_variables_info = None
         for zone_name in zone_names:
-            request = SvarProtoModule.GetSvarsInfoRequest(
-                domainId=allowed_domain_names.valid_name(domain_name),
-                zoneId=allowed_zone_names.valid_name(zone_name),
+            svars_info = self._get_zone_variables_info(
+                zone_id=allowed_zone_names.valid_name(zone_name),
+                domain_id=allowed_domain_names.valid_name(domain_name),
             )
-            response = self._service.get_variables_info(request)
             if solution_variables_info is None:
                 solution_variables_info = SolutionVariableInfo.SolutionVariables(
-                    response.svarsInfo
+                    svars_info
                 )
             else:
-                solution_variables_info._filter(response.svarsInfo)
+                solution_variables_info._filter(svars_info)
         return solution_variables_info
 
     def get_svars_info(
@@ -294,9 +318,16 @@ class SolutionVariableInfo:
         SolutionVariableInfo.ZonesInfo
             Object containing information for all zones.
         """
-        request = SvarProtoModule.GetZonesInfoRequest()
-        response = self._service.get_zones_info(request)
-        return SolutionVariableInfo.ZonesInfo(response.zonesInfo, response.domainsInfo)
+        zones_info = self._zones_info
+        if zones_info is None:
+            request = SvarProtoModule.GetZonesInfoRequest()
+            response = self._service.get_zones_info(request)
+            zones_info = SolutionVariableInfo.ZonesInfo(
+                response.zonesInfo, response.domainsInfo
+            )
+            with self._cache_lock:
+                self._zones_info = zones_info
+        return zones_info
 
 
 class InvalidSolutionVariableNameError(ValueError):
@@ -440,11 +471,23 @@ class _SvarMethod:
         return self._svar_accessor(*args, **kwargs)
 
 
-def extract_svars(solution_variables_data):
-    """Extracts SVAR data via a server call."""
+def extract_svars(solution_variables_data, zone_arrays: Dict[int, np.ndarray] = None):
+    """Extracts SVAR data via a server call.
+
+    Zone data is written into the matching array of ``zone_arrays`` if it has the
+    size and type of the received data, otherwise a new array is allocated.
+    """
+    zone_arrays = zone_arrays or {}
 
-    def _extract_svar(field_datatype, field_size, solution_variables_data):
-        field_arr = np.empty(field_size, dtype=field_datatype)
+    def _extract_svar(field_datatype, field_size, solution_variables_data, out=None):
+        if (
+            out is not None
+            and out.size == field_size
+            and out.dtype == np.dtype(field_datatype)
+        ):
+            field_arr = out
+        else:
+            field_arr = np.empty(field_size, dtype=field_datatype)
         field_datatype_item_size = np.dtype(field_datatype).itemsize
         index = 0
         for solution_variable_data in solution_variables_data:
@@ -484,6 +527,7 @@ def extract_svars(solution_variables_data):
                 ],
                 array.payloadInfo.fieldSize,
                 solution_variables_data,
+                zone_arrays.get(array.payloadInfo.zone),
             )
         elif array.WhichOneof("array") == "header":
             continue
@@ -491,6 +535,42 @@ def extract_svars(solution_variables_data):
     return zones_svar_data
 
 
+def _generate_payload_requests(solution_variable_data: np.ndarray):
+    """Lazily generate the payload requests of a contiguous array, in chunks."""
+    if _FieldDataConstants.bytes_stream:
+        # Send raw bytes so that protobuf does not convert element by element.
+        buffer = memoryview(solution_variable_data).cast("B")
+        for start in range(0, buffer.nbytes, _FieldDataConstants.chunk_size):
+            yield SvarProtoModule.SetSvarDataRequest(
+                payload=SvarProtoModule.Payload(
+                    bytePayload=bytes(
+                        buffer[start : start + _FieldDataConstants.chunk_size]
+                    )
+                )
+            )
+        return
+    payload_types = {
+        np.float32: ("floatPayload", FieldDataProtoModule.FloatPayload),
+        np.float64: ("doublePayload", FieldDataProtoModule.DoublePayload),
+        np.int32: ("intPayload", FieldDataProtoModule.IntPayload),
+        np.int64: ("longPayload", FieldDataProtoModule.LongPayload),
+    }
+    payload_name, payload_type = payload_types[solution_variable_data.dtype.type]
+    max_array_size = (
+        _FieldDataConstants.chunk_size // solution_variable_data.dtype.itemsize
+    )
+    for start in range(0, solution_variable_data.size, max_array_size):
+        yield SvarProtoModule.SetSvarDataRequest(
+            payload=SvarProtoModule.Payload(
+                **{
+                    payload_name: payload_type(
+                        payload=solution_variable_data[start : start + max_array_size]
+                    )
+                }
+            )
+        )
+
+
 class SolutionVariableData:
     """Provides access to Fluent SVAR data on zones.
 
@@ -520,13 +600,16 @@ class SolutionVariableData:
     class Data:
         """Solution variable data."""
 
-        def __init__(self, domain_name, zone_id_name_map, solution_variable_data):
+        def __init__(
+            self, domain_name, zone_id_name_map, solution_variable_data, array=None
+        ):
             """Initialize Data."""
             self._domain_name = domain_name
             self._data = {
                 zone_id_name_map[zone_id]: zone_data
                 for zone_id, zone_data in solution_variable_data.items()
             }
+            self._array = array
 
         @property
         def domain(self):
@@ -552,6 +635,21 @@ class SolutionVariableData:
             """Solution variable data."""
             return self._data
 
+        @property
+        def array(self) -> np.ndarray:
+            """Solution variable data of all zones as a single contiguous array.
+
+            The per-zone arrays are views into this array, in the order of
+            ``zone_names``.
+            """
+            if self._array is None:
+                self._array = (
+                    np.concatenate(list(self._data.values()))
+                    if self._data
+                    else np.empty(0)
+                )
+            return self._array
+
         def __getitem__(self, name):
             return self._data.get(name, None)
 
@@ -628,28 +726,114 @@ class SolutionVariableData:
             Object containing SVAR data.
         """
         self._update_solution_variable_info()
-        svars_request = SvarProtoModule.GetSvarDataRequest(
-            provideBytesStream=_FieldDataConstants.bytes_stream,
-            chunkSize=_FieldDataConstants.chunk_size,
-        )
-        svars_request.domainId = self._allowed_domain_names.valid_name(domain_name)
-        svars_request.name = self._allowed_solution_variable_names.valid_name(
+        domain_id = self._allowed_domain_names.valid_name(domain_name)
+        variable_name = self._allowed_solution_variable_names.valid_name(
             variable_name,
             zone_names,
             domain_name,
         )
-        zone_id_name_map = {}
-        for zone_name in zone_names:
-            zone_id = self._allowed_zone_names.valid_name(zone_name)
-            zone_id_name_map[zone_id] = zone_name
-            svars_request.zones.append(zone_id)
+        zone_id_name_map = self._get_zone_id_name_map(zone_names)
+        return self._get_data(variable_name, domain_name, domain_id, zone_id_name_map)
+
+    def _get_zone_id_name_map(self, zone_names: List[str]) -> Dict[int, str]:
+        return {
+            self._allowed_zone_names.valid_name(zone_name): zone_name
+            for zone_name in zone_names
+        }
+
+    def _get_data(
+        self,
+        variable_name: str,
+        domain_name: str,
+        domain_id: int,
+        zone_id_name_map: Dict[int, str],
+    ) -> Data:
+        # The arguments are already validated.
+        svars_request = SvarProtoModule.GetSvarDataRequest(
+            provideBytesStream=_FieldDataConstants.bytes_stream,
+            chunkSize=_FieldDataConstants.chunk_size,
+        )
+        svars_request.domainId = domain_id
+        svars_request.name = variable_name
+        svars_request.zones.extend(zone_id_name_map)
 
+        # Preallocate a contiguous array for all zones, from the cached zones
+        # and solution variables information, and decode each zone into a view.
+        zones_info = self._solution_variable_info.get_zones_info()
+        variable_info = self._solution_variable_info.get_variables_info(
+            zone_names=list(zone_id_name_map.values()), domain_name=domain_name
+        )[variable_name]
+        sizes = [
+            zones_info[zone_name].count * variable_info.dimension
+            for zone_name in zone_id_name_map.values()
+        ]
+        array = np.empty(sum(sizes), dtype=variable_info.field_type)
+        zone_arrays = dict(
+            zip(zone_id_name_map, np.split(array, np.cumsum(sizes)[:-1]))
+        )
+        solution_variable_data = extract_svars(
+            self._service.get_data(svars_request), zone_arrays
+        )
+        solution_variable_data = {
+            zone_id: solution_variable_data[zone_id]
+            for zone_id in zone_id_name_map
+            if zone_id in solution_variable_data
+        }
+        is_contiguous = len(solution_variable_data) == len(zone_arrays) and all(
+            zone_data is zone_arrays[zone_id]
+            for zone_id, zone_data in solution_variable_data.items()
+        )
         return SolutionVariableData.Data(
             domain_name,
             zone_id_name_map,
-            extract_svars(self._service.get_data(svars_request)),
+            solution_variable_data,
+            array if is_contiguous else None,
         )
 
+    def get_multiple_data(
+        self,
+        variable_names: List[str],
+        zone_names: List[str],
+        domain_name: str | None = "mixture",
+    ) -> Dict[str, Data]:
+        """Get data of multiple solution variables on zones.
+
+        The domain and zone names are validated once, and all the solution variable
+        names are validated before any data is requested. The data of each solution
+        variable is returned as a contiguous array with per-zone views.
+
+        Parameters
+        ----------
+        variable_names : List[str]
+            Names of the solution variables.
+        zone_names: List[str]
+            Zone names list for solution variable data.
+        domain_name : str, optional
+            Domain name. The default is ``mixture``.
+
+        Returns
+        -------
+        Dict[str, SolutionVariableData.Data]
+            Object containing SVAR data for each solution variable.
+        """
+        self._update_solution_variable_info()
+        domain_id = self._allowed_domain_names.valid_name(domain_name)
+        variable_names = [
+            self._allowed_solution_variable_names.valid_name(
+                variable_name,
+                zone_names,
+                domain_name,
+            )
+            for variable_name in variable_names
+        ]
+        zone_id_name_map = self._get_zone_id_name_map(zone_names)
+        return {
+            variable_name: self._get_data(
+                variable_name, domain_name, domain_id, zone_id_name_map
+            )
+            for variable_name in variable_names
+        }
+
     def get_svar_data(
         self,
         variable_name: str,
@@ -696,74 +880,23 @@ class SolutionVariableData:
         }
 
         def generate_set_data_requests():
-            set_data_requests = []
-
-            set_data_requests.append(
-                SvarProtoModule.SetSvarDataRequest(
-                    header=SvarProtoModule.SvarHeader(
-                        name=variable_name, domainId=domain_id
-                    )
+            yield SvarProtoModule.SetSvarDataRequest(
+                header=SvarProtoModule.SvarHeader(
+                    name=variable_name, domainId=domain_id
                 )
             )
-
             for zone_id, solution_variable_data in zone_ids_to_svar_data.items():
-                max_array_size = (
-                    _FieldDataConstants.chunk_size
-                    / np.dtype(solution_variable_data.dtype).itemsize
-                )
-                solution_variable_data_list = np.array_split(
-                    solution_variable_data,
-                    math.ceil(solution_variable_data.size / max_array_size),
-                )
-                set_data_requests.append(
-                    SvarProtoModule.SetSvarDataRequest(
-                        payloadInfo=SvarProtoModule.Info(
-                            fieldType=_FieldDataConstants.np_data_type_to_proto_field_type[
-                                solution_variable_data.dtype.type
-                            ],
-                            fieldSize=solution_variable_data.size,
-                            zone=zone_id,
-                        )
+                solution_variable_data = np.ascontiguousarray(solution_variable_data)
+                yield SvarProtoModule.SetSvarDataRequest(
+                    payloadInfo=SvarProtoModule.Info(
+                        fieldType=_FieldDataConstants.np_data_type_to_proto_field_type[
+                            solution_variable_data.dtype.type
+                        ],
+                        fieldSize=solution_variable_data.size,
+                        zone=zone_id,
                     )
                 )
-                set_data_requests += [
-                    SvarProtoModule.SetSvarDataRequest(
-                        payload=(
-                            SvarProtoModule.Payload(
-                                floatPayload=FieldDataProtoModule.FloatPayload(
-                                    payload=solution_variable_data
-                                )
-                            )
-                            if solution_variable_data.dtype.type == np.float32
-                            else (
-                                SvarProtoModule.Payload(
-                                    doublePayload=FieldDataProtoModule.DoublePayload(
-                                        payload=solution_variable_data
-                                    )
-                                )
-                                if solution_variable_data.dtype.type == np.float64
-                                else (
-                                    SvarProtoModule.Payload(
-                                        intPayload=FieldDataProtoModule.IntPayload(
-                                            payload=solution_variable_data
-                                        )
-                                    )
-                                    if solution_variable_data.dtype.type == np.int32
-                                    else SvarProtoModule.Payload(
-                                        longPayload=FieldDataProtoModule.LongPayload(
-                                            payload=solution_variable_data
-                                        )
-                                    )
-                                )
-                            )
-                        )
-                    )
-                    for solution_variable_data in solution_variable_data_list
-                    if solution_variable_data.size > 0
-                ]
-
-            for set_data_request in set_data_requests:
-                yield set_data_request
+                yield from _generate_payload_requests(solution_variable_data)
 
         self._service.set_data(generate_set_data_requests())
 
@@ -23,6 +23,7 @@
 """Module containing class encapsulating Fluent connection and the Base Session."""
 
 from enum import Enum
+import functools
 import json
 import logging
 from typing import Any, Callable, Dict
@@ -39,18 +40,36 @@ from ansys.fluent.core.pyfluent_warnings import (
 )
 from ansys.fluent.core.services import service_creator
 from ansys.fluent.core.services.app_utilities import AppUtilitiesOld
-from ansys.fluent.core.services.field_data import FieldDataService, ZoneInfo
+from ansys.fluent.core.services.field_data import (
+    AsyncFieldDataService,
+    FieldDataService,
+    ZoneInfo,
+)
 from ansys.fluent.core.services.scheme_eval import SchemeEval
+from ansys.fluent.core.services.settings import AsyncSettingsService
 from ansys.fluent.core.streaming_services.datamodel_event_streaming import (
     DatamodelEvents,
 )
-from ansys.fluent.core.streaming_services.events_streaming import EventsManager
+from ansys.fluent.core.streaming_services.events_streaming import (
+    EventsManager,
+    MeshingEvent,
+    SolverEvent,
+)
 from ansys.fluent.core.streaming_services.field_data_streaming import FieldDataStreaming
 from ansys.fluent.core.streaming_services.transcript_streaming import Transcript
 from ansys.fluent.core.utils.fluent_version import FluentVersion
 
 from .rpvars import RPVars
 
+_TUI_MENUS_CHANGING_EVENTS = (
+    SolverEvent.CASE_LOADED,
+    SolverEvent.DATA_LOADED,
+    SolverEvent.SOLUTION_INITIALIZED,
+    SolverEvent.SETTINGS_CLEARED,
+    MeshingEvent.CASE_LOADED,
+    MeshingEvent.SETTINGS_CLEARED,
+)
+
 try:
     from ansys.fluent.core.solver.settings import root
 except Exception:
@@ -171,7 +190,6 @@ class BaseSession:
         self._launcher_args = launcher_args
         self._error_state = fluent_connection._error_state
         self.scheme = scheme_eval
-        self.rp_vars = RPVars(self.scheme.string_eval)
         self._preferences = None
 
         self._transcript_service = service_creator("transcript").create(
@@ -220,9 +238,16 @@ class BaseSession:
             self.events.start()
         else:
             self.events = None
+        self.rp_vars = RPVars(self.scheme.string_eval, self.events)
+        if self.events:
+            self._register_tui_cache_callbacks()
 
         self._field_data_service = self._fluent_connection.create_grpc_service(
-            FieldDataService, self._error_state
+            FieldDataService,
+            self._error_state,
+            functools.partial(
+                fluent_connection.create_grpc_aio_service, AsyncFieldDataService
+            ),
         )
 
         self.fields = Fields(self, get_zones_info)
@@ -233,8 +258,23 @@ class BaseSession:
             self._app_utilities,
             self.scheme,
             self._error_state,
+            create_aio_service=functools.partial(
+                fluent_connection.create_grpc_aio_service, AsyncSettingsService
+            ),
         )
 
+        from ansys.fluent.core.solver import flobject
+
+        # TUI and Scheme commands can create, rename or delete settings objects
+        # without the settings objects knowing about it.
+        settings_change_tracker = flobject._get_settings_change_tracker(
+            self._settings_service
+        )
+        self._datamodel_service_tui._command_callbacks.append(
+            settings_change_tracker.all_changed
+        )
+        self.scheme._command_callbacks.append(settings_change_tracker.all_changed)
+
         self._health_check = fluent_connection._health_check
         self.connection_properties = fluent_connection.connection_properties
 
@@ -244,6 +284,13 @@ class BaseSession:
         for obj in filter(None, (self._datamodel_events, self.transcript, self.events)):
             self._fluent_connection.register_finalizer_cb(obj.stop)
 
+    def _register_tui_cache_callbacks(self) -> None:
+        # Runtime TUI menus may change when a case is loaded or the solver state is
+        # reset, so the cached child names of the menus are discarded then.
+        self.events.register_weak_callback(
+            _TUI_MENUS_CHANGING_EVENTS, self._datamodel_service_tui.clear_cache
+        )
+
     def is_server_healthy(self) -> bool:
         """Whether the current session is healthy (i.e. The server is 'SERVING')."""
         return self._health_check.is_serving
@@ -493,6 +540,16 @@ class BaseSession:
         return self._app_utilities.is_beta_enabled()
 
 
+_FIELD_INFO_INVALIDATING_EVENTS = (
+    SolverEvent.CASE_LOADED,
+    SolverEvent.DATA_LOADED,
+    SolverEvent.SOLUTION_INITIALIZED,
+    SolverEvent.SETTINGS_CLEARED,
+    MeshingEvent.CASE_LOADED,
+    MeshingEvent.SETTINGS_CLEARED,
+)
+
+
 class Fields:
     """Container for field and solution variables."""
 
@@ -515,6 +572,7 @@ class Fields:
             self._is_solution_data_valid,
             _session.scheme,
             get_zones_info,
+            events=_session.events,
         )
         self.field_data_streaming = FieldDataStreaming(
             _session._fluent_connection._id, _session._field_data_service
@@ -525,6 +583,11 @@ class Fields:
             self._is_solution_data_valid,
             _session.scheme,
         )
+        if _session.events is not None:
+            # The surfaces and fields information is cached until these events.
+            _session.events.register_weak_callback(
+                _FIELD_INFO_INVALIDATING_EVENTS, self._field_info.clear_cache
+            )
 
     @property
     @deprecated(version="0.34.0", reason="Use relevant ``field_data`` methods..")
@@ -154,6 +154,22 @@ class Solver(BaseSession):
         else:
             self.fields.reduction = reduction_old
         self.fields.solution_variable_data = self._solution_variable_data()
+        self.events.register_callback(
+            (
+                SolverEvent.CASE_LOADED,
+                SolverEvent.DATA_LOADED,
+                SolverEvent.SOLUTION_INITIALIZED,
+                SolverEvent.SETTINGS_CLEARED,
+            ),
+            lambda session, event_info: session.fields.solution_variable_info.clear_cache(),
+        )
+        # Settings objects keep local indices of object names until these events.
+        self.events.register_callback(
+            (SolverEvent.CASE_LOADED, SolverEvent.SETTINGS_CLEARED),
+            lambda session, event_info: flobject._get_settings_change_tracker(
+                session._settings_service
+            ).all_changed(),
+        )
 
         monitors_service = service_creator("monitors").create(
             fluent_connection._channel, fluent_connection._metadata, self._error_state
@@ -165,7 +181,7 @@ class Solver(BaseSession):
             self.monitors.refresh,
         )
 
-        fluent_connection.register_finalizer_cb(self.monitors.stop)
+        fluent_connection.register_finalizer_cb(self.monitors.close)
 
         # Background sessions should be finalized before finalizing the
         # gRPC services of the main session.
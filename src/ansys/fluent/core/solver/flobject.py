@@ -267,6 +267,54 @@ def _is_deprecated(obj) -> bool | None:
     )
 
 
+class _SettingsChangeTracker:
+    """Tracks the settings paths which have been changed through a proxy.
+
+    ``NamedObject`` uses it to decide whether its local index of child names can
+    still be used. A change at a path affects the path and all its descendants.
+    """
+
+    def __init__(self):
+        self.generation = 0
+        self._all_changed_generation = 0
+        self._path_generations = {}
+
+    def path_changed(self, path: str) -> None:
+        """Record a change of the settings at the path."""
+        self.generation += 1
+        self._path_generations[path] = self.generation
+
+    def all_changed(self) -> None:
+        """Record a change which can affect any settings path."""
+        self.generation += 1
+        self._all_changed_generation = self.generation
+
+    def changed_since(self, path: str, generation: int) -> bool:
+        """Whether the settings at the path may have changed since the generation."""
+        if self._all_changed_generation > generation:
+            return True
+        path_generations = self._path_generations
+        if path_generations.get("", 0) > generation:
+            return True
+        index = path.find("/")
+        while index != -1:
+            if path_generations.get(path[:index], 0) > generation:
+                return True
+            index = path.find("/", index + 1)
+        return path_generations.get(path, 0) > generation
+
+
+_settings_change_trackers = weakref.WeakKeyDictionary()
+
+
+def _get_settings_change_tracker(flproxy) -> _SettingsChangeTracker:
+    """Get the change tracker shared by all settings objects using the proxy."""
+    tracker = _settings_change_trackers.get(flproxy)
+    if tracker is None:
+        tracker = _settings_change_trackers[flproxy] = _SettingsChangeTracker()
+    return tracker
+
+
 class Base:
     """Provides the base class for settings and command objects.
 
@@ -323,6 +371,12 @@ class Base:
             return self._parent.flproxy
         return self._flproxy
 
+    def _settings_changed(self, path: str | None = None):
+        """Record a change of the settings at the path, which defaults to own path."""
+        _get_settings_change_tracker(self.flproxy).path_changed(
+            self.path if path is None else path
+        )
+
     @property
     def _file_transfer_handler(self):
         """Remote file handler.
@@ -423,7 +477,28 @@ class Base:
         InactiveObjectError
             If any attribute other than ``"active?`` is queried when the object is not active.
         """
-        attrs = self.get_attrs([attr])
+        return self._get_attr_from_attrs(
+            self.get_attrs([attr]), attr, attr_type_or_types
+        )
+
+    async def get_attr_async(
+        self,
+        attr: str,
+        attr_type_or_types: type | Tuple[type] | None = None,
+    ) -> Any:
+        """Get the requested attribute for the object without blocking the event
+        loop.
+
+        This requires a running asyncio event loop. The parameters are the same as
+        in ``get_attr``.
+        """
+        return self._get_attr_from_attrs(
+            await self.flproxy.aio.get_attrs(self.path, [attr]),
+            attr,
+            attr_type_or_types,
+        )
+
+    def _get_attr_from_attrs(self, attrs, attr, attr_type_or_types):
         if attrs:
             attrs = attrs.get("attrs", attrs)
         if attr != "active?" and attrs and attrs.get("active?", True) is False:
@@ -449,6 +524,11 @@ class Base:
         attr = self.get_attr(_InlineConstants.is_active)
         return False if attr is False else True
 
+    async def is_active_async(self) -> bool:
+        """Whether the object is active, without blocking the event loop."""
+        attr = await self.get_attr_async(_InlineConstants.is_active)
+        return False if attr is False else True
+
     def is_read_only(self) -> bool:
         """Whether the object is read-only."""
         attr = self.get_attr(_InlineConstants.is_read_only)
@@ -599,11 +679,20 @@ class RealNumerical(Numerical):
         Get the units string.
     """
 
+    # Quantity type recorded from the static info, e.g. by the codegen.
+    _units_quantity: str | None = None
+
+    def _get_units_quantity(self) -> str | None:
+        quantity = self._units_quantity
+        if quantity is None:
+            quantity = self.get_attr("units-quantity")
+        return quantity
+
     def as_quantity(self) -> QuantityT | None:
         """Get the state of the object as an ansys.units.Quantity."""
         error = None
         if not error:
-            quantity = self.get_attr("units-quantity")
+            quantity = self._get_units_quantity()
             units = get_si_unit_for_fluent_quantity(quantity)
             if units is not None:
                 try:
@@ -635,10 +724,33 @@ class RealNumerical(Numerical):
             happen if the quantity attribute specifies an unsupported quantity, or if
             the units specified for the quantity are not supported.
         """
+        return self.base_set_state(state=self._to_state_in_units(state), **kwargs)
+
+    async def set_state_async(self, state: StateT | None = None, **kwargs):
+        """Set the state of the object without blocking the event loop.
+
+        The state is converted in the same way as in ``set_state``.
+        """
+        units = None
+        if isinstance(state, (ansys.units.Quantity, tuple)):
+            try:
+                quantity = self._units_quantity
+                if quantity is None:
+                    quantity = await self.get_attr_async("units-quantity")
+                units = get_si_unit_for_fluent_quantity(quantity)
+            except Exception as ex:
+                raise UnhandledQuantity(self.path, state) from ex
+        return await self.base_set_state_async(
+            state=self._to_state_in_units(state, lambda: units), **kwargs
+        )
+
+    def _to_state_in_units(
+        self, state: StateT | None, get_units_str: Callable[[], str | None] = None
+    ):
         try:
 
             def get_units():
-                units = self.units()
+                units = (get_units_str or self.units)()
                 if units is None:
                     raise UnhandledQuantity(self.path, state)
                 return units
@@ -655,13 +767,11 @@ class RealNumerical(Numerical):
                     raise UnhandledQuantity(self.path, state)
         except Exception as ex:
             raise UnhandledQuantity(self.path, state) from ex
-
-        return self.base_set_state(state=state, **kwargs)
+        return state
 
     def units(self) -> str | None:
         """Get the physical units of the object as a string."""
-        quantity = self.get_attr("units-quantity")
-        return get_si_unit_for_fluent_quantity(quantity)
+        return get_si_unit_for_fluent_quantity(self._get_units_quantity())
 
 
 class Textual(Property):
@@ -679,6 +789,15 @@ class Textual(Property):
         """
         return self.base_set_state(state=_to_field_name_str(state), **kwargs)
 
+    async def set_state_async(self, state: StateT | None = None, **kwargs):
+        """Set the state of the object without blocking the event loop.
+
+        The state is converted in the same way as in ``set_state``.
+        """
+        return await self.base_set_state_async(
+            state=_to_field_name_str(state), **kwargs
+        )
+
 
 class DeprecatedSettingWarning(PyFluentDeprecationWarning):
     """Provides deprecated settings warning."""
@@ -758,6 +877,39 @@ class _Alias:
         return self._print_newer_api()
 
 
+_NO_STATE_DIFF = object()
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _get_state_diff(old_state, new_state):
+    """Get the part of a state which differs from the current state.
+
+    The dictionaries are compared key by key, as setting a dictionary only sets the
+    given keys. Other values, including lists, are set entirely if they differ.
+    Numbers are compared by value, so that ``1`` and ``1.0`` do not differ.
+    ``_NO_STATE_DIFF`` is returned if nothing differs.
+    """
+    if isinstance(new_state, dict) and isinstance(old_state, dict):
+        diff = {}
+        for key, value in new_state.items():
+            if key not in old_state:
+                diff[key] = value
+            else:
+                value_diff = _get_state_diff(old_state[key], value)
+                if value_diff is not _NO_STATE_DIFF:
+                    diff[key] = value_diff
+        return diff if diff else _NO_STATE_DIFF
+    if (
+        type(new_state) is type(old_state)
+        or (_is_number(new_state) and _is_number(old_state))
+    ) and new_state == old_state:
+        return _NO_STATE_DIFF
+    return new_state
+
+
 def _create_child(cls, name, parent: weakref.CallableProxyType, alias_path=None):
     if alias_path or isinstance(parent, _Alias):
         bases = (cls,)
@@ -812,22 +964,149 @@ class SettingsBase(Base, Generic[StateT]):
         """Get the state of the object."""
         return self.to_python_keys(self.flproxy.get_var(self.path))
 
-    def set_state(self, state: StateT | None = None, **kwargs):
-        """Set the state of the object."""
+    def set_state(
+        self,
+        state: StateT | None = None,
+        *,
+        diff: bool = False,
+        recheck: bool = False,
+        **kwargs,
+    ):
+        """Set the state of the object.
+
+        Parameters
+        ----------
+        state
+            State of the object.
+        diff : bool, optional
+            Whether to compare the state with the current state in Fluent and set
+            only the values which differ. The changed values are set in a single
+            request, in the order given in the state. The default is ``False``.
+        recheck : bool, optional
+            Whether to compare the state once more after the changed values have
+            been set, as setting a value can change other values, and to set the
+            values which still differ again. A warning is issued for the values
+            which differ after that. This reads the state of the object twice more
+            and is only used if ``diff`` is ``True``. The default is ``False``.
+        kwargs : Any
+            Keyword arguments.
+        """
         with self._while_setting_state():
             if isinstance(state, (tuple, ansys.units.Quantity)) and hasattr(
                 self, "value"
             ):
-                self.value.set_state(state, **kwargs)
+                self.value.set_state(state, diff=diff, recheck=recheck, **kwargs)
             else:
-                self.flproxy.set_var(
-                    self.path,
-                    self.to_scheme_keys(
-                        kwargs or state,
-                        self._root.__class__,
-                        _get_python_path_comps(self),
-                    ),
+                value = self.to_scheme_keys(
+                    kwargs or state,
+                    self._root.__class__,
+                    _get_python_path_comps(self),
+                )
+                if diff:
+                    self._set_state_diff(value, recheck)
+                    return
+                try:
+                    self.flproxy.set_var(self.path, value)
+                finally:
+                    self._state_changed(value)
+
+    def _set_state_diff(self, value, recheck: bool) -> None:
+        # Setting a value can change other values, e.g. enabling a model can reset
+        # its options, so with recheck the state is read again after the changed
+        # values have been set and the values which still differ are set again.
+        for _ in range(2 if recheck else 1):
+            value_diff = _get_state_diff(self.flproxy.get_var(self.path), value)
+            if value_diff is _NO_STATE_DIFF:
+                return
+            try:
+                self.flproxy.set_var(self.path, value_diff)
+            finally:
+                self._state_changed(value_diff)
+        if recheck:
+            self._warn_state_diff(
+                _get_state_diff(self.flproxy.get_var(self.path), value)
+            )
+
+    def _warn_state_diff(self, value_diff) -> None:
+        if value_diff is not _NO_STATE_DIFF:
+            warnings.warn(
+                f"Values of '{self.python_path}' still differ from the given state "
+                f"after it was set: {self.to_python_keys(value_diff)}",
+                PyFluentUserWarning,
+            )
+
+    async def get_state_async(self) -> StateT:
+        """Get the state of the object without blocking the event loop.
+
+        This requires a running asyncio event loop.
+        """
+        return self.to_python_keys(await self.flproxy.aio.get_var(self.path))
+
+    async def set_state_async(
+        self,
+        state: StateT | None = None,
+        *,
+        diff: bool = False,
+        recheck: bool = False,
+        **kwargs,
+    ):
+        """Set the state of the object without blocking the event loop.
+
+        This requires a running asyncio event loop. The parameters are the same as
+        in ``set_state``.
+        """
+        with self._while_setting_state():
+            if isinstance(state, (tuple, ansys.units.Quantity)) and hasattr(
+                self, "value"
+            ):
+                await self.value.set_state_async(
+                    state, diff=diff, recheck=recheck, **kwargs
                 )
+            else:
+                value = self.to_scheme_keys(
+                    kwargs or state,
+                    self._root.__class__,
+                    _get_python_path_comps(self),
+                )
+                if diff:
+                    await self._set_state_diff_async(value, recheck)
+                    return
+                try:
+                    await self.flproxy.aio.set_var(self.path, value)
+                finally:
+                    self._state_changed(value)
+
+    async def _set_state_diff_async(self, value, recheck: bool) -> None:
+        for _ in range(2 if recheck else 1):
+            value_diff = _get_state_diff(
+                await self.flproxy.aio.get_var(self.path), value
+            )
+            if value_diff is _NO_STATE_DIFF:
+                return
+            try:
+                await self.flproxy.aio.set_var(self.path, value_diff)
+            finally:
+                self._state_changed(value_diff)
+        if recheck:
+            self._warn_state_diff(
+                _get_state_diff(await self.flproxy.aio.get_var(self.path), value)
+            )
+
+    def _state_changed(self, value) -> None:
+        """Record a change of the state after it has been set to the value."""
+        # Renaming a child of a named object changes the child names of the named
+        # object, which must then be recorded as changed.
+        container = None
+        if isinstance(self._parent, NamedObject):
+            if isinstance(value, dict) and "name" in value:
+                container = self._parent
+        elif (
+            self.fluent_name == "name"
+            and self._parent is not None
+            and isinstance(self._parent._parent, NamedObject)
+        ):
+            container = self._parent._parent
+        self._settings_changed(None if container is None else container.path)
 
     @staticmethod
     def _print_state_helper(state, out, indent=0, indent_factor=2):
@@ -870,7 +1149,12 @@ class SettingsBase(Base, Generic[StateT]):
                         child = self[k]
                     except KeyError:
                         pass
-                child = child or getattr(self, k, None)
+                if child is None:
+                    try:
+                        # Skip the active check as the state has been returned.
+                        child = object.__getattribute__(self, k)
+                    except AttributeError:
+                        child = getattr(self, k, None)
                 if child is None:
                     raise RuntimeError(
                         "Unexpected None child {k} encountered while getting units for state."
@@ -896,6 +1180,8 @@ class Real(SettingsBase[RealType], RealNumerical):
 
     base_set_state = SettingsBase[RealType].set_state
     set_state = RealNumerical.set_state
+    base_set_state_async = SettingsBase[RealType].set_state_async
+    set_state_async = RealNumerical.set_state_async
 
     _state_type = RealType
 
@@ -907,6 +1193,8 @@ class String(SettingsBase[str], Textual):
 
     base_set_state = SettingsBase[str].set_state
     set_state = Textual.set_state
+    base_set_state_async = SettingsBase[str].set_state_async
+    set_state_async = Textual.set_state_async
 
 
 class Filename(SettingsBase[str], Textual):
@@ -972,6 +1260,8 @@ class RealList(SettingsBase[RealListType], RealNumerical):
 
     base_set_state = SettingsBase[RealListType].set_state
     set_state = RealNumerical.set_state
+    base_set_state_async = SettingsBase[RealListType].set_state_async
+    set_state_async = RealNumerical.set_state_async
 
     _state_type = RealListType
 
@@ -1229,6 +1519,10 @@ class WildcardPath(Group):
         """Path with wildcards."""
         return self._path
 
+    def _settings_changed(self, path: str | None = None):
+        # The matching paths are not known locally.
+        _get_settings_change_tracker(self.flproxy).all_changed()
+
     def __getattr__(self, name: str):
         try:
             child_settings_cls = self._settings_cls._child_classes[name]
@@ -1298,6 +1592,19 @@ class NamedObjectWildcardPath(WildcardPath):
 ChildTypeT = TypeVar("ChildTypeT")
 
 
+class _ObjectNames(tuple):
+    """Object names of a ``NamedObject`` with constant-time membership tests."""
+
+    def __new__(cls, names):
+        """Create the object names."""
+        ret = super().__new__(cls, names)
+        ret._names = frozenset(ret)
+        return ret
+
+    def __contains__(self, name) -> bool:
+        return name in self._names
+
+
 class NamedObject(SettingsBase[DictStateType], Generic[ChildTypeT]):
     """A ``NamedObject`` container is a container object similar to a Python dictionary
     object. Generally, many such objects can be created with different names.
@@ -1308,12 +1615,16 @@ class NamedObject(SettingsBase[DictStateType], Generic[ChildTypeT]):
         Names of the commands
     """
 
-    # New objects could get inserted by other operations, so we cannot assume
-    # that the local cache in self._objects is always up-to-date
+    # New objects could get inserted by other operations, so the local index of
+    # object names is only used until a change is recorded for this object or any
+    # of its parents, or until a command is executed.
     def __init__(self, name: str | None = None, parent=None):
         """__init__ of NamedObject class."""
         super().__init__(name, parent)
         self._setattr("_objects", {})
+        self._setattr("_object_names", None)
+        self._setattr("_object_names_generation", 0)
+        self._setattr("_synced_object_names", None)
         for cmd in self.command_names:
             cls = self.__class__._child_classes[cmd]
             self._setattr(cmd, _create_child(cls, None, self))
@@ -1368,22 +1679,28 @@ class NamedObject(SettingsBase[DictStateType], Generic[ChildTypeT]):
         return ret
 
     def _update_objects(self):
-        names = self.get_object_names()
+        names = self._get_object_names()
+        if names is self._synced_object_names:
+            return
         for name in list(self._objects.keys()):
             if name not in names:
                 del self._objects[name]
         for name in names:
             if name not in self._objects:
                 self._create_child_object(name)
+        self._setattr("_synced_object_names", names)
 
     def __delitem__(self, name: str):
         with self._while_deleting():
-            self.flproxy.delete(self.path, name)
+            try:
+                self.flproxy.delete(self.path, name)
+            finally:
+                self._settings_changed()
         if name in self._objects:
             del self._objects[name]
 
     def __contains__(self, name: str):
-        return name in self.get_object_names()
+        return self._has_object(name)
 
     def __len__(self):
         return len(self.keys())
@@ -1413,12 +1730,34 @@ class NamedObject(SettingsBase[DictStateType], Generic[ChildTypeT]):
 
     def get_object_names(self):
         """Object names."""
+        generation = _get_settings_change_tracker(self.flproxy).generation
         obj_names = self.flproxy.get_object_names(self.path)
         obj_names_list = obj_names if isinstance(obj_names, list) else list(obj_names)
+        self._setattr("_object_names", _ObjectNames(obj_names_list))
+        self._setattr("_object_names_generation", generation)
         return obj_names_list
 
+    def _is_object_names_index_valid(self) -> bool:
+        return self._object_names is not None and not _get_settings_change_tracker(
+            self.flproxy
+        ).changed_since(self.path, self._object_names_generation)
+
+    def _get_object_names(self) -> _ObjectNames:
+        """Object names from the local index, which is refreshed when outdated."""
+        if not self._is_object_names_index_valid():
+            self.get_object_names()
+        return self._object_names
+
+    def _has_object(self, name: str) -> bool:
+        # Objects created by other clients of the server are not recorded by the
+        # change tracker, so the index is refreshed on a miss.
+        if self._is_object_names_index_valid():
+            if name in self._object_names:
+                return True
+        return name in self.get_object_names()
+
     def __getitem__(self, name: str) -> ChildTypeT:
-        if name not in self.get_object_names():
+        if not self._has_object(name):
             if self.flproxy.has_wildcard(name):
                 child_cls = self.__class__.child_object_type
                 # TODO: alias
@@ -1433,7 +1772,7 @@ class NamedObject(SettingsBase[DictStateType], Generic[ChildTypeT]):
                 allowed_name_error_message(
                     context=self.python_name,
                     trial_name=name,
-                    allowed_values=self.get_object_names(),
+                    allowed_values=list(self._get_object_names()),
                 )
             )
 
@@ -1535,7 +1874,10 @@ def _rename(obj: NamedObject | _Alias, new: str, old: str):
         Current name.
     """
     with obj._while_renaming():
-        obj.flproxy.rename(obj.path, new, old)
+        try:
+            obj.flproxy.rename(obj.path, new, old)
+        finally:
+            obj._settings_changed()
     if old in obj._objects:
         del obj._objects[old]
     obj._create_child_object(new)
@@ -1745,22 +2087,27 @@ class BaseCommand(Action):
                     else:
                         print("Please enter 'y[es]' or 'n[o]'.")
         with self._while_executing_command():
-            ret = self.flproxy.execute_cmd(self._parent.path, self.obj_name, **kwds)
-            if (
-                os.getenv("PYFLUENT_NO_FIX_PARAMETER_LIST_RETURN") != "1"
-                and FluentVersion(self._version) <= FluentVersion.v252
-                and self.path
-                in [
-                    "parameters/input-parameters/list",
-                    "parameters/output-parameters/list",
-                ]
-            ):
-                ret = _fix_parameter_list_return(ret)
-            return ret
+            try:
+                ret = self.flproxy.execute_cmd(self._parent.path, self.obj_name, **kwds)
+            finally:
+                # Commands can change any part of the settings.
+                _get_settings_change_tracker(self.flproxy).all_changed()
+            return self._fix_command_return(ret)
 
-    def execute_command(self, *args, **kwds):
-        """Execute command."""
-        kwds = _get_new_keywords(self, *args, **kwds)
+    def _fix_command_return(self, ret):
+        if (
+            os.getenv("PYFLUENT_NO_FIX_PARAMETER_LIST_RETURN") != "1"
+            and FluentVersion(self._version) <= FluentVersion.v252
+            and self.path
+            in [
+                "parameters/input-parameters/list",
+                "parameters/output-parameters/list",
+            ]
+        ):
+            ret = _fix_parameter_list_return(ret)
+        return ret
+
+    def _get_scheme_kwds(self, kwds):
         scmKwds = {}
         for arg, value in kwds.items():
             argument = getattr(self, arg)
@@ -1774,7 +2121,37 @@ class BaseCommand(Action):
                 argument._root.__class__,
                 _get_python_path_comps(argument),
             )
+        return scmKwds
+
+    def execute_command(self, *args, **kwds):
+        """Execute command."""
+        kwds = _get_new_keywords(self, *args, **kwds)
+        scmKwds = self._get_scheme_kwds(kwds)
         ret = self._execute_command(*args, **scmKwds)
+        return self._get_command_return(ret, kwds)
+
+    async def execute_command_async(self, *args, **kwds):
+        """Execute command without blocking the event loop.
+
+        This requires a running asyncio event loop. Commands are never confirmed
+        interactively.
+        """
+        if not await self.is_active_async():
+            raise InactiveObjectError(self.python_path)
+        kwds = _get_new_keywords(self, *args, **kwds)
+        scmKwds = self._get_scheme_kwds(kwds)
+        with self._while_executing_command():
+            try:
+                ret = await self.flproxy.aio.execute_cmd(
+                    self._parent.path, self.obj_name, **scmKwds
+                )
+            finally:
+                # Commands can change any part of the settings.
+                _get_settings_change_tracker(self.flproxy).all_changed()
+        ret = self._fix_command_return(ret)
+        return self._get_command_return(ret, kwds)
+
+    def _get_command_return(self, ret, kwds):
         for arg, value in kwds.items():
             argument = getattr(self, arg)
             argument.after_execute(
@@ -1974,7 +2351,7 @@ class CreatableNamedObjectMixin(collections.abc.MutableMapping, Generic[ChildTyp
     """Provides creatable named objects for Fluent 2025 R1 and later."""
 
     def __setitem__(self, name: str, value):
-        if name not in self.get_object_names():
+        if not self._has_object(name):
             if self.flproxy.has_wildcard(name):
                 child = WildcardPath(
                     self.flproxy,
@@ -1985,7 +2362,10 @@ class CreatableNamedObjectMixin(collections.abc.MutableMapping, Generic[ChildTyp
                 )
             else:
                 with self._while_creating():
-                    self.flproxy.create(self.path, name)
+                    try:
+                        self.flproxy.create(self.path, name)
+                    finally:
+                        self._settings_changed()
                 child = self._create_child_object(name)
         else:
             child = self._objects.get(name)
@@ -2012,7 +2392,10 @@ class CreatableNamedObjectMixinOld(CreatableNamedObjectMixin):
             Object that has been created.
         """
         with self._while_creating():
-            self.flproxy.create(self.path, name)
+            try:
+                self.flproxy.create(self.path, name)
+            finally:
+                self._settings_changed()
         return self._create_child_object(name)
 
 
@@ -2020,7 +2403,7 @@ class _NonCreatableNamedObjectMixin(
     collections.abc.MutableMapping, Generic[ChildTypeT]
 ):
     def __setitem__(self, name: str, value):
-        if name not in self.get_object_names():
+        if not self._has_object(name):
             if self.flproxy.has_wildcard(name):
                 child = WildcardPath(
                     self.flproxy,
@@ -2034,7 +2417,7 @@ class _NonCreatableNamedObjectMixin(
                     allowed_name_error_message(
                         context=self.python_name,
                         trial_name=name,
-                        allowed_values=self.get_object_names(),
+                        allowed_values=list(self._get_object_names()),
                     )
                 )
         else:
@@ -2172,6 +2555,10 @@ def get_cls(name, info, parent=None, version=None, parent_taboo=None):
         else:
             cls._deprecated_version = ""
 
+        units_quantity = info.get("units-quantity") or info.get("units_quantity")
+        if units_quantity and issubclass(cls, RealNumerical):
+            cls._units_quantity = units_quantity
+
         taboo = set(dir(cls))
         taboo |= set(
             [
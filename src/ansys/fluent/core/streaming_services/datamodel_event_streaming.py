@@ -69,9 +69,12 @@ class DatamodelEvents(StreamingService):
         while True:
             try:
                 response: DataModelProtoModule.EventResponse = next(responses)
-                if os.getenv("PYFLUENT_HIDE_LOG_SECRETS") != "1":
+                if network_logger.isEnabledFor(logging.DEBUG) and (
+                    os.getenv("PYFLUENT_HIDE_LOG_SECRETS") != "1"
+                ):
                     network_logger.debug(
-                        f"GRPC_TRACE: RPC = /grpcRemoting.DataModel/BeginEventStreaming, response = {MessageToDict(response)}"
+                        "GRPC_TRACE: RPC = /grpcRemoting.DataModel/BeginEventStreaming, response = %s",
+                        MessageToDict(response),
                     )
                 with self._lock:
                     self._streaming = True
@@ -23,16 +23,48 @@
 """Provides a module for datamodel streaming."""
 
 import logging
+from typing import Callable, Dict, List
 
 from google.protobuf.json_format import MessageToDict
 
 from ansys.api.fluent.v0 import datamodel_se_pb2
+from ansys.api.fluent.v0.variant_pb2 import Variant
 import ansys.fluent.core as pyfluent
 from ansys.fluent.core.streaming_services.streaming import StreamingService
 
 network_logger: logging.Logger = logging.getLogger("pyfluent.networking")
 
 
+def _get_path_components(path: str) -> List[str]:
+    return [comp for comp in path.split("/") if comp]
+
+
+def _is_in_state(state: Variant, path_comps: List[str]) -> bool:
+    """Check whether a streamed state changes the datamodel at or below a path."""
+    for comp in path_comps:
+        if state.WhichOneof("as") is None:
+            # An unset state, as in a response which only deletes paths.
+            return False
+        if not state.HasField("variant_map_state"):
+            # The state replaces the whole value of an ancestor of the path.
+            return True
+        items = state.variant_map_state.item
+        if comp not in items:
+            return False
+        state = items[comp]
+    return True
+
+
+def _is_deleted(deleted_paths: List[str], path_comps: List[str]) -> bool:
+    """Check whether any deleted path is an ancestor or a descendant of a path."""
+    for deleted_path in deleted_paths:
+        deleted_comps = _get_path_components(deleted_path)
+        n_comps = min(len(deleted_comps), len(path_comps))
+        if deleted_comps[:n_comps] == path_comps[:n_comps]:
+            return True
+    return False
+
+
 class DatamodelStream(StreamingService):
     """Encapsulates a datamodel streaming service."""
 
@@ -43,6 +75,53 @@ class DatamodelStream(StreamingService):
             target=DatamodelStream._process_streaming,
             streaming_service=service,
         )
+        self._path_filters: Dict[str, List[str]] = {}
+
+    def register_callback(
+        self, callback: Callable, *args, path_prefix: str | None = None, **kwargs
+    ) -> str:
+        """Register the callback.
+
+        The callback is called with the ``state`` and the ``deleted_paths`` keyword
+        arguments for every streamed change of the datamodel.
+
+        Parameters
+        ----------
+        callback : Callable
+            Callback to register.
+        path_prefix : str, optional
+            If specified, the callback is called only for the changes which set or
+            delete objects at or below this path, for example
+            ``"/TaskObject:TaskObject1"``. The path uses the internal names of the
+            objects. The Fluent streaming request has no path filter, so the changes
+            are filtered in the client.
+        args : Any
+            Arguments.
+        kwargs : Any
+            Keyword arguments.
+
+        Returns
+        -------
+        str
+            Registered callback ID.
+        """
+        with self._lock:
+            callback_id = super().register_callback(callback, *args, **kwargs)
+            if path_prefix:
+                self._path_filters[callback_id] = _get_path_components(path_prefix)
+            return callback_id
+
+    def unregister_callback(self, callback_id: str):
+        """Unregister the callback.
+
+        Parameters
+        ----------
+        callback_id : str
+            ID of the registered callback.
+        """
+        with self._lock:
+            super().unregister_callback(callback_id)
+            self._path_filters.pop(callback_id, None)
 
     def _process_streaming(
         self,
@@ -69,14 +148,27 @@ class DatamodelStream(StreamingService):
         while True:
             try:
                 response: datamodel_se_pb2.DataModelResponse = next(responses)
-                network_logger.debug(
-                    f"GRPC_TRACE: RPC = /grpcRemoting.DataModel/BeginStreaming, response = {MessageToDict(response)}"
-                )
+                if network_logger.isEnabledFor(logging.DEBUG):
+                    network_logger.debug(
+                        "GRPC_TRACE: RPC = /grpcRemoting.DataModel/BeginStreaming, response = %s",
+                        MessageToDict(response),
+                    )
+                state = response.state if hasattr(response, "state") else None
+                deleted_paths = getattr(response, "deletedpaths", None)
                 with self._lock:
                     self._streaming = True
-                    for _, cb_list in self._service_callbacks.items():
-                        state = response.state if hasattr(response, "state") else None
-                        deleted_paths = getattr(response, "deletedpaths", None)
+                    for callback_id, cb_list in self._service_callbacks.items():
+                        path_comps = self._path_filters.get(callback_id)
+                        if (
+                            path_comps
+                            and not (
+                                state is not None and _is_in_state(state, path_comps)
+                            )
+                            and not (
+                                deleted_paths and _is_deleted(deleted_paths, path_comps)
+                            )
+                        ):
+                            continue
                         cb_list[0](state=state, deleted_paths=deleted_paths)
             except StopIteration:
                 break
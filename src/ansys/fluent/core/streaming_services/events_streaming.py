@@ -29,6 +29,7 @@ import inspect
 import logging
 from typing import Callable, Generic, Literal, Sequence, Type, TypeVar
 import warnings
+import weakref
 
 from google.protobuf.json_format import MessageToDict
 
@@ -575,6 +576,43 @@ class EventsManager(Generic[TEvent]):
             )
         return cb_ids[0] if len(cb_ids) == 1 else cb_ids
 
+    def register_weak_callback(
+        self,
+        event_types: Sequence[SolverEvent | MeshingEvent],
+        method: Callable,
+        *args,
+    ) -> list[str]:
+        """Register a bound method as callback without keeping its object alive.
+
+        Parameters
+        ----------
+        event_types : Sequence[SolverEvent | MeshingEvent]
+            Events to register the method to. Events which are not supported by this
+            manager, for example solver events in a meshing session, are skipped.
+        method : Callable
+            Bound method which is called with ``args`` when one of the events is
+            received, as long as its object is alive.
+        args : Any
+            Arguments.
+
+        Returns
+        -------
+        list[str]
+            Registered callback IDs.
+        """
+        method_ref = weakref.WeakMethod(method)
+
+        def callback(session, event_info):
+            method = method_ref()
+            if method is not None:
+                method(*args)
+
+        return [
+            self._register_single_callback(event_type, callback)
+            for event_type in event_types
+            if isinstance(event_type, self._event_type)
+        ]
+
     def unregister_callback(self, callback_id: str):
         """Unregister the callback.
 
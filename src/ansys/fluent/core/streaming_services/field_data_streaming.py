@@ -22,12 +22,146 @@
 
 """Module for Field data streaming."""
 
+from collections import OrderedDict, deque
+from dataclasses import dataclass, replace
+from enum import Enum
+import logging
+import threading
 from typing import Callable, Dict, List
 
 from ansys.api.fluent.v0 import field_data_pb2 as FieldDataProtoModule
 from ansys.fluent.core.services.field_data import ChunkParser
 from ansys.fluent.core.streaming_services.streaming import StreamingService
 
+logger = logging.getLogger("pyfluent.networking")
+
+
+class FieldDataDeliveryPolicy(Enum):
+    """Enumerates the ways in which streamed fields are delivered to the callbacks.
+
+    ``INLINE`` calls the callbacks in the streaming thread, so that a slow callback
+    delays the reception of further fields. The other policies call the callbacks in
+    a separate delivery thread. ``LATEST`` keeps only the latest pending field of each
+    surface and field name. ``DROP_OLDEST`` keeps at most ``max_pending`` pending
+    fields and discards the oldest ones. ``BLOCK`` stops receiving fields while
+    ``max_pending`` fields are pending, which applies backpressure to Fluent.
+    """
+
+    INLINE = "inline"
+    LATEST = "latest"
+    DROP_OLDEST = "drop-oldest"
+    BLOCK = "block"
+
+
+@dataclass
+class FieldDataStreamingCounters:
+    """Counters of the fields received during field data streaming.
+
+    Attributes
+    ----------
+    received : int
+        Number of fields received from Fluent.
+    delivered : int
+        Number of fields delivered to the callbacks.
+    dropped : int
+        Number of fields discarded without being delivered.
+    late : int
+        Number of fields delivered while further fields were pending.
+    """
+
+    received: int = 0
+    delivered: int = 0
+    dropped: int = 0
+    late: int = 0
+
+
+class _FieldDataDelivery:
+    """Delivers the streamed fields to the callbacks according to a policy."""
+
+    def __init__(
+        self,
+        streaming: "FieldDataStreaming",
+        policy: FieldDataDeliveryPolicy,
+        max_pending: int,
+    ):
+        self._streaming = streaming
+        self._policy = policy
+        self._max_pending = max_pending
+        self.counters = FieldDataStreamingCounters()
+        self._condition = threading.Condition()
+        self._pending = (
+            OrderedDict() if policy == FieldDataDeliveryPolicy.LATEST else deque()
+        )
+        self._closed = False
+        self._thread = None
+        if policy != FieldDataDeliveryPolicy.INLINE:
+            self._thread = threading.Thread(
+                target=self._deliver_pending,
+                name="pyfluent-field-data-delivery",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def callbacks(self) -> List[List[Callable | List | Dict]]:
+        """Get the callback which receives the fields from the chunk parser."""
+        return [[self._receive, (), {}]]
+
+    def _receive(self, surface_id, field_name, field):
+        with self._condition:
+            self.counters.received += 1
+            if self._policy == FieldDataDeliveryPolicy.INLINE:
+                self.counters.delivered += 1
+            elif self._policy == FieldDataDeliveryPolicy.LATEST:
+                key = (surface_id, field_name)
+                if key in self._pending:
+                    self.counters.dropped += 1
+                self._pending[key] = field
+            else:
+                if self._policy == FieldDataDeliveryPolicy.DROP_OLDEST:
+                    if len(self._pending) >= self._max_pending:
+                        self._pending.popleft()
+                        self.counters.dropped += 1
+                else:
+                    while len(self._pending) >= self._max_pending:
+                        self._condition.wait()
+                self._pending.append((surface_id, field_name, field))
+            self._condition.notify_all()
+        if self._policy == FieldDataDeliveryPolicy.INLINE:
+            self._deliver(surface_id, field_name, field)
+
+    def _deliver(self, surface_id, field_name, field):
+        for callback, args, kwargs in list(self._streaming.callbacks()):
+            callback(surface_id, field_name, field, *args, **kwargs)
+
+    def _deliver_pending(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                if self._policy == FieldDataDeliveryPolicy.LATEST:
+                    (surface_id, field_name), field = self._pending.popitem(last=False)
+                else:
+                    surface_id, field_name, field = self._pending.popleft()
+                self.counters.delivered += 1
+                if self._pending:
+                    self.counters.late += 1
+                self._condition.notify_all()
+            try:
+                self._deliver(surface_id, field_name, field)
+            except Exception:
+                # The delivery must go on, or the streaming thread may block.
+                logger.exception("Field data streaming callback failed.")
+
+    def close(self):
+        """Deliver the pending fields and stop the delivery thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+
 
 class FieldDataStreaming(StreamingService):
     """Class wrapping the Field gRPC streaming service of Fluent.
@@ -48,15 +182,63 @@ class FieldDataStreaming(StreamingService):
             streaming_service=service,
         )
         self._session_id: str = session_id
+        self._delivery: _FieldDataDelivery | None = None
+
+    @property
+    def counters(self) -> FieldDataStreamingCounters:
+        """Counters of the fields received since streaming was last started."""
+        if self._delivery is None:
+            return FieldDataStreamingCounters()
+        with self._delivery._condition:
+            return replace(self._delivery.counters)
+
+    def start(
+        self,
+        *args,
+        delivery_policy: FieldDataDeliveryPolicy | str = FieldDataDeliveryPolicy.INLINE,
+        max_pending: int = 64,
+        **kwargs,
+    ) -> None:
+        """Start streaming.
+
+        Parameters
+        ----------
+        delivery_policy : FieldDataDeliveryPolicy | str, optional
+            How the streamed fields are delivered to the callbacks. The default is
+            ``FieldDataDeliveryPolicy.INLINE``.
+        max_pending : int, optional
+            Maximum number of pending fields for the ``DROP_OLDEST`` and ``BLOCK``
+            policies. The default is ``64``.
+        args : Any
+            Arguments of the streaming request.
+        kwargs : Any
+            Keyword arguments of the streaming request. A ``dtype`` keyword argument
+            sets the floating-point type of the streamed fields.
+        """
+        delivery_policy = FieldDataDeliveryPolicy(delivery_policy)
+        if max_pending < 1:
+            raise ValueError(
+                f"'max_pending' must be a positive integer, got {max_pending}."
+            )
+        super().start(
+            *args, delivery_policy=delivery_policy, max_pending=max_pending, **kwargs
+        )
 
     def _process_streaming(self, id, stream_begin_method, started_evt, *args, **kwargs):
         """Processes field data streaming."""
+        dtype = kwargs.pop("dtype", None)
+        delivery = self._delivery = _FieldDataDelivery(
+            self, kwargs.pop("delivery_policy"), kwargs.pop("max_pending")
+        )
         request = FieldDataProtoModule.BeginFieldsStreamingRequest(*args, **kwargs)
-        ChunkParser(self).extract_fields(
-            self._streaming_service.begin_streaming(
-                request, started_evt, id=id, stream_begin_method=stream_begin_method
+        try:
+            ChunkParser(delivery, dtype=dtype).extract_fields(
+                self._streaming_service.begin_streaming(
+                    request, started_evt, id=id, stream_begin_method=stream_begin_method
+                )
             )
-        )
+        finally:
+            delivery.close()
 
     def callbacks(self) -> List[List[Callable | List | Dict]]:
         """Get list of callbacks along with arguments and keyword arguments."""
@@ -0,0 +1,365 @@
+# Copyright (C) 2021 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Columnar store of monitor histories in an HDF5 file."""
+
+import threading
+from typing import Dict, List, Tuple
+from urllib.parse import quote
+
+import numpy as np
+
+try:
+    import h5py
+except ModuleNotFoundError as exc:
+    raise ModuleNotFoundError(
+        "Missing dependencies, use 'pip install ansys-fluent-core[reader]' to install them."
+    ) from exc
+
+
+class MonitorStore:
+    """Columnar store of monitor histories in an HDF5 file.
+
+    Each monitor set is stored in a group, which holds an extendable dataset of the
+    x-axis values and one extendable dataset per monitor. The rows are written in
+    batches of ``batch_size`` rows, and the file is flushed after each batch. The
+    rows of a batch which is not written yet are included in the data which is
+    read. A monitor which is added to a monitor set later has NaN values for the
+    earlier rows.
+
+    When the monitors are streamed again from the start, the rows which are already
+    stored are recognized and skipped, so reopening the store of a previous client
+    resumes the history instead of duplicating it.
+
+    Parameters
+    ----------
+    file_name : str
+        Path of the HDF5 file. Data already stored in the file is kept.
+    batch_size : int, optional
+        Number of rows of a monitor set which are buffered before they are written.
+        The default is ``100``.
+    """
+
+    _CHUNK_ROWS = 4096
+
+    def __init__(self, file_name: str, batch_size: int = 100):
+        """__init__ method of MonitorStore class."""
+        self.file_name = file_name
+        self.batch_size = batch_size
+        self._file = h5py.File(file_name, "a")
+        self._lock = threading.RLock()
+        self._pending: Dict[str, List[Tuple[int, Dict[str, float]]]] = {}
+        self._replay_positions: Dict[str, int] = {}
+        self._replay_blocks: Dict[str, Tuple[int, np.ndarray, Dict]] = {}
+
+    def get_monitor_set_names(self) -> List[str]:
+        """Get the names of the stored monitor sets."""
+        with self._lock:
+            names = [group.attrs["name"] for group in self._file.values()]
+            return names + [name for name in self._pending if name not in names]
+
+    def append(
+        self,
+        monitor_set_name: str,
+        monitors: List[str],
+        xvalue: int,
+        values: List[float],
+    ) -> None:
+        """Append a row of a monitor set.
+
+        Parameters
+        ----------
+        monitor_set_name : str
+            Name of the monitor set.
+        monitors : List[str]
+            Names of the monitors.
+        xvalue : int
+            X-axis value of the row, for example the iteration.
+        values : List[float]
+            Values of the monitors.
+        """
+        row = dict(zip(monitors, values))
+        with self._lock:
+            if self._is_replayed(monitor_set_name, xvalue, row):
+                return
+            pending = self._pending.setdefault(monitor_set_name, [])
+            pending.append((xvalue, row))
+            if len(pending) >= self.batch_size:
+                self._write(monitor_set_name)
+                self._file.flush()
+
+    def begin_replay(self) -> None:
+        """Mark the start of a stream which replays the monitor histories.
+
+        The streamed rows are compared with the stored rows, and skipped as long as
+        they match.
+        """
+        with self._lock:
+            self.flush()
+            self._replay_positions = {
+                name: 0 for name in self._pending.keys() | self._get_stored_names()
+            }
+            self._replay_blocks = {}
+
+    def flush(self) -> None:
+        """Write the buffered rows to the file."""
+        with self._lock:
+            if self._file is None:
+                return
+            for monitor_set_name in list(self._pending):
+                self._write(monitor_set_name)
+            self._file.flush()
+
+    def close(self) -> None:
+        """Write the buffered rows and close the file."""
+        with self._lock:
+            if self._file is not None:
+                self.flush()
+                self._file.close()
+                self._file = None
+
+    def get_monitor_set_data(
+        self,
+        monitor_set_name: str,
+        start_index: int = 0,
+        end_index: int | None = None,
+    ) -> Tuple[np.array, Dict[str, np.array]]:
+        """Get the rows of a monitor set by position.
+
+        Parameters
+        ----------
+        monitor_set_name : str
+            Name of the monitor set.
+        start_index: int, optional
+            Start index of the rows.
+        end_index: int, optional
+            End index of the rows.
+
+        Returns
+        -------
+        Tuple[np.array, Dict[str, np.array]]
+            Tuple containing two elements: a numpy array of x-axis values and a
+            dictionary associating monitor names of type ``str`` to numpy arrays of
+            y-axis values.
+        """
+        with self._lock:
+            group = self._file.get(quote(monitor_set_name, safe=""))
+            pending = self._pending.get(monitor_set_name, [])
+            if group is None and not pending:
+                return (np.array([]), {})
+            n_stored = 0 if group is None else len(group["xvalues"])
+            start, stop, _ = slice(start_index, end_index).indices(
+                n_stored + len(pending)
+            )
+            stop = max(start, stop)
+            stored_rows = slice(min(start, n_stored), min(stop, n_stored))
+            pending = pending[max(start - n_stored, 0) : max(stop - n_stored, 0)]
+            xvalues = np.array([xvalue for xvalue, _ in pending], dtype=np.int64)
+            data = {}
+            if group is not None:
+                xvalues = np.concatenate([group["xvalues"][stored_rows], xvalues])
+                for dataset in group["monitors"].values():
+                    data[dataset.attrs["name"]] = dataset[stored_rows]
+            n_rows = len(xvalues) - len(pending)
+            for monitor_name in dict.fromkeys(
+                name for _, row in pending for name in row
+            ):
+                data.setdefault(monitor_name, np.full(n_rows, np.nan))
+            return (
+                xvalues,
+                {
+                    monitor_name: np.concatenate(
+                        [
+                            values,
+                            np.array(
+                                [row.get(monitor_name, np.nan) for _, row in pending],
+                                dtype=np.float64,
+                            ),
+                        ]
+                    )
+                    for monitor_name, values in data.items()
+                },
+            )
+
+    def get_monitor_data(
+        self,
+        monitor_set_name: str,
+        monitor_name: str,
+        start: int | None = None,
+        stop: int | None = None,
+    ) -> Tuple[np.array, np.array]:
+        """Get the values of a monitor over a range of x-axis values.
+
+        Only the x-axis values and the values of the requested monitor within the
+        range are read from the file.
+
+        Parameters
+        ----------
+        monitor_set_name : str
+            Name of the monitor set.
+        monitor_name : str
+            Name of the monitor.
+        start : int, optional
+            First x-axis value, for example an iteration, of the range.
+        stop : int, optional
+            Last x-axis value of the range.
+
+        Returns
+        -------
+        Tuple[np.array, np.array]
+            X-axis values and monitor values within the range.
+        """
+        with self._lock:
+            group = self._file.get(quote(monitor_set_name, safe=""))
+            pending = self._pending.get(monitor_set_name, [])
+            dataset = None
+            if group is not None:
+                dataset = group["monitors"].get(quote(monitor_name, safe=""))
+            if dataset is None and not any(monitor_name in row for _, row in pending):
+                raise KeyError(f"{monitor_set_name}/{monitor_name}")
+            n_stored = 0 if group is None else len(group["xvalues"])
+            xvalues = np.array([xvalue for xvalue, _ in pending], dtype=np.int64)
+            if group is not None:
+                xvalues = np.concatenate([group["xvalues"][()], xvalues])
+            in_range = np.ones(len(xvalues), dtype=bool)
+            if start is not None:
+                in_range &= xvalues >= start
+            if stop is not None:
+                in_range &= xvalues <= stop
+            rows = np.flatnonzero(in_range)
+            if not len(rows):
+                return (np.array([], dtype=xvalues.dtype), np.array([]))
+            stored_rows = rows[rows < n_stored]
+            if not len(stored_rows):
+                values = np.array([])
+            elif dataset is None:
+                values = np.full(len(stored_rows), np.nan)
+            else:
+                # Read the enclosing slice, which is much faster than a point
+                # selection.
+                start = stored_rows[0]
+                values = dataset[start : stored_rows[-1] + 1][stored_rows - start]
+            pending_values = [
+                pending[row - n_stored][1].get(monitor_name, np.nan)
+                for row in rows[rows >= n_stored]
+            ]
+            return (
+                xvalues[rows],
+                np.concatenate([values, np.array(pending_values, dtype=np.float64)]),
+            )
+
+    def _get_stored_names(self) -> set:
+        return {group.attrs["name"] for group in self._file.values()}
+
+    def _get_group(self, monitor_set_name: str):
+        group_name = quote(monitor_set_name, safe="")
+        group = self._file.get(group_name)
+        if group is None:
+            group = self._file.create_group(group_name)
+            group.attrs["name"] = monitor_set_name
+            group.create_dataset(
+                "xvalues",
+                shape=(0,),
+                maxshape=(None,),
+                dtype=np.int64,
+                chunks=(self._CHUNK_ROWS,),
+            )
+            group.create_group("monitors")
+        return group
+
+    def _write(self, monitor_set_name: str) -> None:
+        rows = self._pending.pop(monitor_set_name, None)
+        if not rows:
+            return
+        group = self._get_group(monitor_set_name)
+        xvalues = group["xvalues"]
+        n_stored = len(xvalues)
+        n_rows = n_stored + len(rows)
+        xvalues.resize((n_rows,))
+        xvalues[n_stored:] = [xvalue for xvalue, _ in rows]
+        monitors = dict.fromkeys(name for _, row in rows for name in row)
+        for monitor_name in monitors:
+            dataset_name = quote(monitor_name, safe="")
+            dataset = group["monitors"].get(dataset_name)
+            if dataset is None:
+                dataset = group["monitors"].create_dataset(
+                    dataset_name,
+                    shape=(n_stored,),
+                    maxshape=(None,),
+                    dtype=np.float64,
+                    chunks=(self._CHUNK_ROWS,),
+                    fillvalue=np.nan,
+                )
+                dataset.attrs["name"] = monitor_name
+            dataset.resize((n_rows,))
+            dataset[n_stored:] = [row.get(monitor_name, np.nan) for _, row in rows]
+        for dataset in group["monitors"].values():
+            if dataset.attrs["name"] not in monitors:
+                dataset.resize((n_rows,))
+
+    def _is_replayed(
+        self, monitor_set_name: str, xvalue: int, row: Dict[str, float]
+    ) -> bool:
+        """Check whether a streamed row matches the next stored row of a replay."""
+        position = self._replay_positions.get(monitor_set_name)
+        if position is None:
+            return False
+        stored = self._get_replay_row(monitor_set_name, position)
+        if (
+            stored is not None
+            and stored[0] == xvalue
+            and all(
+                np.array_equal(
+                    stored[1].get(name, np.nan), row.get(name, np.nan), equal_nan=True
+                )
+                for name in stored[1].keys() | row.keys()
+            )
+        ):
+            self._replay_positions[monitor_set_name] = position + 1
+            return True
+        # The history diverges from the stored one, so the later rows are new.
+        del self._replay_positions[monitor_set_name]
+        self._replay_blocks.pop(monitor_set_name, None)
+        return False
+
+    def _get_replay_row(self, monitor_set_name: str, position: int):
+        block = self._replay_blocks.get(monitor_set_name)
+        if block is None or not block[0] <= position < block[0] + len(block[1]):
+            group = self._file.get(quote(monitor_set_name, safe=""))
+            if group is None or position >= len(group["xvalues"]):
+                return None
+            rows = slice(position, position + self._CHUNK_ROWS)
+            block = (
+                position,
+                group["xvalues"][rows],
+                {
+                    dataset.attrs["name"]: dataset[rows]
+                    for dataset in group["monitors"].values()
+                },
+            )
+            self._replay_blocks[monitor_set_name] = block
+        start, xvalues, values = block
+        index = position - start
+        return (
+            xvalues[index],
+            {name: column[index] for name, column in values.items()},
+        )
@@ -59,6 +59,50 @@ class MonitorsManager(StreamingService):
         self._lock_refresh: threading.Lock = threading.Lock()
         self._monitors_info = None
         self._data_frames = {}
+        self._store = None
+        self._keep_in_memory = True
+
+    def enable_store(
+        self, file_name: str, batch_size: int = 100, keep_in_memory: bool = False
+    ):
+        """Store the monitor histories in a columnar HDF5 file.
+
+        The streamed rows are appended to the file in batches, so that the
+        histories survive the client. The monitor data is read from the file unless
+        ``keep_in_memory`` is ``True``. Rows which are already stored in the file,
+        for example by a previous client, are not stored again when the monitors
+        are streamed from the start.
+
+        Parameters
+        ----------
+        file_name : str
+            Path of the HDF5 file.
+        batch_size : int, optional
+            Number of rows of a monitor set which are written together. The default
+            is ``100``.
+        keep_in_memory : bool, optional
+            Whether to also keep the histories in memory. The default is ``False``.
+
+        Returns
+        -------
+        MonitorStore
+        """
+        from ansys.fluent.core.streaming_services.monitor_store import MonitorStore
+
+        with self._lock:
+            if self._store is not None:
+                self._store.close()
+            self._store = MonitorStore(file_name, batch_size=batch_size)
+            self._keep_in_memory = keep_in_memory
+            return self._store
+
+    def disable_store(self) -> None:
+        """Write the pending rows to the store and stop storing the histories."""
+        with self._lock:
+            if self._store is not None:
+                self._store.close()
+            self._store = None
+            self._keep_in_memory = True
 
     def get_monitor_set_names(self) -> List[str]:
         """Get monitor set names.
@@ -112,7 +156,13 @@ class MonitorsManager(StreamingService):
             is empty. Otherwise, it returns the plot object, depending on the ``plotting.backend``.
         """
         with self._lock:
-            df = self._data_frames[monitor_set_name]["df"]
+            if self._keep_in_memory:
+                df = self._data_frames[monitor_set_name]["df"]
+            else:
+                xvalues, data = self._store.get_monitor_set_data(monitor_set_name)
+                df = _pandas().DataFrame(
+                    data, index=_pandas().Index(xvalues, name="xvalues")
+                )
             return None if df.empty else df.plot(*args, **kwargs)
 
     def get_monitor_set_data(
@@ -139,6 +189,10 @@ class MonitorsManager(StreamingService):
             associating monitor names of type ``str`` to numpy arrays of y-axis values.
         """
         with self._lock:
+            if not self._keep_in_memory:
+                return self._store.get_monitor_set_data(
+                    monitor_set_name, start_index, end_index
+                )
             df_data = self._data_frames[monitor_set_name]
             try:
                 df = df_data["df"].iloc[start_index:end_index]
@@ -174,11 +228,26 @@ class MonitorsManager(StreamingService):
             self.stop()
             self.start()
 
+    def stop(self) -> None:
+        """Stop streaming, and write the pending rows to the store."""
+        super().stop()
+        with self._lock:
+            if self._store is not None:
+                self._store.flush()
+
+    def close(self) -> None:
+        """Stop streaming, and write the pending rows to the store and close it."""
+        self.stop()
+        self.disable_store()
+
     def _prepare(self):
         self._update_dataframe()
+        if self._store is not None:
+            # The stream starts with the history of the monitors.
+            self._store.begin_replay()
 
     def _populate_dataframes(self, data_received, *args, **kwargs):
-        for _, df_data in self._data_frames.items():
+        for monitor_set_name, df_data in self._data_frames.items():
             df = df_data["df"]
             monitors = df_data["monitors"]
             monitor_data = []
@@ -189,12 +258,20 @@ class MonitorsManager(StreamingService):
                 monitor_data.append(data_received[monitor_name])
 
             if monitor_data:
-                new_df = _pandas().DataFrame([monitor_data], columns=monitors)
-                new_df.set_index("xvalues", inplace=True)
-                if df.empty:
-                    df_data["df"] = new_df
-                else:
-                    df_data["df"] = _pandas().concat([df, new_df])
+                if self._store is not None:
+                    self._store.append(
+                        monitor_set_name,
+                        monitors[:-1],
+                        data_received["xvalues"],
+                        monitor_data[:-1],
+                    )
+                if self._keep_in_memory:
+                    new_df = _pandas().DataFrame([monitor_data], columns=monitors)
+                    new_df.set_index("xvalues", inplace=True)
+                    if df.empty:
+                        df_data["df"] = new_df
+                    else:
+                        df_data["df"] = _pandas().concat([df, new_df])
                 for callback_map in self._service_callbacks.values():
                     callback, args, kwargs = callback_map
                     callback(*args, **kwargs)
@@ -22,8 +22,12 @@
 
 """Provides a module for transcript streaming."""
 
+from collections import deque
+import gzip
 import os
 from pathlib import Path
+import shutil
+import threading
 
 from ansys.api.fluent.v0 import transcript_pb2 as TranscriptModule
 from ansys.fluent.core.streaming_services.streaming import StreamingService
@@ -44,6 +48,148 @@ class AppendToFile:
         self.f.close()
 
 
+class TranscriptSink:
+    """Buffered writer of the transcript, which keeps the latest transcript lines.
+
+    The transcript is written to the file when the buffered text exceeds
+    ``flush_size`` characters, or ``flush_interval`` seconds after the oldest
+    buffered text was received. If ``max_bytes`` is specified, the file is rotated
+    after it exceeds ``max_bytes``. The rotated files are named ``<file_name>.1``
+    (the most recent) to ``<file_name>.<backup_count>``, with a ``.gz`` suffix if
+    they are compressed.
+
+    Parameters
+    ----------
+    file_name : str, optional
+        File path to write the transcript to. If not specified, only the latest
+        transcript lines are kept.
+    flush_size : int, optional
+        Number of buffered characters after which the transcript is written. The
+        default is ``65536``.
+    flush_interval : float, optional
+        Maximum number of seconds for which the transcript is buffered. The default
+        is ``1.0``.
+    max_bytes : int, optional
+        Size after which the file is rotated. The file is checked when the buffered
+        transcript is written, so it can exceed this size by up to ``flush_size``
+        characters. The default is to not rotate the file.
+    backup_count : int, optional
+        Number of rotated files to keep. The default is ``5``.
+    compress : bool, optional
+        Whether to compress the rotated files with gzip. The default is ``False``.
+    tail_lines : int, optional
+        Number of latest transcript lines to keep in memory. The default is ``1000``.
+    """
+
+    def __init__(
+        self,
+        file_name: str | None = None,
+        flush_size: int = 65536,
+        flush_interval: float = 1.0,
+        max_bytes: int | None = None,
+        backup_count: int = 5,
+        compress: bool = False,
+        tail_lines: int = 1000,
+    ):
+        """__init__ method of TranscriptSink class."""
+        self._file_name = file_name
+        self._flush_size = flush_size
+        self._flush_interval = flush_interval
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._compress = compress
+        self._lines = deque(maxlen=tail_lines)
+        self._buffer = []
+        self._buffer_size = 0
+        self._lock = threading.RLock()
+        self._timer = None
+        self._file = open(file_name, "a") if file_name else None
+
+    def __call__(self, transcript: str):
+        """Receive a part of the transcript which ends with a new line."""
+        with self._lock:
+            self._lines.extend(transcript.splitlines())
+            if self._file is None:
+                return
+            self._buffer.append(transcript)
+            self._buffer_size += len(transcript)
+            if self._buffer_size >= self._flush_size:
+                self.flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self._flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def tail(self, n: int | None = None) -> list[str]:
+        """Get the latest transcript lines.
+
+        Parameters
+        ----------
+        n : int, optional
+            Number of lines. The default is all the lines kept in memory.
+
+        Returns
+        -------
+        list[str]
+            Transcript lines, without the new line characters.
+        """
+        with self._lock:
+            lines = list(self._lines)
+        return lines if n is None else lines[max(len(lines) - n, 0) :]
+
+    def flush(self) -> None:
+        """Write the buffered transcript to the file."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._file is None or not self._buffer:
+                return
+            if (
+                self._max_bytes
+                and self._file.tell()
+                and self._file.tell() + self._buffer_size > self._max_bytes
+            ):
+                self._rotate()
+            self._file.write("".join(self._buffer))
+            self._file.flush()
+            self._buffer.clear()
+            self._buffer_size = 0
+
+    def _get_backup_name(self, index: int) -> str:
+        return f"{self._file_name}.{index}" + (".gz" if self._compress else "")
+
+    def _rotate(self) -> None:
+        self._file.close()
+        if self._backup_count > 0:
+            for index in range(self._backup_count - 1, 0, -1):
+                if os.path.exists(self._get_backup_name(index)):
+                    os.replace(
+                        self._get_backup_name(index), self._get_backup_name(index + 1)
+                    )
+            if self._compress:
+                with (
+                    open(self._file_name, "rb") as f,
+                    gzip.open(self._get_backup_name(1), "wb") as backup,
+                ):
+                    shutil.copyfileobj(f, backup)
+                os.remove(self._file_name)
+            else:
+                os.replace(self._file_name, self._get_backup_name(1))
+        self._file = open(self._file_name, "w")
+
+    def close(self) -> None:
+        """Write the buffered transcript and close the file."""
+        with self._lock:
+            self.flush()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __del__(self):
+        self.close()
+
+
 class Transcript(StreamingService):
     """Encapsulates a Fluent Transcript streaming service."""
 
@@ -56,32 +202,71 @@ class Transcript(StreamingService):
         )
         self.callback_ids = []
         self._writing_transcript_to_interpreter = False
+        self._sink = None
+        self._sink_callback_id = None
 
     def start(
-        self, file_name: str | None = None, write_to_stdout: bool = False
+        self,
+        file_name: str | None = None,
+        write_to_stdout: bool = False,
+        max_bytes: int | None = None,
+        backup_count: int = 5,
+        compress: bool = False,
+        tail_lines: int = 1000,
     ) -> None:
         """Start streaming of Fluent transcript.
 
-         Parameters
+        Parameters
         ----------
         file_name: str, optional
             File path to write the transcript stream.
         write_to_stdout: bool, optional
             Flag to print transcript on the screen or not
+        max_bytes: int, optional
+            Size after which the transcript file is rotated. The default is to not
+            rotate the file.
+        backup_count: int, optional
+            Number of rotated transcript files to keep. The default is ``5``.
+        compress: bool, optional
+            Whether to compress the rotated transcript files with gzip. The default
+            is ``False``.
+        tail_lines: int, optional
+            Number of latest transcript lines kept for ``tail()``. The default is
+            ``1000``.
         """
-        if file_name:
-            if Path(file_name).exists():
-                os.remove(file_name)
-            append_to_file = AppendToFile(file_name)
-            self.callback_ids.append(
-                self.register_callback(append_to_file, keep_new_lines=True)
-            )
-            if write_to_stdout:
-                self._write_to_stdout()
-        else:
+        if file_name and Path(file_name).exists():
+            os.remove(file_name)
+        if self._sink is not None:
+            self.unregister_callback(self._sink_callback_id)
+            self._sink.close()
+        self._sink = TranscriptSink(
+            file_name,
+            max_bytes=max_bytes,
+            backup_count=backup_count,
+            compress=compress,
+            tail_lines=tail_lines,
+        )
+        self._sink_callback_id = self.register_callback(self._sink, keep_new_lines=True)
+        self.callback_ids.append(self._sink_callback_id)
+        if not file_name or write_to_stdout:
             self._write_to_stdout()
         super().start()
 
+    def tail(self, n: int | None = None) -> list[str]:
+        """Get the latest lines of the transcript.
+
+        Parameters
+        ----------
+        n : int, optional
+            Number of lines. The default is all the lines kept in memory.
+
+        Returns
+        -------
+        list[str]
+            Transcript lines, without the new line characters.
+        """
+        return self._sink.tail(n) if self._sink is not None else []
+
     def _write_to_stdout(self):
         """Write transcript to stdout."""
         if not self._writing_transcript_to_interpreter:
@@ -93,6 +278,8 @@ class Transcript(StreamingService):
         for callback_id in self.callback_ids:
             self.unregister_callback(callback_id)
         super().stop()
+        if self._sink is not None:
+            self._sink.close()
 
     def _process_streaming(self, id, stream_begin_method, started_evt, *args, **kwargs):
         """Performs processes on transcript depending on the callback functions."""
@@ -100,14 +287,19 @@ class Transcript(StreamingService):
         responses = self._streaming_service.begin_streaming(
             request, started_evt, id=id, stream_begin_method=stream_begin_method
         )
-        transcript = ""
+        # The parts of a line are joined once the line is complete.
+        parts = []
         while True:
             try:
                 response = next(responses)
                 with self._lock:
                     self._streaming = True
-                    transcript += response.transcript
-                    if transcript and transcript[-1] == "\n":
+                    if not response.transcript:
+                        continue
+                    parts.append(response.transcript)
+                    if response.transcript[-1] == "\n":
+                        transcript = "".join(parts)
+                        parts.clear()
                         for callback_map in self._service_callbacks.values():
                             if "keep_new_lines" in callback_map[-1].keys():
                                 if callback_map[-1]["keep_new_lines"]:
@@ -116,6 +308,5 @@ class Transcript(StreamingService):
                                     callback_map[0](transcript[0:-1])
                             else:
                                 callback_map[0](transcript[0:-1])
-                        transcript = ""
             except StopIteration:
                 break
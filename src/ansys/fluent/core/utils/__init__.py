@@ -22,6 +22,7 @@
 
 """Miscellaneous utility functions."""
 
+import importlib
 import importlib.util
 import logging
 from pathlib import Path
@@ -32,6 +33,51 @@ from ansys.fluent.core.search import search  # noqa: F401
 logger = logging.getLogger("pyfluent.general")
 
 
+def lazy_module_attrs(module_globals: dict, lazy_attrs: dict):
+    """Create the PEP 562 ``__getattr__`` and ``__dir__`` functions of a module.
+
+    The public objects in ``lazy_attrs`` are imported on first access and then
+    stored in the module. Other attributes are looked up as submodules.
+
+    Parameters
+    ----------
+    module_globals : dict
+        Globals of the module.
+    lazy_attrs : dict
+        Name of the module of each object, or a tuple of the module name and the
+        object name in the module.
+
+    Returns
+    -------
+    tuple
+        ``__getattr__`` and ``__dir__`` functions of the module.
+    """
+    package = module_globals["__name__"]
+
+    def __getattr__(name: str):
+        lazy_attr = lazy_attrs.get(name)
+        if lazy_attr is None:
+            try:
+                return importlib.import_module(f"{package}.{name}")
+            except ModuleNotFoundError as ex:
+                if ex.name != f"{package}.{name}":
+                    raise
+                raise AttributeError(
+                    f"module {package!r} has no attribute {name!r}"
+                ) from None
+        module_name, attr_name = (
+            lazy_attr if isinstance(lazy_attr, tuple) else (lazy_attr, name)
+        )
+        value = getattr(importlib.import_module(module_name), attr_name)
+        module_globals[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(module_globals) | set(lazy_attrs))
+
+    return __getattr__, __dir__
+
+
 def load_module(module_name, file_path):
     """Load a module from a file path."""
     spec = importlib.util.spec_from_file_location(module_name, file_path)
@@ -0,0 +1,162 @@
+# Copyright (C) 2021 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Export of field data to VTK and PyVista objects without copying the arrays."""
+
+from typing import Dict
+
+import numpy as np
+import numpy.typing as npt
+
+from ansys.fluent.core.field_data_interfaces import (
+    CSRConnectivity,
+    get_csr_connectivity,
+)
+
+
+def _vtk():
+    try:
+        from vtkmodules.util import numpy_support
+        from vtkmodules.vtkCommonCore import vtkPoints
+        from vtkmodules.vtkCommonDataModel import vtkCellArray, vtkPolyData
+    except ModuleNotFoundError as exc:
+        raise ModuleNotFoundError(
+            "Missing dependencies, use 'pip install vtk' to install them."
+        ) from exc
+    return numpy_support, vtkPoints, vtkCellArray, vtkPolyData
+
+
+def to_vtk_polydata(
+    vertices: npt.NDArray,
+    connectivity: CSRConnectivity | npt.NDArray,
+    point_data: Dict[str, npt.NDArray] | None = None,
+    cell_data: Dict[str, npt.NDArray] | None = None,
+):
+    """Create VTK polydata from surface data.
+
+    The VTK arrays share the memory of the given arrays where possible, which requires
+    C-contiguous arrays and, for the connectivity, the integer type of VTK ids
+    (usually ``int64``). Other arrays are converted once.
+
+    Parameters
+    ----------
+    vertices : numpy.ndarray
+        Vertex coordinates, either flat or with shape ``(n, 3)``.
+    connectivity : CSRConnectivity | numpy.ndarray
+        Faces connectivity, either in CSR format or in the flat format.
+    point_data : Dict[str, numpy.ndarray], optional
+        Field arrays defined at the vertices.
+    cell_data : Dict[str, numpy.ndarray], optional
+        Field arrays defined at the faces.
+
+    Returns
+    -------
+    vtkPolyData
+        VTK polydata referencing the arrays.
+
+    Raises
+    ------
+    ModuleNotFoundError
+        If VTK is not installed.
+
+    Examples
+    --------
+    >>> request = SurfaceFieldDataRequest(
+    >>>     data_types=[SurfaceDataType.Vertices, SurfaceDataType.FacesConnectivity],
+    >>>     surfaces=["inlet"],
+    >>>     csr_connectivity=True,
+    >>> )
+    >>> data = solver.fields.field_data.get_field_data(request)["inlet"]
+    >>> polydata = to_vtk_polydata(data.vertices, data.connectivity)
+    """
+    numpy_support, vtkPoints, vtkCellArray, vtkPolyData = _vtk()
+    if not isinstance(connectivity, CSRConnectivity):
+        connectivity = get_csr_connectivity(connectivity)
+    id_type = numpy_support.ID_TYPE_CODE
+    offsets = np.ascontiguousarray(connectivity.offsets, dtype=id_type)
+    indices = np.ascontiguousarray(connectivity.indices, dtype=id_type)
+    cells = vtkCellArray()
+    cells.SetData(
+        numpy_support.numpy_to_vtkIdTypeArray(offsets, deep=False),
+        numpy_support.numpy_to_vtkIdTypeArray(indices, deep=False),
+    )
+    points = vtkPoints()
+    points.SetData(
+        numpy_support.numpy_to_vtk(
+            np.ascontiguousarray(vertices).reshape(-1, 3), deep=False
+        )
+    )
+    polydata = vtkPolyData()
+    polydata.SetPoints(points)
+    polydata.SetPolys(cells)
+    for data, arrays in (
+        (polydata.GetPointData(), point_data),
+        (polydata.GetCellData(), cell_data),
+    ):
+        for name, array in (arrays or {}).items():
+            vtk_array = numpy_support.numpy_to_vtk(
+                np.ascontiguousarray(array), deep=False
+            )
+            vtk_array.SetName(name)
+            data.AddArray(vtk_array)
+    return polydata
+
+
+def to_pyvista(
+    vertices: npt.NDArray,
+    connectivity: CSRConnectivity | npt.NDArray,
+    point_data: Dict[str, npt.NDArray] | None = None,
+    cell_data: Dict[str, npt.NDArray] | None = None,
+):
+    """Create PyVista polydata from surface data.
+
+    The arrays are shared in the same way as in ``to_vtk_polydata``.
+
+    Parameters
+    ----------
+    vertices : numpy.ndarray
+        Vertex coordinates, either flat or with shape ``(n, 3)``.
+    connectivity : CSRConnectivity | numpy.ndarray
+        Faces connectivity, either in CSR format or in the flat format.
+    point_data : Dict[str, numpy.ndarray], optional
+        Field arrays defined at the vertices.
+    cell_data : Dict[str, numpy.ndarray], optional
+        Field arrays defined at the faces.
+
+    Returns
+    -------
+    pyvista.PolyData
+        PyVista polydata referencing the arrays.
+
+    Raises
+    ------
+    ModuleNotFoundError
+        If PyVista is not installed.
+    """
+    try:
+        import pyvista
+    except ModuleNotFoundError as exc:
+        raise ModuleNotFoundError(
+            "Missing dependencies, use 'pip install pyvista' to install them."
+        ) from exc
+    return pyvista.wrap(to_vtk_polydata(vertices, connectivity, point_data, cell_data))
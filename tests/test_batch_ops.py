@@ -20,10 +20,14 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import threading
+
 import pytest
 
+from ansys.api.fluent.v0 import batch_ops_pb2, settings_pb2
 import ansys.fluent.core as pyfluent
 from ansys.fluent.core import examples
+from ansys.fluent.core.services.batch_ops import BatchOps
 
 
 @pytest.mark.fluent_version(">=24.1")
@@ -59,3 +63,109 @@ def test_batch_ops_create_mesh_and_access_fails(new_solver_session):
             mesh["mesh-1"] = {}
             mesh["mesh-1"].surfaces_list = ["wall-elbow"]
     assert not solver.scheme.eval("(case-valid?)")
+
+
+class _MockBatchOpsService:
+    def __init__(self):
+        self.batches = []
+        self.threads = set()
+
+    def execute(self, requests):
+        requests = list(requests)
+        self.batches.append([x.request_body for x in requests])
+        self.threads.add(threading.current_thread().name)
+        for _ in requests:
+            yield batch_ops_pb2.ExecuteResponse(
+                response_body=settings_pb2.SetVarResponse().SerializeToString()
+            )
+
+
+class _MockConnection:
+    def __init__(self):
+        self._channel = object()
+
+
+class _MockSession:
+    def __init__(self):
+        self._fluent_connection = _MockConnection()
+        self._batch_ops_service = _MockBatchOpsService()
+
+
+def _add_set_var(batch_ops, path):
+    return batch_ops.add_op(
+        "ansys.api.fluent.v0.settings",
+        "Settings",
+        "SetVar",
+        settings_pb2.SetVarRequest(path_info=settings_pb2.PathInfo(path=path)),
+    )
+
+
+def _request_body(path):
+    return settings_pb2.SetVarRequest(
+        path_info=settings_pb2.PathInfo(path=path)
+    ).SerializeToString()
+
+
+def test_batch_ops_supported_methods():
+    session = _MockSession()
+    with BatchOps(session) as batch_ops:
+        op = _add_set_var(batch_ops, "a")
+        assert op.queued
+        assert op.response_cls is settings_pb2.SetVarResponse
+        getter = batch_ops.add_op(
+            "ansys.api.fluent.v0.settings",
+            "Settings",
+            "GetVar",
+            settings_pb2.GetVarRequest(path_info=settings_pb2.PathInfo(path="a")),
+        )
+        assert not getter.queued
+    assert session._batch_ops_service.batches == [[_request_body("a")]]
+    assert isinstance(op._result, settings_pb2.SetVarResponse)
+
+
+def test_batch_ops_per_session():
+    session_1 = _MockSession()
+    session_2 = _MockSession()
+    batch_ops_1 = BatchOps(session_1)
+    assert BatchOps(session_1) is batch_ops_1
+    batch_ops_2 = BatchOps(session_2)
+    assert batch_ops_2 is not batch_ops_1
+    assert BatchOps.instance() is batch_ops_2
+    with batch_ops_1:
+        assert BatchOps._get_active(session_1._fluent_connection._channel)
+        assert not BatchOps._get_active(session_2._fluent_connection._channel)
+        _add_set_var(batch_ops_1, "a")
+    assert not BatchOps._get_active(session_1._fluent_connection._channel)
+    assert session_1._batch_ops_service.batches == [[_request_body("a")]]
+    assert session_2._batch_ops_service.batches == []
+
+
+def test_batch_ops_flush_size():
+    session = _MockSession()
+    paths = [f"p{i}" for i in range(5)]
+    with BatchOps(session, flush_size=2) as batch_ops:
+        ops = [_add_set_var(batch_ops, path) for path in paths]
+    service = session._batch_ops_service
+    assert service.batches == [
+        [_request_body("p0"), _request_body("p1")],
+        [_request_body("p2"), _request_body("p3")],
+        [_request_body("p4")],
+    ]
+    assert all(op._result is not None for op in ops)
+    assert len(service.threads) == 1
+    # The worker thread is stopped when exiting the with block.
+    assert batch_ops._executor is None
+
+
+def test_batch_ops_exception_in_with_block_is_not_hidden():
+    session = _MockSession()
+
+    def execute(requests):
+        raise RuntimeError("Batch failed.")
+
+    session._batch_ops_service.execute = execute
+    with pytest.raises(ValueError):
+        with BatchOps(session, flush_size=1) as batch_ops:
+            _add_set_var(batch_ops, "a")
+            raise ValueError()
+    assert batch_ops._executor is None
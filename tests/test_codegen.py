@@ -22,6 +22,7 @@
 
 import ast
 import importlib
+import os
 from pathlib import Path
 import pickle
 import shutil
@@ -447,8 +448,8 @@ def _get_named_object_settings_static_info(name, object_type, children):
     }
 
 
-def _get_parameter_settings_static_info(name, type_):
-    return {name: {"type": type_, "help": f"{name} help"}}
+def _get_parameter_settings_static_info(name, type_, attrs=None):
+    return {name: {"type": type_, "help": f"{name} help", **(attrs or {})}}
 
 
 def _get_command_settings_static_info(name, args):
@@ -474,7 +475,9 @@ _settings_static_info = {
                         {},
                     )
                 )
-                | _get_parameter_settings_static_info("P2", "real")
+                | _get_parameter_settings_static_info(
+                    "P2", "real", {"units-quantity": "pressure"}
+                )
             ),
             _get_command_settings_static_info("C2", [("A2", "real")]),
             _get_query_settings_static_info("Q2", [("A2", "real")]),
@@ -507,7 +510,7 @@ from ansys.fluent.core.solver.flobject import (
     _FlStringConstant,
 )
 
-SHASH = "3e6d76a4601701388ea8258912d145b7b7c436699a50b6c7fe9a29f41eeff194"
+SHASH = "f122440052eb9e380db5d179a38a94ace47f1c1d5f754f61fa139a988b92e916"
 
 class P3(Integer):
     """
@@ -534,6 +537,7 @@ class P2(Real):
     P2 help.
     """
     _version = '251'
+    _units_quantity = 'pressure'
     fluent_name = 'P2'
     _python_name = 'P2'
 
@@ -842,3 +846,61 @@ def test_codegen_with_settings_static_info_edge_cases(
         # The order of classes is important.
         assert class_names_from_file == class_names
     shutil.rmtree(str(codegen_outdir))
+
+
+def test_codegen_is_parallel_and_incremental(monkeypatch):
+    codegen_outdir = Path(tempfile.mkdtemp())
+    monkeypatch.setattr(pyfluent, "CODEGEN_OUTDIR", codegen_outdir)
+    monkeypatch.setenv("PYFLUENT_CODEGEN_SKIP_BUILTIN_SETTINGS", "1")
+    version = "252"
+    static_infos = {
+        StaticInfoType.TUI_SOLVER: {
+            "menus": _get_nth_tui_menu_static_info(
+                1, {}, _get_nth_tui_command_static_info(2)
+            ),
+            "commands": _get_nth_tui_command_static_info(1),
+            "help": "Root",
+        },
+        StaticInfoType.SETTINGS: _settings_static_info,
+    }
+    tui_file = codegen_outdir / "solver" / f"tui_{version}.py"
+    settings_file = codegen_outdir / "solver" / f"settings_{version}.py"
+    allapigen.generate(version, static_infos, max_workers=2)
+    tui_output = tui_file.read_text()
+    settings_output = settings_file.read_text()
+    allapigen.generate(version, static_infos, max_workers=1)
+    # The generated content does not depend on the worker processes.
+    assert tui_file.read_text() == tui_output
+    assert settings_file.read_text() == settings_output
+    for file in (tui_file, settings_file):
+        os.utime(file, ns=(0, 0))
+    allapigen.generate(version, static_infos, max_workers=2)
+    # Unchanged files are not rewritten.
+    assert tui_file.stat().st_mtime_ns == 0
+    assert settings_file.stat().st_mtime_ns == 0
+    static_infos[StaticInfoType.SETTINGS] = _settings_static_info_combined_case
+    allapigen.generate(version, static_infos, max_workers=1)
+    assert tui_file.stat().st_mtime_ns == 0
+    assert settings_file.stat().st_mtime_ns != 0
+    assert settings_file.read_text() != settings_output
+    shutil.rmtree(str(codegen_outdir))
+
+
+def test_codegen_workers_get_only_their_static_info():
+    static_infos = {
+        StaticInfoType.TUI_SOLVER: {"help": "Root"},
+        StaticInfoType.DATAMODEL_WORKFLOW: {"rules": "workflow"},
+        StaticInfoType.DATAMODEL_MESHING: {"rules": "meshing"},
+        StaticInfoType.SETTINGS: _settings_static_info,
+    }
+    get_infos = allapigen._get_generator_static_infos
+    assert get_infos(allapigen.tuigen, static_infos) == {
+        StaticInfoType.TUI_SOLVER: {"help": "Root"}
+    }
+    assert list(get_infos(allapigen.datamodelgen, static_infos)) == [
+        StaticInfoType.DATAMODEL_WORKFLOW,
+        StaticInfoType.DATAMODEL_MESHING,
+    ]
+    assert get_infos(allapigen.settingsgen, static_infos) == {
+        StaticInfoType.SETTINGS: _settings_static_info
+    }
@@ -0,0 +1,111 @@
+# Copyright (C) 2021 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import multiprocessing
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+pytest.importorskip("h5py")
+
+_READ_FACE_FIELDS_SCRIPT = textwrap.dedent(
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+    from multiprocessing import shared_memory
+    import sys
+
+    import h5py
+    import numpy as np
+
+    from ansys.fluent.core.filereader.data_file_series import _read_face_fields
+
+    if __name__ == "__main__":
+        data_file_name, start_method = sys.argv[1:]
+        with h5py.File(data_file_name, "w") as data_file:
+            field = data_file.create_group("results/1/phase-1/faces/SV_P")
+            array = field.create_dataset("1", data=np.arange(10.0))
+            array.attrs["minId"] = [1]
+            array.attrs["maxId"] = [10]
+        with ProcessPoolExecutor(
+            max_workers=2, mp_context=multiprocessing.get_context(start_method)
+        ) as executor:
+            # Start the workers before the shared memory block is created.
+            list(executor.map(abs, range(2)))
+            block = shared_memory.SharedMemory(create=True, size=10 * 8)
+            try:
+                jobs = [
+                    executor.submit(
+                        _read_face_fields,
+                        data_file_name,
+                        "phase-1",
+                        "SV_P",
+                        [(i * 5, i * 5 + 4, i * 5)],
+                        block.name,
+                        "<f8",
+                        10,
+                    )
+                    for i in range(2)
+                ]
+                for job in jobs:
+                    job.result()
+            finally:
+                block.unlink()
+        data = np.frombuffer(block.buf, dtype="<f8", count=10)
+        assert np.array_equal(data, np.arange(10.0))
+        del data
+        block.close()
+    """
+)
+
+
+@pytest.mark.parametrize(
+    "start_method",
+    [
+        method
+        for method in ("fork", "spawn")
+        if method in multiprocessing.get_all_start_methods()
+    ],
+)
+def test_read_face_fields_in_workers_without_resource_warnings(tmp_path, start_method):
+    script = tmp_path / "read_face_fields.py"
+    script.write_text(_READ_FACE_FIELDS_SCRIPT)
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-W",
+            "error",
+            str(script),
+            str(tmp_path / "step-1.dat.h5"),
+            start_method,
+        ],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    # The resource tracker reports leaked or unknown blocks on stderr.
+    assert "resource_tracker" not in result.stderr
+    assert "Error" not in result.stderr
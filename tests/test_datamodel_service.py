@@ -344,6 +344,59 @@ def test_datamodel_streaming_no_commands_diff_state(
     assert "ImportGeometry:ImportGeometry1" not in (y for x in cb.states for y in x)
 
 
+class MockDatamodelStreamingService:
+    def __init__(self, changes):
+        self.changes = changes
+
+    def begin_streaming(self, request, started_evt, id, stream_begin_method):
+        started_evt.set()
+        for state, deleted_paths in self.changes:
+            response = datamodel_se_pb2.DataModelResponse(deletedpaths=deleted_paths)
+            if state is not None:
+                _convert_value_to_variant(state, response.state)
+            yield response
+
+    def end_streaming(self, id, stream_begin_method):
+        pass
+
+
+def test_datamodel_streaming_path_prefix_filter():
+    changes = [
+        ({"TaskObject:TaskObject1": {"State": "Up-to-date"}}, []),
+        ({"TaskObject:TaskObject2": {"State": "Out-of-date"}}, []),
+        ({"Workflow": {"CurrentTask": "TaskObject2"}}, []),
+        ({}, ["/TaskObject:TaskObject1"]),
+        ({"TaskObject:TaskObject1": "reset"}, []),
+        (None, ["/Workflow"]),
+    ]
+    stream = DatamodelStream(MockDatamodelStreamingService(changes))
+    received = {"all": [], "task": [], "state": []}
+
+    def on_change(name, state, deleted_paths):
+        received[name].append((_convert_variant_to_value(state), list(deleted_paths)))
+
+    stream.register_callback(lambda **kwargs: on_change("all", **kwargs))
+    stream.register_callback(
+        lambda **kwargs: on_change("task", **kwargs),
+        path_prefix="/TaskObject:TaskObject1",
+    )
+    callback_id = stream.register_callback(
+        lambda **kwargs: on_change("state", **kwargs),
+        path_prefix="/TaskObject:TaskObject1/State",
+    )
+    stream.start(rules="workflow", no_commands_diff_state=True)
+    stream._stream_thread.join(timeout=10)
+    assert len(received["all"]) == 6
+    assert received["task"] == [
+        ({"TaskObject:TaskObject1": {"State": "Up-to-date"}}, []),
+        ({}, ["/TaskObject:TaskObject1"]),
+        ({"TaskObject:TaskObject1": "reset"}, []),
+    ]
+    assert received["state"] == received["task"]
+    stream.unregister_callback(callback_id)
+    assert callback_id not in stream._path_filters
+
+
 @pytest.mark.fluent_version(">=24.2")
 @pytest.mark.codegen_required
 def test_get_object_names_wtm(new_meshing_session):
@@ -27,6 +27,7 @@ import pytest
 import ansys.fluent.core as pyfluent
 from ansys.fluent.core import FluentVersion, MeshingEvent, SolverEvent, examples
 from ansys.fluent.core.pyfluent_warnings import PyFluentDeprecationWarning
+from ansys.fluent.core.streaming_services.events_streaming import EventsManager
 
 
 def test_receive_events_on_case_loaded(new_solver_session) -> None:
@@ -260,3 +261,26 @@ def test_sync_event_exception_in_callback(static_mixer_case_session, caplog):
         )
         == 0
     )
+
+
+def test_register_weak_callback_skips_unsupported_events():
+    class CacheOwner:
+        def __init__(self):
+            self.cleared = 0
+
+        def clear_cache(self):
+            self.cleared += 1
+
+    events = EventsManager(MeshingEvent, None, None, None)
+    owner = CacheOwner()
+    callback_ids = events.register_weak_callback(
+        (SolverEvent.DATA_LOADED, MeshingEvent.CASE_LOADED), owner.clear_cache
+    )
+    assert len(callback_ids) == 1
+    callbacks = events._impl._service_callbacks[MeshingEvent.CASE_LOADED]
+    (callback,) = callbacks.values()
+    callback(session=None, event_info=None)
+    assert owner.cleared == 1
+    # The callback does not keep its owner alive.
+    del owner
+    callback(session=None, event_info=None)
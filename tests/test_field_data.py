@@ -20,10 +20,14 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from concurrent import futures
+
+import grpc
 import numpy as np
 import pytest
 from test_utils import pytest_approx
 
+from ansys.api.fluent.v0 import field_data_pb2, field_data_pb2_grpc
 from ansys.fluent.core import (
     PathlinesFieldDataRequest,
     ScalarFieldDataRequest,
@@ -36,16 +40,101 @@ from ansys.fluent.core.examples.downloads import download_file
 from ansys.fluent.core.exceptions import DisallowedValuesError
 from ansys.fluent.core.field_data_interfaces import (
     FieldUnavailable,
+    _transform_faces_connectivity_data,
+    get_csr_connectivity,
 )
+from ansys.fluent.core.fluent_connection import ErrorState
 from ansys.fluent.core.services.field_data import (
     CellElementType,
+    ChunkParser,
+    FieldDataService,
     ZoneType,
+    get_fields_request,
 )
 from ansys.fluent.core.solver import VelocityInlet, VelocityInlets, WallBoundaries
 
 HOT_INLET_TEMPERATURE = 313.15
 
 
+class MockFieldDataServicer(field_data_pb2_grpc.FieldDataServicer):
+    def __init__(self, fields):
+        self.fields = fields
+
+    def GetFields(self, request, context):  # noqa N802
+        for surface_id, field in self.fields.items():
+            yield field_data_pb2.GetFieldsResponse(
+                payloadInfo=field_data_pb2.PayloadInfo(
+                    surfaceId=surface_id,
+                    fieldName="temperature",
+                    fieldType=field_data_pb2.FieldType.DOUBLE_ARRAY,
+                    fieldSize=field.size,
+                    fieldRequestInfo=field_data_pb2.FieldRequestInfo(
+                        scalarFieldRequest=field_data_pb2.ScalarFieldRequest(
+                            dataLocation=field_data_pb2.DataLocation.Nodes
+                        )
+                    ),
+                )
+            )
+            payload = field.tobytes()
+            for i in range(0, len(payload), request.chunkSize):
+                yield field_data_pb2.GetFieldsResponse(
+                    bytePayload=payload[i : i + request.chunkSize]
+                )
+
+
+def test_field_data_transport_with_stub_server() -> None:
+    fields = {i: np.random.rand(2 * 10**6 - i) for i in range(4)}
+    servicer = MockFieldDataServicer(fields)
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=1))
+    port = server.add_insecure_port("127.0.0.1:0")
+    field_data_pb2_grpc.add_FieldDataServicer_to_server(servicer, server)
+    server.start()
+    channel = grpc.insecure_channel(f"127.0.0.1:{port}")
+    service = FieldDataService(channel, [], ErrorState())
+    try:
+        data = ChunkParser().extract_fields(service.get_fields(get_fields_request()))
+    finally:
+        channel.close()
+        server.stop(None)
+    (surfaces_data,) = data.values()
+    for surface_id, field in fields.items():
+        assert np.array_equal(surfaces_data[surface_id]["temperature"], field)
+
+
+def test_csr_connectivity() -> None:
+    flat_data = np.array([4, 4, 5, 12, 11, 3, 1, 2, 3, 2, 7, 8], dtype=np.int32)
+    offsets, indices = get_csr_connectivity(flat_data)
+    assert offsets.tolist() == [0, 4, 7, 9]
+    assert indices.tolist() == [4, 5, 12, 11, 1, 2, 3, 7, 8]
+    assert get_csr_connectivity(flat_data).n_faces == 3
+    assert [
+        face.tolist() for face in _transform_faces_connectivity_data(flat_data)
+    ] == [
+        [4, 5, 12, 11],
+        [1, 2, 3],
+        [7, 8],
+    ]
+
+    triangles = np.tile(np.array([3, 0, 1, 2], dtype=np.int32), 5)
+    offsets, indices = get_csr_connectivity(triangles)
+    assert offsets.tolist() == list(range(0, 16, 3))
+    assert indices.tolist() == [0, 1, 2] * 5
+
+    # Faces with many vertices and vertex indices equal to vertex counts
+    faces = [list(range(100)), [3, 3, 3], [4, 1, 2, 3], [1, 2]]
+    flat_data = np.array(
+        [x for face in faces for x in [len(face)] + face], dtype=np.int32
+    )
+    offsets, indices = get_csr_connectivity(flat_data)
+    assert offsets.tolist() == [0, 100, 103, 107, 109]
+    assert indices.tolist() == [x for face in faces for x in face]
+
+    assert get_csr_connectivity(np.array([], dtype=np.int32)).n_faces == 0
+    assert _transform_faces_connectivity_data([]) == []
+    with pytest.raises(ValueError):
+        get_csr_connectivity(np.array([4, 1, 2], dtype=np.int32))
+
+
 @pytest.mark.fluent_version(">=24.1")
 def test_field_data_batches_deprecated_interface(new_solver_session) -> None:
     solver = new_solver_session
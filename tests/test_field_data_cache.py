@@ -0,0 +1,429 @@
+# Copyright (C) 2021 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from ansys.api.fluent.v0 import field_data_pb2 as FieldDataProtoModule
+from ansys.fluent.core.exceptions import DisallowedValuesError
+from ansys.fluent.core.field_data_interfaces import (
+    ScalarFieldDataRequest,
+    SurfaceDataType,
+    SurfaceFieldDataRequest,
+    _AllowedSurfaceNames,
+    _ReturnFieldData,
+)
+from ansys.fluent.core.services.field_data import (
+    ChunkParser,
+    LiveFieldData,
+    _FieldDataConstants,
+    _FieldInfo,
+    _get_surface_ids,
+)
+from ansys.fluent.core.streaming_services.events_streaming import (
+    EventsManager,
+    SolverEvent,
+)
+
+
+class MockFieldDataService:
+    def __init__(self, surfaces, surface_types=None):
+        self.surfaces = dict(surfaces)
+        self.surface_types = surface_types or {}
+        self.calls = []
+        self.requested_surface_ids = []
+        self.value = 1.0
+
+    def get_surfaces_info(self, request):
+        self.calls.append("get_surfaces_info")
+        return FieldDataProtoModule.GetSurfacesInfoResponse(
+            surfaceInfo=[
+                FieldDataProtoModule.SurfaceInfo(
+                    surfaceId=[FieldDataProtoModule.SurfaceId(id=surface_id)],
+                    surfaceName=name,
+                    type=self.surface_types.get(name, "zone-surf"),
+                )
+                for name, surface_id in self.surfaces.items()
+            ]
+        )
+
+    def get_scalar_fields_info(self, request):
+        self.calls.append("get_scalar_fields_info")
+        return FieldDataProtoModule.GetFieldsInfoResponse(
+            fieldInfo=[
+                FieldDataProtoModule.FieldInfo(
+                    displayName="Static Pressure", solverName="pressure"
+                )
+            ]
+        )
+
+    def get_fields(self, request):
+        self.calls.append("get_fields")
+        for scalar_field_request in request.scalarFieldRequest:
+            self.requested_surface_ids.append(scalar_field_request.surfaceId)
+            yield from self._field_chunks(
+                scalar_field_request.surfaceId,
+                scalar_field_request.scalarFieldName,
+                FieldDataProtoModule.FieldRequestInfo(
+                    scalarFieldRequest=scalar_field_request
+                ),
+                np.full(4, self.value),
+            )
+        for surface_request in request.surfaceRequest:
+            self.requested_surface_ids.append(surface_request.surfaceId)
+            yield from self._field_chunks(
+                surface_request.surfaceId,
+                "vertices",
+                FieldDataProtoModule.FieldRequestInfo(surfaceRequest=surface_request),
+                np.full(12, self.value),
+            )
+            if surface_request.provideFaces:
+                yield from self._field_chunks(
+                    surface_request.surfaceId,
+                    "faces",
+                    FieldDataProtoModule.FieldRequestInfo(
+                        surfaceRequest=surface_request
+                    ),
+                    np.array([3, 1, 2, 3, 3, 0, 1, 2, 3, 3, 2, 1], dtype=np.int32),
+                )
+
+    @staticmethod
+    def _field_chunks(surface_id, field_name, field_request_info, array):
+        yield FieldDataProtoModule.GetFieldsResponse(
+            payloadInfo=FieldDataProtoModule.PayloadInfo(
+                surfaceId=surface_id,
+                fieldName=field_name,
+                fieldType=_FieldDataConstants.np_data_type_to_proto_field_type[
+                    array.dtype.type
+                ],
+                fieldSize=array.size,
+                fieldRequestInfo=field_request_info,
+            )
+        )
+        yield FieldDataProtoModule.GetFieldsResponse(bytePayload=array.tobytes())
+
+
+class MockEvents(EventsManager):
+    def __init__(self):
+        self._event_type = SolverEvent
+        self.callbacks = {}
+
+    def _register_single_callback(self, event_type, callback, *args):
+        callback_id = f"{event_type}-{len(self.callbacks)}"
+        self.callbacks[callback_id] = (event_type, callback, args)
+        return callback_id
+
+    def unregister_callback(self, callback_id):
+        del self.callbacks[callback_id]
+
+    def notify(self, event_type):
+        for registered_event_type, callback, args in list(self.callbacks.values()):
+            if registered_event_type == event_type:
+                callback(*args, session=None, event_info=None)
+
+
+def _live_field_data(service, events=None):
+    field_info = _FieldInfo(service, lambda: True)
+    return LiveFieldData(service, field_info, lambda: True, events=events)
+
+
+def test_field_info_is_cached():
+    service = MockFieldDataService({f"surface-{i}": i for i in range(50)})
+    field_info = _FieldInfo(service, lambda: True)
+    allowed_surface_names = _AllowedSurfaceNames(field_info)
+
+    surface_ids = _get_surface_ids(
+        field_info, allowed_surface_names, [f"surface-{i}" for i in range(50)]
+    )
+    assert surface_ids == list(range(50))
+    assert _get_surface_ids(field_info, allowed_surface_names, [3, 4]) == [3, 4]
+    assert field_info._get_scalar_fields_info() == field_info._get_scalar_fields_info()
+    assert service.calls == ["get_surfaces_info", "get_scalar_fields_info"]
+
+    field_info.clear_cache()
+    field_info._get_surfaces_info()
+    assert service.calls.count("get_surfaces_info") == 2
+
+
+def test_field_info_is_refreshed_for_unknown_surface():
+    service = MockFieldDataService({"inlet": 1})
+    field_info = _FieldInfo(service, lambda: True)
+    allowed_surface_names = _AllowedSurfaceNames(field_info)
+    assert _get_surface_ids(field_info, allowed_surface_names, ["inlet"]) == [1]
+
+    service.surfaces["plane-1"] = 2
+    assert _get_surface_ids(field_info, allowed_surface_names, ["plane-1"]) == [2]
+    assert _get_surface_ids(field_info, allowed_surface_names, [2]) == [2]
+    assert service.calls.count("get_surfaces_info") == 2
+
+    with pytest.raises(DisallowedValuesError):
+        _get_surface_ids(field_info, allowed_surface_names, ["plane-2"])
+
+
+def test_field_data_results_are_cached_per_surface():
+    service = MockFieldDataService({"inlet": 1, "outlet": 2, "plane-1": 3})
+    field_data = _live_field_data(service)
+    cache = field_data.enable_cache()
+
+    request = ScalarFieldDataRequest(field_name="pressure", surfaces=["inlet", 2])
+    data = field_data.get_field_data(request)
+    assert list(data) == ["inlet", 2]
+    assert not data["inlet"].flags.writeable
+    data = field_data.get_field_data(request)
+    assert np.array_equal(data[2], np.full(4, 1.0))
+    assert service.calls.count("get_fields") == 1
+
+    field_data.get_field_data(
+        ScalarFieldDataRequest(field_name="pressure", surfaces=["inlet", "plane-1"])
+    )
+    assert service.requested_surface_ids == [1, 2, 3]
+    assert len(cache) == 3
+    assert (cache.hits, cache.misses) == (3, 3)
+
+    field_data.get_field_data(request._replace(node_value=False))
+    assert service.requested_surface_ids == [1, 2, 3, 1, 2]
+
+    field_data.disable_cache()
+    field_data.get_field_data(request)
+    assert service.calls.count("get_fields") == 4
+
+
+def test_field_data_cache_follows_solver_and_mesh_generations():
+    service = MockFieldDataService(
+        {"inlet": 1, "plane-1": 2}, surface_types={"plane-1": "plane-surf"}
+    )
+    events = MockEvents()
+    field_data = _live_field_data(service, events=events)
+    assert not events.callbacks
+    field_data.enable_cache()
+    assert events.callbacks
+
+    scalar_request = ScalarFieldDataRequest(
+        field_name="pressure", surfaces=["inlet", "plane-1"]
+    )
+    surface_request = SurfaceFieldDataRequest(
+        data_types=[SurfaceDataType.Vertices], surfaces=["inlet", "plane-1"]
+    )
+    field_data.get_field_data(scalar_request)
+    field_data.get_field_data(surface_request)
+    assert service.requested_surface_ids == [1, 2, 1, 2]
+
+    service.value = 2.0
+    events.notify(SolverEvent.ITERATION_ENDED)
+    data = field_data.get_field_data(scalar_request)
+    assert np.array_equal(data["inlet"], np.full(4, 2.0))
+    data = field_data.get_field_data(surface_request)
+    # The geometry of mesh zone surfaces is kept until the mesh changes.
+    assert np.array_equal(data["inlet"].vertices, np.full((4, 3), 1.0))
+    assert np.array_equal(data["plane-1"].vertices, np.full((4, 3), 2.0))
+    assert service.requested_surface_ids == [1, 2, 1, 2, 1, 2, 2]
+
+    events.notify(SolverEvent.CASE_LOADED)
+    field_data.get_field_data(surface_request)
+    assert service.requested_surface_ids[-2:] == [1, 2]
+
+    field_data.disable_cache()
+    assert not events.callbacks
+
+
+def test_field_data_cache_discards_geometry_of_dynamic_mesh():
+    service = MockFieldDataService({"inlet": 1})
+    events = MockEvents()
+    field_data = _live_field_data(service, events=events)
+    field_data.enable_cache()
+    callback_count = len(events.callbacks)
+    field_data.enable_cache(dynamic_mesh=True)
+    assert len(events.callbacks) == callback_count
+
+    surface_request = SurfaceFieldDataRequest(
+        data_types=[SurfaceDataType.Vertices], surfaces=["inlet"]
+    )
+    field_data.get_field_data(surface_request)
+    service.value = 2.0
+    events.notify(SolverEvent.TIMESTEP_ENDED)
+    data = field_data.get_field_data(surface_request)
+    assert np.array_equal(data["inlet"].vertices, np.full((4, 3), 2.0))
+    assert service.requested_surface_ids == [1, 1]
+
+
+class MockAsyncFieldDataService:
+    def __init__(self, service):
+        self._service = service
+
+    async def get_surfaces_info(self, request):
+        return self._service._get_surfaces_info(request)
+
+    async def get_scalar_fields_info(self, request):
+        return self._service._get_scalar_fields_info(request)
+
+    async def get_fields(self, request):
+        return list(self._service._get_fields(request))
+
+
+class MockFieldDataServiceWithAio(MockFieldDataService):
+    """Fails if a blocking RPC is made while the event loop is running."""
+
+    def __init__(self, surfaces):
+        super().__init__(surfaces)
+        self.aio = MockAsyncFieldDataService(self)
+
+    @staticmethod
+    def _check_not_in_event_loop():
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        raise AssertionError("Blocking RPC made from the event loop.")
+
+    def _get_surfaces_info(self, request):
+        return MockFieldDataService.get_surfaces_info(self, request)
+
+    def _get_scalar_fields_info(self, request):
+        return MockFieldDataService.get_scalar_fields_info(self, request)
+
+    def _get_fields(self, request):
+        return MockFieldDataService.get_fields(self, request)
+
+    def get_surfaces_info(self, request):
+        self._check_not_in_event_loop()
+        return self._get_surfaces_info(request)
+
+    def get_scalar_fields_info(self, request):
+        self._check_not_in_event_loop()
+        return self._get_scalar_fields_info(request)
+
+    def get_fields(self, request):
+        self._check_not_in_event_loop()
+        return self._get_fields(request)
+
+
+def test_get_field_data_async_does_not_block():
+    service = MockFieldDataServiceWithAio({"inlet": 1})
+    field_info = _FieldInfo(service, lambda: True)
+
+    def is_data_valid():
+        raise AssertionError("Blocking call made from the event loop.")
+
+    field_data = LiveFieldData(service, field_info, is_data_valid)
+    request = ScalarFieldDataRequest(field_name="pressure", surfaces=["inlet"])
+    data = asyncio.run(field_data.get_field_data_async(request))
+    assert np.array_equal(data["inlet"], np.full(4, 1.0))
+
+    service.surfaces["plane-1"] = 2
+    data = asyncio.run(
+        field_data.get_field_data_async(request._replace(surfaces=["plane-1"]))
+    )
+    assert np.array_equal(data["plane-1"], np.full(4, 1.0))
+    with pytest.raises(DisallowedValuesError):
+        asyncio.run(
+            field_data.get_field_data_async(request._replace(surfaces=["plane-2"]))
+        )
+
+
+def test_field_data_cache_is_memory_bounded():
+    service = MockFieldDataService({f"surface-{i}": i for i in range(4)})
+    field_data = _live_field_data(service)
+    # Each surface holds 4 doubles.
+    cache = field_data.enable_cache(max_bytes=3 * 32)
+    for i in range(4):
+        field_data.get_field_data(
+            ScalarFieldDataRequest(field_name="pressure", surfaces=[i])
+        )
+    assert len(cache) == 3
+    assert cache.nbytes == 3 * 32
+    field_data.get_field_data(
+        ScalarFieldDataRequest(field_name="pressure", surfaces=[1, 2, 3])
+    )
+    field_data.get_field_data(
+        ScalarFieldDataRequest(field_name="pressure", surfaces=[0])
+    )
+    assert service.requested_surface_ids == [0, 1, 2, 3, 0]
+
+
+def test_field_data_reduced_precision_and_decimation():
+    service = MockFieldDataService({"inlet": 1})
+    field_data = _live_field_data(service)
+
+    request = ScalarFieldDataRequest(
+        field_name="pressure", surfaces=["inlet"], node_value=False
+    )
+    data = field_data.get_field_data(request._replace(dtype=np.float32, stride=2))
+    assert data["inlet"].dtype == np.float32
+    assert np.array_equal(data["inlet"], np.full(2, 1.0))
+    data = field_data.get_field_data(request._replace(target_count=1))
+    assert data["inlet"].dtype == np.float64
+    assert len(data["inlet"]) == 1
+    with pytest.raises(ValueError):
+        field_data.get_field_data(request._replace(node_value=True, stride=2))
+    with pytest.raises(ValueError):
+        field_data.get_field_data(request._replace(stride=0))
+    with pytest.raises(ValueError):
+        field_data.get_field_data(request._replace(dtype=np.int32))
+
+    surface_request = SurfaceFieldDataRequest(
+        data_types=[SurfaceDataType.Vertices, SurfaceDataType.FacesConnectivity],
+        surfaces=["inlet"],
+        flatten_connectivity=True,
+    )
+    data = field_data.get_field_data(surface_request)["inlet"]
+    assert data.vertices.shape == (4, 3)
+    assert data.connectivity.dtype == np.int32
+    data = field_data.get_field_data(
+        surface_request._replace(dtype=np.float16, stride=2)
+    )["inlet"]
+    # The first and the third faces are kept, which do not use the vertex 0, and
+    # the other vertices are renumbered.
+    assert data.vertices.dtype == np.float16
+    assert data.vertices.shape == (3, 3)
+    assert np.array_equal(data.connectivity, [3, 0, 1, 2, 3, 2, 1, 0])
+    assert data.connectivity.dtype == np.int32
+    data = field_data.get_field_data(
+        surface_request._replace(csr_connectivity=True, target_count=1)
+    )["inlet"]
+    assert data.connectivity.n_faces == 1
+    assert np.array_equal(data.connectivity.indices, [0, 1, 2])
+
+
+def test_vector_field_data_is_decimated():
+    vector_field_data = {1: {"velocity": np.arange(12, dtype=np.float64)}}
+    data = _ReturnFieldData._vector_data(
+        "velocity", [1], [1], vector_field_data, dtype=np.float32, stride=3
+    )
+    assert data[1].dtype == np.float32
+    assert np.array_equal(data[1], [[0, 1, 2], [9, 10, 11]])
+
+
+def test_streamed_fields_are_extracted_with_reduced_precision():
+    service = MockFieldDataService({"inlet": 1})
+    request = FieldDataProtoModule.GetFieldsRequest(
+        surfaceRequest=[
+            FieldDataProtoModule.SurfaceRequest(
+                surfaceId=1, provideVertices=True, provideFaces=True
+            )
+        ]
+    )
+    fields = ChunkParser(dtype=np.float32).extract_fields(service.get_fields(request))
+    surface_data = next(iter(fields.values()))[1]
+    assert surface_data["vertices"].dtype == np.float32
+    assert surface_data["faces"].dtype == np.int32
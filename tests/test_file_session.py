@@ -21,6 +21,7 @@
 # SOFTWARE.
 
 from pathlib import Path
+import shutil
 
 import pytest
 
@@ -34,6 +35,7 @@ from ansys.fluent.core import (
 )
 from ansys.fluent.core.file_session import (
     FileSession,
+    FileSessionSeries,
     InvalidFieldName,
     InvalidMultiPhaseFieldName,
 )
@@ -743,3 +745,38 @@ def test_faces_connectivity_behaviour():
     assert data.get_field_data(vertices_and_faces_connectivity_request)[
         4
     ].connectivity.shape == (10090,)
+
+
+@pytest.mark.parametrize("max_workers", [0, 2])
+def test_file_session_series(tmp_path, max_workers):
+    case_file_name = examples.download_file(
+        "elbow1.cas.h5", "pyfluent/file_session", return_without_path=False
+    )
+    data_file_name = examples.download_file(
+        "elbow1.dat.h5", "pyfluent/file_session", return_without_path=False
+    )
+    for step in (10, 2, 1):
+        shutil.copy(data_file_name, tmp_path / f"elbow1-{step}.dat.h5")
+    file_session = FileSession(case_file_name, data_file_name)
+    sv_t_wall = file_session.fields.field_data.get_field_data(
+        ScalarFieldDataRequest(field_name="SV_T", surfaces=["wall"])
+    )["wall"]
+
+    with FileSessionSeries(case_file_name, tmp_path, max_workers=max_workers) as series:
+        assert len(series) == 3
+        assert [x.name for x in series.data_file_names] == [
+            "elbow1-1.dat.h5",
+            "elbow1-2.dat.h5",
+            "elbow1-10.dat.h5",
+        ]
+        assert series[-1]._case_file is series[0]._case_file
+        step_data = series[1].fields.field_data.get_field_data(
+            ScalarFieldDataRequest(field_name="SV_T", surfaces=["wall"])
+        )["wall"]
+        assert (step_data == sv_t_wall).all()
+
+        data = series.get_scalar_field_data("SV_T", ["wall", "symmetry"])
+        assert list(data) == [0, 1, 2]
+        assert data[2]["wall"].shape == (3630,)
+        assert (data[2]["wall"] == sv_t_wall).all()
+        assert list(series.get_scalar_field_data("SV_T", ["wall"], steps=[-1])) == [2]
@@ -22,15 +22,20 @@
 
 """Unit tests for flobject module."""
 
+import asyncio
 from collections.abc import MutableMapping
 import io
+import warnings
 import weakref
 
 import pytest
 from test_utils import MockTracingInterceptor, count_key_recursive
 
+from ansys.api.fluent.v0 import scheme_eval_pb2
 from ansys.fluent.core.examples import download_file
+from ansys.fluent.core.pyfluent_warnings import PyFluentUserWarning
 from ansys.fluent.core.services.interceptors import TracingInterceptor
+from ansys.fluent.core.services.scheme_eval import SchemeEval
 from ansys.fluent.core.solver import flobject
 from ansys.fluent.core.solver.flobject import (
     InactiveObjectError,
@@ -506,6 +511,200 @@ def test_named_object():
     assert r.n_1["n5"]() == {"rl_1": [4.3, 2.1], "sl_1": ["oof", "rab"]}
 
 
+def test_named_object_names_index():
+    class CountingProxy(Proxy):
+        get_object_names_calls = 0
+
+        def get_object_names(self, path):
+            self.get_object_names_calls += 1
+            return super().get_object_names(path)
+
+    proxy = CountingProxy()
+    r = flobject.get_root(proxy)
+    for i in range(10):
+        r.n_1[f"n{i}"] = {}
+    proxy.get_object_names_calls = 0
+    for name in r.n_1:
+        assert name in r.n_1
+        r.n_1[name].rl_1()
+    assert len(r.n_1) == 10
+    assert proxy.get_object_names_calls == 1
+
+    # Changing a child object does not affect the names.
+    r.n_1["n0"].rl_1 = [1.0]
+    assert "n0" in r.n_1
+    assert proxy.get_object_names_calls == 1
+
+    r.n_1.create("n10")
+    assert list(r.n_1) == [f"n{i}" for i in range(11)]
+    del r.n_1["n10"]
+    assert "n10" not in r.n_1
+    r.n_1.rename("m0", "n0")
+    assert "m0" in r.n_1 and "n0" not in r.n_1
+    r.n_1 = {"n11": {}}
+    assert "n11" in r.n_1.keys()
+    r.g_1.r_1 = 0.0
+    r.c_1._setattr("_version", FluentVersion.v261)
+    calls = proxy.get_object_names_calls
+    r.c_1(a_1=1.0, a_2=True)
+    # Commands can change any object.
+    assert len(r.n_1) == 11
+    assert proxy.get_object_names_calls == calls + 1
+
+    # Objects created by other means are found on a miss.
+    proxy.create("n-1", "n12")
+    assert "n12" in r.n_1
+    assert r.n_1["n12"].rl_1() is None
+
+
+def test_named_object_names_index_after_rename_through_child():
+    class NameString(String):
+        def get_state(self):
+            container = self.parent.parent
+            return next(k for k, v in container._objs.items() if v == self.parent)
+
+        def set_state(self, value):
+            container = self.parent.parent
+            container.rename(value, self.get_state())
+
+    class NamedChild(Root.N1.NC):
+        children = {**Root.N1.NC.children, "name": NameString}
+
+    class N1(Root.N1):
+        child_object_type = NamedChild
+
+    class RenamingRoot(Root):
+        children = {**Root.children, "n-1": N1}
+
+    class RenamingProxy(Proxy):
+        root = RenamingRoot
+
+    r = flobject.get_root(RenamingProxy())
+    r.n_1["a"] = {}
+    r.n_1["b"] = {}
+    assert list(r.n_1) == ["a", "b"]
+    r.n_1["a"].name = "c"
+    assert sorted(r.n_1) == ["b", "c"]
+    assert "a" not in r.n_1
+    r.n_1["b"].set_state({"name": "d"})
+    assert sorted(r.n_1.keys()) == ["c", "d"]
+    assert "b" not in r.n_1
+
+
+def test_named_object_names_index_after_rename_through_scheme():
+    class RenamingSchemeEvalService:
+        # Renames n-1/a as c, like a TUI command run through execute_tui.
+        def __init__(self, proxy):
+            self.proxy = proxy
+
+        def string_eval(self, request):
+            return scheme_eval_pb2.StringEvalResponse(output="(25 2 0)")
+
+        def scheme_eval(self, request, metadata):
+            self.proxy.rename("n-1", "c", "a")
+            return scheme_eval_pb2.SchemeEvalResponse()
+
+    proxy = Proxy()
+    r = flobject.get_root(proxy)
+    r.n_1["a"] = {}
+    r.n_1["b"] = {}
+    assert sorted(r.n_1) == ["a", "b"]
+    scheme = SchemeEval(RenamingSchemeEvalService(proxy))
+    scheme._command_callbacks.append(
+        flobject._get_settings_change_tracker(proxy).all_changed
+    )
+    scheme.eval('(ti-menu-load-string "rename")')
+    assert sorted(r.n_1) == ["b", "c"]
+    assert "a" not in r.n_1
+    with pytest.raises(KeyError):
+        r.n_1["a"]
+
+
+def test_set_state_diff():
+    class RecordingProxy(Proxy):
+        def __init__(self):
+            super().__init__()
+            self.set_var_calls = []
+
+        def set_var(self, path, value):
+            self.set_var_calls.append((path, value))
+            return super().set_var(path, value)
+
+    proxy = RecordingProxy()
+    r = flobject.get_root(proxy)
+    r.g_1 = {"r_1": 3.2, "i_2": -3, "b_3": False, "s_4": "foo"}
+    r.n_1["n0"] = {"rl_1": [1.0, 2.0]}
+    proxy.set_var_calls.clear()
+
+    r.g_1.set_state({"r_1": 3.2, "i_2": -3, "b_3": False, "s_4": "foo"}, diff=True)
+    r.g_1.i_2.set_state(-3, diff=True)
+    assert proxy.set_var_calls == []
+
+    r.g_1.set_state({"r_1": 3.2, "i_2": 4, "b_3": False, "s_4": "bar"}, diff=True)
+    assert proxy.set_var_calls == [("g-1", {"i-2": 4, "s-4": "bar"})]
+    assert r.g_1() == {"r_1": 3.2, "i_2": 4, "b_3": False, "s_4": "bar"}
+
+    proxy.set_var_calls.clear()
+    r.n_1.set_state(
+        {"n0": {"rl_1": [1.0, 3.0]}, "n1": {}, "n2": {"rl_1": [1.0]}}, diff=True
+    )
+    assert proxy.set_var_calls == [
+        ("n-1", {"n0": {"rl-1": [1.0, 3.0]}, "n1": {}, "n2": {"rl-1": [1.0]}})
+    ]
+    proxy.set_var_calls.clear()
+    r.n_1.set_state({"n0": {"rl_1": [1.0, 3.0]}, "n1": {}}, diff=True)
+    assert proxy.set_var_calls == []
+    assert r.n_1["n2"].rl_1() == [1.0]
+
+
+def test_set_state_diff_with_dependent_values():
+    class DependentProxy(Proxy):
+        def __init__(self):
+            super().__init__()
+            self.set_var_calls = []
+
+        def set_var(self, path, value):
+            self.set_var_calls.append((path, value))
+            super().set_var(path, value)
+            # Setting r-1 resets i-2, as enabling a model resets its options.
+            if isinstance(value, dict) and "r-1" in value:
+                super().set_var("g-1/i-2", 0)
+
+    proxy = DependentProxy()
+    r = flobject.get_root(proxy)
+    r.g_1 = {"r_1": 3.2, "b_3": False, "s_4": "foo"}
+    r.g_1.i_2 = 5
+    proxy.set_var_calls.clear()
+
+    r.g_1.set_state({"r_1": 1.5, "i_2": 5}, diff=True)
+    assert proxy.set_var_calls == [("g-1", {"r-1": 1.5})]
+    assert r.g_1.i_2() == 0
+
+    r.g_1.i_2 = 5
+    proxy.set_var_calls.clear()
+    # Integral floats do not differ from integers.
+    r.g_1.set_state({"r_1": 2.5, "i_2": 5.0}, diff=True, recheck=True)
+    assert proxy.set_var_calls == [("g-1", {"r-1": 2.5}), ("g-1", {"i-2": 5.0})]
+    assert r.g_1() == {"r_1": 2.5, "i_2": 5, "b_3": False, "s_4": "foo"}
+
+
+def test_set_state_diff_warns_on_remaining_differences():
+    class ResettingProxy(Proxy):
+        def set_var(self, path, value):
+            super().set_var(path, value)
+            # Setting the group always resets i-2.
+            if path == "g-1":
+                super().set_var("g-1/i-2", 0)
+
+    r = flobject.get_root(ResettingProxy(), version="251")
+    r.g_1.i_2 = 5
+    with pytest.warns(PyFluentUserWarning, match="i_2"):
+        r.g_1.set_state({"r_1": 1.5, "i_2": 5}, diff=True, recheck=True)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        r.g_1.set_state({"r_1": 2.5, "i_2": 5}, diff=True)
+
+
 def test_list_object():
     r = flobject.get_root(Proxy())
     assert r.l_1.get_size() == 0
@@ -536,6 +735,82 @@ def test_command():
     assert r.g_1.r_1() == 2.4 + 2.3 - 2.3 + 3.2 - 4.5
 
 
+def test_async_settings():
+    class AsyncProxy:
+        # Calls the Proxy methods directly, as they stand in for the server.
+        def __init__(self, proxy):
+            self._proxy = proxy
+
+        async def get_var(self, path):
+            return Proxy.get_var(self._proxy, path)
+
+        async def set_var(self, path, value):
+            return Proxy.set_var(self._proxy, path, value)
+
+        async def execute_cmd(self, path, command, **kwds):
+            return Proxy.execute_cmd(self._proxy, path, command, **kwds)
+
+        async def get_attrs(self, path, attrs, recursive=False):
+            if attrs == ["units-quantity"]:
+                return {"units-quantity": "pressure"}
+            return Proxy.get_attrs(self._proxy, path, attrs, recursive)
+
+    class ProxyWithAio(Proxy):
+        in_event_loop = False
+
+        @property
+        def aio(self):
+            return AsyncProxy(self)
+
+        def _check_not_blocking(self):
+            # The async API must not make blocking calls on the event loop.
+            assert not self.in_event_loop
+
+        def get_var(self, path):
+            self._check_not_blocking()
+            return super().get_var(path)
+
+        def set_var(self, path, value):
+            self._check_not_blocking()
+            return super().set_var(path, value)
+
+        def execute_cmd(self, path, command, **kwds):
+            self._check_not_blocking()
+            return super().execute_cmd(path, command, **kwds)
+
+        def get_attrs(self, path, attrs, recursive=False):
+            self._check_not_blocking()
+            return super().get_attrs(path, attrs, recursive)
+
+    proxy = ProxyWithAio()
+    r = flobject.get_root(proxy)
+    # Accessing the children of a group checks whether the group is active, so the
+    # objects are looked up before the event loop runs.
+    c_1, g_1 = r.c_1, r.g_1
+    r_1, i_2, s_4 = g_1.r_1, g_1.i_2, g_1.s_4
+    c_1._setattr("_version", FluentVersion.v261)
+
+    async def use_settings():
+        proxy.in_event_loop = True
+        try:
+            await g_1.set_state_async({"r_1": 1.0, "s_4": "foo"})
+            await r_1.set_state_async(ansys.units.Quantity(2.4, "Pa"))
+            await i_2.set_state_async(-3)
+            assert await r_1.get_state_async() == 2.4
+            assert await s_4.is_active_async()
+            await c_1.execute_command_async(a_1=3.2, a_2=True)
+            return await g_1.get_state_async()
+        finally:
+            proxy.in_event_loop = False
+
+    assert asyncio.run(use_settings()) == {
+        "r_1": 2.4 + 3.2,
+        "i_2": -3,
+        "b_3": None,
+        "s_4": "foo",
+    }
+
+
 def test_attrs():
     r = flobject.get_root(Proxy())
     r._setattr("_version", "251")
@@ -1159,6 +1434,30 @@ def test_bug_1001124_quantity_assignment(mixing_elbow_settings_session):
     )
 
 
+def test_units_from_static_info():
+    class UnitsProxy:
+        def get_var(self, path):
+            return {"": {"p-1": 101325.0, "i-1": 2}, "p-1": 101325.0}[path]
+
+        def get_attrs(self, path, attrs, recursive=False):
+            assert attrs == ["active?"]
+            return {"active?": True}
+
+    static_info = {
+        "type": "group",
+        "children": {
+            "p-1": {"type": "real", "units-quantity": "pressure"},
+            "i-1": {"type": "integer"},
+        },
+    }
+    root_cls, _ = flobject.get_cls("", static_info, version="251")
+    r = root_cls()
+    r.set_flproxy(UnitsProxy())
+    assert r.p_1.units() == "Pa"
+    assert r.p_1.as_quantity() == ansys.units.Quantity(101325.0, "Pa")
+    assert r.state_with_units() == {"p_1": (101325.0, "Pa"), "i_1": 2}
+
+
 def test_assert_type():
     types = [
         bool,
@@ -0,0 +1,102 @@
+# Copyright (C) 2021 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import subprocess
+import sys
+
+import pytest
+
+# Budget for the cumulative time of ``import ansys.fluent.core`` in microseconds
+_IMPORT_TIME_BUDGET = 1_000_000
+
+
+def _get_import_times(module: str) -> dict[str, int]:
+    """Get the cumulative import time of each module imported by a fresh
+    interpreter importing the module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = {}
+    for line in result.stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            import_times[fields[2].strip()] = int(fields[1])
+    return import_times
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "ansys.fluent.core",
+        "ansys.fluent.core.launcher",
+        "ansys.fluent.core.services",
+    ],
+)
+def test_import_does_not_load_heavy_dependencies(module):
+    import_times = _get_import_times(module)
+    assert module in import_times
+    for heavy_module in (
+        "pandas",
+        "grpc",
+        "docker",
+        "nltk",
+        "ansys.units",
+        "ansys.api.fluent.v0",
+        "ansys.fluent.core.session",
+        "ansys.fluent.core.launcher.launcher",
+    ):
+        assert heavy_module not in import_times
+
+
+def test_import_time_budget():
+    import_times = _get_import_times("ansys.fluent.core")
+    assert import_times["ansys.fluent.core"] < _IMPORT_TIME_BUDGET
+
+
+def test_lazy_attributes():
+    import ansys.fluent.core as pyfluent
+
+    assert pyfluent.launch_fluent.__module__ == "ansys.fluent.core.launcher.launcher"
+    assert pyfluent.Fluent.__name__ == "BaseSession"
+    assert pyfluent.SolverEvent.ITERATION_ENDED
+    assert callable(pyfluent.search)
+    assert "launch_fluent" in dir(pyfluent)
+    assert pyfluent.launcher.SessionPool is pyfluent.SessionPool
+    with pytest.raises(AttributeError):
+        pyfluent.launch_fluentx
+
+
+def test_lazy_attributes_cover_events_streaming():
+    import ansys.fluent.core as pyfluent
+    from ansys.fluent.core.streaming_services import events_streaming
+
+    # The names are listed in _LAZY_ATTRS so that events_streaming is not imported.
+    lazy_names = {
+        name
+        for name, module in pyfluent._LAZY_ATTRS.items()
+        if module == events_streaming.__name__
+    }
+    assert lazy_names == set(events_streaming.__all__)
@@ -20,10 +20,14 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import re
+
 import pytest
 
 from ansys.fluent.core.examples import download_file, path
 from ansys.fluent.core.filereader.casereader import CaseReader
+from ansys.fluent.core.filereader.lispy import parse, to_string
+from ansys.fluent.core.rpvars import RPVars
 
 
 def test_get_and_set_rp_vars(new_solver_session) -> None:
@@ -97,3 +101,66 @@ def test_rp_vars_boolean(new_solver_session) -> None:
         var_val = not var_val
         rp_vars(var_name, var_val)
         assert rp_vars(var_name) == var_val
+
+
+@pytest.mark.fluent_version(">=23.2")
+def test_rp_vars_bulk_access_and_cache(new_solver_session) -> None:
+    solver = new_solver_session
+    rp_vars = solver.rp_vars
+
+    rp_vars.set_vars({"number-of-iterations": 12, "rp-lam?": True})
+    assert rp_vars.get_vars(["number-of-iterations", "rp-lam?"]) == {
+        "number-of-iterations": 12,
+        "rp-lam?": True,
+    }
+    with pytest.raises(RuntimeError):
+        rp_vars.get_vars(["number-of-iterat"])
+
+    rp_vars.enable_cache()
+    assert rp_vars("number-of-iterations") == 12
+    rp_vars("number-of-iterations", 21)
+    assert rp_vars("number-of-iterations") == 21
+    assert rp_vars.get_vars(["number-of-iterations"]) == {"number-of-iterations": 21}
+    rp_vars.disable_cache()
+    assert not rp_vars.cache_enabled
+
+
+def test_rp_vars_cache_without_fluent(monkeypatch) -> None:
+    monkeypatch.setattr(RPVars, "_allowed_values", None)
+    values = {"number-of-iterations": 10, "rp-lam?": False}
+    evaluated = []
+
+    def eval_fn(cmd):
+        evaluated.append(cmd)
+        if cmd == "(cx-send '(map car rp-variables))":
+            return "(number-of-iterations rp-lam?)"
+        if cmd == "(cx-send 'rp-variables)":
+            return (
+                "(" + " ".join(f"({k} {to_string(v)})" for k, v in values.items()) + ")"
+            )
+        if cmd.startswith("(list "):
+            names = re.findall(r"\(rpgetvar '([^)]+)\)", cmd)
+            return "(" + " ".join(to_string(values[x]) for x in names) + ")"
+        for name, val in re.findall(r"\(rpsetvar '(\S+) ([^)]+)\)", cmd):
+            values[name] = parse(val)
+        return "()"
+
+    rp_vars = RPVars(eval_fn)
+    rp_vars.allowed_values()
+    evaluated.clear()
+
+    assert rp_vars.get_vars(["number-of-iterations", "rp-lam?"]) == values
+    rp_vars.set_vars({"number-of-iterations": 20, "rp-lam?": True})
+    assert len(evaluated) == 2
+
+    rp_vars.enable_cache()
+    evaluated.clear()
+    for _ in range(5):
+        assert rp_vars("number-of-iterations") == 20
+        assert rp_vars.get_vars(["rp-lam?"]) == {"rp-lam?": True}
+    assert evaluated == ["(cx-send 'rp-variables)"]
+
+    rp_vars("number-of-iterations", 30)
+    assert rp_vars("number-of-iterations") == 30
+    assert rp_vars() == {"number-of-iterations": 30, "rp-lam?": True}
+    assert evaluated.count("(cx-send 'rp-variables)") == 2
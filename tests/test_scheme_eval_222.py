@@ -358,3 +358,15 @@ def test_two_way_conversion_for_pairs() -> None:
     assert len(val) == 2
     assert val[0] == "abc"
     assert val[1] == 5.0
+
+
+def test_two_way_conversion_for_long_list() -> None:
+    py_value = [float(i) for i in range(10**4)]
+    p = SchemePointer()
+    _convert_py_value_to_scheme_pointer(py_value, p, "22.2.0")
+    assert _convert_scheme_pointer_to_py_value(p, "22.2.0") == py_value
+
+    py_value = {f"key-{i}": i for i in range(10**4)}
+    p = SchemePointer()
+    _convert_py_value_to_scheme_pointer(py_value, p, "22.2.0")
+    assert _convert_scheme_pointer_to_py_value(p, "22.2.0") == py_value
@@ -254,6 +254,18 @@ def test_two_way_conversion_for_pairs() -> None:
     assert val[1] == 5.0
 
 
+def test_two_way_conversion_for_long_list() -> None:
+    py_value = [float(i) for i in range(10**4)]
+    p = SchemePointer()
+    _convert_py_value_to_scheme_pointer(py_value, p, "23.1.0")
+    assert _convert_scheme_pointer_to_py_value(p, "23.1.0") == py_value
+
+    py_value = {f"key-{i}": i for i in range(10**4)}
+    p = SchemePointer()
+    _convert_py_value_to_scheme_pointer(py_value, p, "23.1.0")
+    assert _convert_scheme_pointer_to_py_value(p, "23.1.0") == py_value
+
+
 @pytest.mark.fluent_version(">=23.1")
 def test_long_list(new_solver_session) -> None:
     length = 10**6
@@ -20,6 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import asyncio
 from concurrent import futures
 import os
 from pathlib import Path
@@ -69,6 +70,43 @@ class MockSettingsServicer(settings_pb2_grpc.SettingsServicer):
         return response
 
 
+class MockStatefulSettingsServicer(settings_pb2_grpc.SettingsServicer):
+    def __init__(self):
+        self.state = {}
+
+    def SetVar(
+        self, request: settings_pb2.SetVarRequest, context: grpc.ServicerContext
+    ) -> settings_pb2.SetVarResponse:
+        self.state[request.path_info.path] = request.value
+        return settings_pb2.SetVarResponse()
+
+    def GetVar(
+        self, request: settings_pb2.GetVarRequest, context: grpc.ServicerContext
+    ) -> settings_pb2.GetVarResponse:
+        response = settings_pb2.GetVarResponse()
+        response.value.CopyFrom(self.state[request.path_info.path])
+        return response
+
+
+class MockSlowSettingsServicer(MockStatefulSettingsServicer):
+    def __init__(self):
+        super().__init__()
+        self.time_remaining = []
+
+    def SetVar(
+        self, request: settings_pb2.SetVarRequest, context: grpc.ServicerContext
+    ) -> settings_pb2.SetVarResponse:
+        self.time_remaining.append(context.time_remaining())
+        return super().SetVar(request, context)
+
+    def GetVar(
+        self, request: settings_pb2.GetVarRequest, context: grpc.ServicerContext
+    ) -> settings_pb2.GetVarResponse:
+        if request.path_info.path == "slow":
+            time.sleep(1)
+        return super().GetVar(request, context)
+
+
 class MockHealthServicer(health_pb2_grpc.HealthServicer):
     def Check(self, request, context: grpc.ServicerContext):  # noqa N802
         metadata = dict(context.invocation_metadata())
@@ -158,6 +196,194 @@ def test_create_mock_session_by_passing_ip_port_password() -> None:
     assert not session.is_server_healthy()
 
 
+def _start_mock_settings_server(settings_servicer) -> tuple[grpc.Server, str, int]:
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+    ip = "127.0.0.1"
+    port = get_free_port()
+    server.add_insecure_port(f"{ip}:{port}")
+    health_pb2_grpc.add_HealthServicer_to_server(MockHealthServicer(), server)
+    scheme_eval_pb2_grpc.add_SchemeEvalServicer_to_server(
+        MockSchemeEvalServicer(), server
+    )
+    settings_pb2_grpc.add_SettingsServicer_to_server(settings_servicer, server)
+    server.start()
+    return server, ip, port
+
+
+def test_channel_profile_method_values() -> None:
+    profile = pyfluent.ChannelProfile(
+        compression={"Settings": grpc.Compression.Gzip},
+        timeout={
+            "FieldData": 10,
+            "grpcRemoting.FieldData/GetFields": 20,
+            "Settings/GetVar": 5,
+        },
+    )
+    get_fields = "/grpcRemoting.FieldData/GetFields"
+    assert profile.get_timeout(get_fields) == 20
+    assert profile.get_timeout(get_fields.encode()) == 20
+    assert profile.get_timeout("/grpcRemoting.FieldData/GetSurfaces") == 10
+    assert profile.get_timeout("/ansys.api.fluent.v0.settings.Settings/GetVar") == 5
+    assert profile.get_timeout("/ansys.api.fluent.v0.settings.Settings/SetVar") is None
+    assert (
+        profile.get_compression("/ansys.api.fluent.v0.settings.Settings/SetVar")
+        == grpc.Compression.Gzip
+    )
+    assert profile.get_compression(get_fields) is None
+    assert profile.get_channel_compression() is None
+    assert profile.get_channel_options() == []
+    options = dict(pyfluent.ChannelProfile.remote().get_channel_options())
+    assert options["grpc.keepalive_time_ms"] == 300000
+    assert options["grpc.keepalive_permit_without_calls"] == 1
+
+
+def test_create_mock_session_with_channel_profile() -> None:
+    settings_servicer = MockSlowSettingsServicer()
+    server, ip, port = _start_mock_settings_server(settings_servicer)
+    profile = pyfluent.ChannelProfile(
+        keepalive_time=300,
+        keepalive_without_calls=True,
+        compression={"Settings": grpc.Compression.Gzip},
+        timeout={"Settings/SetVar": 30, "Settings/GetVar": 0.5},
+    )
+    fluent_connection = FluentConnection(
+        ip=ip,
+        port=port,
+        password="12345",
+        cleanup_on_exit=False,
+        channel_profile=profile,
+    )
+    session = BaseSession(
+        fluent_connection=fluent_connection,
+        scheme_eval=fluent_connection._connection_interface.scheme_eval,
+    )
+    try:
+        value = "x" * 10**6
+        session._settings_service.set_var("a", value)
+        assert session._settings_service.get_var("a") == value
+        assert 0 < settings_servicer.time_remaining[0] <= 30
+        settings_servicer.state["slow"] = settings_servicer.state["a"]
+        with pytest.raises(RuntimeError, match="Deadline"):
+            session._settings_service.get_var("slow")
+        # The health check streams are not subject to the deadlines.
+        assert session.is_server_healthy()
+    finally:
+        server.stop(None)
+        session.exit()
+
+
+class _RecordingInterceptor(grpc.UnaryUnaryClientInterceptor):
+    def __init__(self):
+        self.call_details = {}
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        self.call_details[client_call_details.method] = client_call_details
+        return continuation(client_call_details, request)
+
+
+def test_channel_profile_applied_to_channel(monkeypatch: pytest.MonkeyPatch) -> None:
+    settings_servicer = MockStatefulSettingsServicer()
+    server, ip, port = _start_mock_settings_server(settings_servicer)
+    recorder = _RecordingInterceptor()
+    channel_options = []
+    insecure_channel = grpc.insecure_channel
+
+    def recording_insecure_channel(target, options=None, **kwargs):
+        channel_options.extend(options)
+        channel = insecure_channel(target, options=options, **kwargs)
+        return grpc.intercept_channel(channel, recorder)
+
+    monkeypatch.setattr(grpc, "insecure_channel", recording_insecure_channel)
+    profile = pyfluent.ChannelProfile(
+        keepalive_time=300,
+        keepalive_without_calls=True,
+        compression={"Settings": grpc.Compression.Gzip},
+        timeout={"Settings/SetVar": 30},
+    )
+    fluent_connection = FluentConnection(
+        ip=ip,
+        port=port,
+        password="12345",
+        cleanup_on_exit=False,
+        channel_profile=profile,
+    )
+    session = BaseSession(
+        fluent_connection=fluent_connection,
+        scheme_eval=fluent_connection._connection_interface.scheme_eval,
+    )
+    try:
+        value = {f"field-{i}": [float(j % 7) for j in range(100)] for i in range(5)}
+        session._settings_service.set_var("state", value)
+        assert session._settings_service.get_var("state") == value
+        assert session.is_server_healthy()
+    finally:
+        server.stop(None)
+        session.exit()
+
+    options = dict(channel_options)
+    assert options["grpc.keepalive_time_ms"] == 300000
+    assert options["grpc.keepalive_permit_without_calls"] == 1
+    set_var = recorder.call_details["/ansys.api.fluent.v0.settings.Settings/SetVar"]
+    assert set_var.compression == grpc.Compression.Gzip
+    assert 0 < set_var.timeout <= 30
+    assert ("password", "12345") in set_var.metadata
+    get_var = recorder.call_details["/ansys.api.fluent.v0.settings.Settings/GetVar"]
+    assert get_var.compression == grpc.Compression.Gzip
+    assert get_var.timeout is None
+    assert recorder.call_details["/grpc.health.v1.Health/Check"].compression is None
+
+
+def test_create_mock_session_with_asyncio_settings() -> None:
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+    ip = "127.0.0.1"
+    port = get_free_port()
+    server.add_insecure_port(f"{ip}:{port}")
+    health_pb2_grpc.add_HealthServicer_to_server(MockHealthServicer(), server)
+    scheme_eval_pb2_grpc.add_SchemeEvalServicer_to_server(
+        MockSchemeEvalServicer(), server
+    )
+    settings_pb2_grpc.add_SettingsServicer_to_server(
+        MockStatefulSettingsServicer(), server
+    )
+    server.start()
+    fluent_connection = FluentConnection(
+        ip=ip, port=port, password="12345", cleanup_on_exit=False
+    )
+    session = BaseSession(
+        fluent_connection=fluent_connection,
+        scheme_eval=fluent_connection._connection_interface.scheme_eval,
+    )
+
+    async def use_settings():
+        settings_service = session._settings_service.aio
+        assert settings_service is session._settings_service.aio
+        await asyncio.gather(
+            settings_service.set_var("a", 1.5), settings_service.set_var("b", "x")
+        )
+        assert await asyncio.gather(
+            settings_service.get_var("a"), settings_service.get_var("b")
+        ) == [1.5, "x"]
+        with pytest.raises(RuntimeError):
+            await settings_service.get_object_names("a")
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(use_settings())
+        with pytest.raises(RuntimeError):
+            session._settings_service.aio
+        aio_channel = fluent_connection._aio_channels[loop]
+    finally:
+        server.stop(None)
+        session.exit()
+    try:
+        # The asyncio channels are closed on their own event loop on exit.
+        assert not fluent_connection._aio_channels
+        with pytest.raises(grpc.aio.UsageError):
+            loop.run_until_complete(aio_channel.channel_ready())
+    finally:
+        loop.close()
+
+
 def test_create_mock_session_by_setting_ip_port_env_var(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -0,0 +1,229 @@
+# Copyright (C) 2021 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import itertools
+import threading
+import time
+
+import pytest
+
+from ansys.fluent.core.launcher import session_pool
+from ansys.fluent.core.launcher.launch_options import LaunchMode
+from ansys.fluent.core.launcher.session_pool import SessionPool, SessionPoolClosed
+
+
+class FakeSession:
+    _ids = itertools.count()
+
+    def __init__(self):
+        self.id = next(self._ids)
+        self.healthy = True
+        self.exited = False
+        self.reset_count = 0
+
+    def is_active(self):
+        return not self.exited
+
+    def is_server_healthy(self):
+        return self.healthy
+
+    def exit(self):
+        self.exited = True
+
+
+@pytest.fixture
+def launched(monkeypatch: pytest.MonkeyPatch) -> list:
+    launched = []
+    lock = threading.Lock()
+
+    def create_launcher(fluent_launch_mode, **kwargs):
+        assert fluent_launch_mode == LaunchMode.STANDALONE
+
+        def launch():
+            session = FakeSession()
+            with lock:
+                launched.append(session)
+            return session
+
+        return launch
+
+    monkeypatch.setattr(session_pool, "create_launcher", create_launcher)
+    return launched
+
+
+def _reset(session):
+    session.reset_count += 1
+
+
+def _wait_for_idle(pool: SessionPool, count: int):
+    for _ in range(500):
+        if pool.idle_count == count and not pool._pending:
+            return
+        time.sleep(0.01)
+    raise TimeoutError
+
+
+def test_session_pool_acquire_refills(launched):
+    with SessionPool(
+        size=2, fluent_launch_mode=LaunchMode.STANDALONE, health_check_interval=None
+    ) as pool:
+        _wait_for_idle(pool, 2)
+        session = pool.acquire(timeout=5)
+        assert isinstance(session, FakeSession)
+        _wait_for_idle(pool, 2)
+        assert len(launched) == 3
+    assert not session.exited
+    assert all(s.exited for s in launched if s is not session)
+
+
+def test_session_pool_release_after_close_exits_session(launched):
+    pool = SessionPool(
+        size=1,
+        fluent_launch_mode=LaunchMode.STANDALONE,
+        reset_session=_reset,
+        health_check_interval=None,
+    )
+    session = pool.acquire(timeout=5)
+    pool.close()
+    # There is no room in a closed pool, so the session is exited without reset.
+    pool.release(session)
+    assert session.reset_count == 0
+    assert session.exited
+    with pytest.raises(SessionPoolClosed):
+        pool.acquire()
+
+
+def test_session_pool_release_keeps_reset_session(launched):
+    pool = SessionPool(
+        size=1,
+        fluent_launch_mode=LaunchMode.STANDALONE,
+        reset_session=_reset,
+        max_uses=2,
+        health_check_interval=None,
+    )
+    session = pool.acquire(timeout=5)
+    # The acquired session is going to be reused, so no replacement is launched.
+    _wait_for_idle(pool, 0)
+    assert launched == [session]
+    pool.release(session)
+    assert pool.idle_count == 1
+    assert session.reset_count == 1 and not session.exited
+    assert pool.acquire(timeout=5) is session
+    # The session reaches max_uses, so a replacement is launched and the session
+    # is exited on release.
+    _wait_for_idle(pool, 1)
+    pool.release(session)
+    assert session.reset_count == 1
+    assert session.exited
+    _wait_for_idle(pool, 1)
+    assert len(launched) == 2
+    pool.close()
+
+
+def test_session_pool_discards_unhealthy_sessions(launched):
+    pool = SessionPool(
+        size=1, fluent_launch_mode=LaunchMode.STANDALONE, health_check_interval=None
+    )
+    _wait_for_idle(pool, 1)
+    idle = pool._idle.queue[0]
+    idle.healthy = False
+    pool.check_health()
+    assert idle.exited
+    session = pool.acquire(timeout=5)
+    assert session is not idle and not session.exited
+    pool.release(session)
+    # Without reset_session, released sessions are recycled.
+    assert session.exited
+    pool.close()
+
+
+def test_session_pool_refill_counts_sessions_under_check(launched):
+    pool = SessionPool(
+        size=1, fluent_launch_mode=LaunchMode.STANDALONE, health_check_interval=None
+    )
+    _wait_for_idle(pool, 1)
+    idle = pool._idle.queue[0]
+    checking = threading.Event()
+    checked = threading.Event()
+
+    def is_server_healthy():
+        checking.set()
+        checked.wait(5)
+        return True
+
+    idle.is_server_healthy = is_server_healthy
+    health_check = threading.Thread(target=pool.check_health)
+    health_check.start()
+    assert checking.wait(5)
+    # The session under check is not missing from the pool.
+    pool._refill()
+    checked.set()
+    health_check.join()
+    _wait_for_idle(pool, 1)
+    assert launched == [idle]
+    pool.close()
+
+
+def test_session_pool_acquire_retries_failed_launch(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(session_pool, "_ACQUIRE_RETRY_INTERVAL", 0.05)
+    attempts = []
+
+    def create_launcher(fluent_launch_mode, **kwargs):
+        def launch():
+            attempts.append(None)
+            if len(attempts) == 1:
+                raise RuntimeError("no license")
+            return FakeSession()
+
+        return launch
+
+    monkeypatch.setattr(session_pool, "create_launcher", create_launcher)
+    with SessionPool(
+        size=1, fluent_launch_mode=LaunchMode.STANDALONE, health_check_interval=None
+    ) as pool:
+        # Without health checks, only acquire launches the failed session again.
+        session = pool.acquire()
+        assert isinstance(session, FakeSession)
+        assert len(attempts) >= 2
+
+
+def test_session_pool_acquire_timeout(monkeypatch: pytest.MonkeyPatch):
+    def create_launcher(fluent_launch_mode, **kwargs):
+        def launch():
+            raise RuntimeError("no license")
+
+        return launch
+
+    monkeypatch.setattr(session_pool, "create_launcher", create_launcher)
+    with SessionPool(
+        size=1, fluent_launch_mode=LaunchMode.STANDALONE, health_check_interval=None
+    ) as pool:
+        with pytest.raises(TimeoutError, match="no license"):
+            pool.acquire(timeout=0.5)
+
+
+def test_session_pool_invalid_size():
+    with pytest.raises(ValueError):
+        SessionPool(size=0)
@@ -20,11 +20,18 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from concurrent.futures import Future
+from concurrent.futures import FIRST_COMPLETED, Future
+import subprocess
 
 import pytest
 
-from ansys.fluent.core.launcher.slurm_launcher import SlurmFuture
+from ansys.fluent.core.launcher import slurm_launcher
+from ansys.fluent.core.launcher.slurm_launcher import (
+    SlurmFuture,
+    SlurmJobMonitor,
+    as_completed,
+    wait,
+)
 
 
 class SlurmEnvironment:
@@ -87,3 +94,101 @@ def test_slurm_future_done_callback(slurm_future: SlurmFuture):
     slurm_future._future.set_result(SlurmFutureResult())
     assert called
     assert called[0]
+
+
+class MockSlurmWrapper:
+    def __init__(self):
+        self.states = {}
+        self.calls = []
+
+    def get_states(self, job_ids):
+        self.calls.append(list(job_ids))
+        return {job_id: self.states.get(job_id, "") for job_id in job_ids}
+
+
+@pytest.fixture
+def slurm_wrapper(monkeypatch: pytest.MonkeyPatch) -> MockSlurmWrapper:
+    wrapper = MockSlurmWrapper()
+    monkeypatch.setattr(slurm_launcher._SlurmWrapper, "get_states", wrapper.get_states)
+    return wrapper
+
+
+def test_slurm_job_monitor_batches_queries(slurm_wrapper: MockSlurmWrapper):
+    monitor = SlurmJobMonitor(interval=60)
+    futures = [SlurmFuture(Future(), job_id, monitor) for job_id in range(100)]
+    slurm_wrapper.states = dict.fromkeys(range(100), "PENDING")
+    for _ in range(3):
+        assert not any(f.done() for f in futures)
+    assert slurm_wrapper.calls == [list(range(100))]
+    slurm_wrapper.states[0] = "COMPLETED"
+    monitor.refresh(force=True)
+    assert futures[0].done()
+    monitor.refresh(force=True)
+    # Finished jobs are no longer queried.
+    assert slurm_wrapper.calls[-1] == list(range(1, 100))
+
+
+def test_slurm_as_completed_and_wait(slurm_wrapper: MockSlurmWrapper):
+    monitor = SlurmJobMonitor(interval=0.01)
+    futures = [SlurmFuture(Future(), job_id, monitor) for job_id in range(3)]
+    slurm_wrapper.states = dict.fromkeys(range(3), "PENDING")
+    futures[1]._future.set_result(SlurmFutureResult())
+    done, not_done = wait(futures, timeout=0.1, return_when=FIRST_COMPLETED)
+    assert done == {futures[1]}
+    assert not_done == {futures[0], futures[2]}
+    slurm_wrapper.states[2] = "CANCELLED"
+    assert list(as_completed(futures[1:])) == [futures[1], futures[2]]
+    with pytest.raises(TimeoutError):
+        list(as_completed(futures, timeout=0.05))
+    futures[0]._future.set_result(SlurmFutureResult())
+    done, not_done = wait(futures)
+    assert done == set(futures) and not not_done
+
+
+def test_slurm_job_monitor_keeps_states_when_query_fails(
+    slurm_wrapper: MockSlurmWrapper, monkeypatch: pytest.MonkeyPatch
+):
+    monitor = SlurmJobMonitor(interval=60)
+    futures = [SlurmFuture(Future(), job_id, monitor) for job_id in range(3)]
+    slurm_wrapper.states = dict.fromkeys(range(3), "RUNNING")
+    assert not any(f.done() for f in futures)
+
+    def get_states(job_ids):
+        raise subprocess.CalledProcessError(1, ["squeue"])
+
+    monkeypatch.setattr(slurm_launcher._SlurmWrapper, "get_states", get_states)
+    monitor.refresh(force=True)
+    # A failed query does not finish the jobs, and it is retried later.
+    assert not any(f.done() for f in futures)
+    assert monitor._tracked == {0, 1, 2}
+    with pytest.raises(subprocess.CalledProcessError):
+        SlurmFuture(Future(), 3, monitor).done()
+    monkeypatch.setattr(
+        slurm_launcher._SlurmWrapper, "get_states", slurm_wrapper.get_states
+    )
+    slurm_wrapper.states[0] = "COMPLETED"
+    monitor.refresh(force=True)
+    assert futures[0].done()
+    assert not futures[1].done()
+
+
+def test_slurm_wrapper_get_states_fallback(monkeypatch: pytest.MonkeyPatch):
+    def run(args, capture_output):
+        job_id = args[2]
+        if "," in job_id:
+            return subprocess.CompletedProcess(args, 1, b"", b"error")
+        if job_id == "1":
+            return subprocess.CompletedProcess(args, 0, b"RUNNING\n", b"")
+        if job_id == "2":
+            return subprocess.CompletedProcess(
+                args, 1, b"", b"slurm_load_jobs error: Invalid job id specified"
+            )
+        return subprocess.CompletedProcess(
+            args, 1, b"", b"slurm_load_jobs error: Socket timed out"
+        )
+
+    monkeypatch.setattr(subprocess, "run", run)
+    get_states = slurm_launcher._SlurmWrapper.get_states
+    assert get_states([1, 2]) == {1: "RUNNING", 2: ""}
+    with pytest.raises(subprocess.CalledProcessError):
+        get_states([1, 3])
@@ -23,8 +23,14 @@
 import numpy as np
 import pytest
 
+from ansys.api.fluent.v0 import field_data_pb2 as FieldDataProtoModule
+from ansys.api.fluent.v0 import svar_pb2 as SvarProtoModule
 from ansys.fluent.core import examples
 from ansys.fluent.core.examples.downloads import download_file
+from ansys.fluent.core.services.solution_variables import (
+    SolutionVariableData,
+    SolutionVariableInfo,
+)
 
 
 @pytest.mark.fluent_version(">=23.2")
@@ -261,3 +267,106 @@ def test_solution_variable_udm_data(mixing_elbow_case_session_t4):
         zone_names=["wall-elbow"],
     )["wall-elbow"]
     np.testing.assert_array_equal(new_array, udm_data)
+
+
+class MockSolutionVariableService:
+    zone_sizes = {"fluid": (1, 5), "wall": (2, 3)}
+
+    def __init__(self):
+        self.calls = []
+        self.set_requests = None
+
+    def get_zones_info(self, request):
+        self.calls.append("get_zones_info")
+        return SvarProtoModule.GetZonesInfoResponse(
+            zonesInfo=[
+                SvarProtoModule.ZoneInfo(
+                    name=name,
+                    zoneId=zone_id,
+                    partitionsInfo=[
+                        SvarProtoModule.PartitionInfo(
+                            count=count, startIndex=0, endIndex=count - 1
+                        )
+                    ],
+                )
+                for name, (zone_id, count) in self.zone_sizes.items()
+            ],
+            domainsInfo=[SvarProtoModule.DomainInfo(name="mixture", domainId=1)],
+        )
+
+    def get_variables_info(self, request):
+        self.calls.append("get_variables_info")
+        return SvarProtoModule.GetSvarsInfoResponse(
+            svarsInfo=[
+                SvarProtoModule.SvarInfo(
+                    name="SV_T",
+                    dimension=1,
+                    fieldType=FieldDataProtoModule.FieldType.DOUBLE_ARRAY,
+                ),
+                SvarProtoModule.SvarInfo(
+                    name="SV_P",
+                    dimension=1,
+                    fieldType=FieldDataProtoModule.FieldType.DOUBLE_ARRAY,
+                ),
+            ]
+        )
+
+    def get_data(self, request):
+        self.calls.append("get_data")
+        for zone_id in request.zones:
+            count = next(c for z, c in self.zone_sizes.values() if z == zone_id)
+            yield SvarProtoModule.GetSvarDataResponse(
+                payloadInfo=SvarProtoModule.Info(
+                    fieldType=FieldDataProtoModule.FieldType.DOUBLE_ARRAY,
+                    fieldSize=count,
+                    zone=zone_id,
+                )
+            )
+            yield SvarProtoModule.GetSvarDataResponse(
+                payload=SvarProtoModule.Payload(
+                    bytePayload=np.full(count, zone_id, dtype=np.float64).tobytes()
+                )
+            )
+
+    def set_data(self, requests):
+        self.calls.append("set_data")
+        self.set_requests = requests
+
+
+def test_solution_variable_metadata_is_cached():
+    service = MockSolutionVariableService()
+    info = SolutionVariableInfo(service)
+    data = SolutionVariableData(service, info)
+
+    multiple_data = data.get_multiple_data(
+        variable_names=["SV_T", "SV_P"], zone_names=["fluid", "wall"]
+    )
+    empty_array = data.create_empty_array("SV_T", "fluid")
+    data.set_data(variable_name="SV_T", zone_names_to_data={"wall": np.ones(3)})
+    assert service.calls.count("get_zones_info") == 1
+    assert service.calls.count("get_variables_info") == 2
+    assert service.calls.count("get_data") == 2
+
+    sv_t = multiple_data["SV_T"]
+    assert sv_t.zone_names == ["fluid", "wall"]
+    assert np.array_equal(sv_t.array, [1.0] * 5 + [2.0] * 3)
+    assert np.shares_memory(sv_t["wall"], sv_t.array)
+    assert empty_array.shape == (5,)
+
+    info.clear_cache()
+    info.get_zones_info()
+    assert service.calls.count("get_zones_info") == 2
+
+
+def test_solution_variable_set_data_is_streamed():
+    service = MockSolutionVariableService()
+    data = SolutionVariableData(service, SolutionVariableInfo(service))
+    wall_data = np.arange(3, dtype=np.float64)
+    data.set_data(variable_name="SV_T", zone_names_to_data={"wall": wall_data})
+    assert not isinstance(service.set_requests, list)
+    requests = list(service.set_requests)
+    assert requests[0].header.name == "SV_T"
+    assert requests[1].payloadInfo.fieldSize == 3
+    assert np.array_equal(
+        np.frombuffer(requests[2].payload.bytePayload, dtype=np.float64), wall_data
+    )
@@ -20,9 +20,12 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import numpy as np
 import pytest
 
+from ansys.api.fluent.v0 import monitor_pb2 as MonitorModule
 from ansys.fluent.core import examples
+from ansys.fluent.core.streaming_services.monitor_streaming import MonitorsManager
 from ansys.fluent.core.utils.execution import timeout_loop
 
 
@@ -114,3 +117,102 @@ def test_solver_monitors(new_solver_session):
     solver.solution.run_calculation.iterate(iter_count=1)
     assert timeout_loop(lambda: monitor_callback.called, 5)
     assert monitor_callback.called
+
+
+class MockMonitorsService:
+    def __init__(self, residuals):
+        self.residuals = residuals
+
+    def get_monitors_info(self):
+        return {"residual": {"monitors": ["continuity", "x-velocity"]}}
+
+    def begin_streaming(self, request, started_evt, id, stream_begin_method):
+        started_evt.set()
+        for iteration, residual in self.residuals:
+            yield MonitorModule.StreamingResponse(
+                xaxisdata=MonitorModule.XAxisData(xaxisindex=iteration),
+                yaxisvalues=[
+                    MonitorModule.MonitorData(name="continuity", value=residual),
+                    MonitorModule.MonitorData(name="x-velocity", value=residual / 2),
+                ],
+            )
+
+    def end_streaming(self, id, stream_begin_method):
+        pass
+
+
+def _stream_monitors(residuals, file_name):
+    monitors = MonitorsManager("session-id", MockMonitorsService(residuals))
+    store = monitors.enable_store(file_name, batch_size=7)
+    monitors.start()
+    monitors._stream_thread.join(timeout=10)
+    monitors.stop()
+    return monitors, store
+
+
+def test_monitors_store(tmp_path):
+    pytest.importorskip("h5py")
+    file_name = str(tmp_path / "monitors.h5")
+    residuals = [(i, 1.0 / i) for i in range(1, 51)]
+    monitors, store = _stream_monitors(residuals, file_name)
+    assert store.get_monitor_set_names() == ["residual"]
+    iterations, data = monitors.get_monitor_set_data("residual")
+    assert np.array_equal(iterations, range(1, 51))
+    assert np.array_equal(data["continuity"], [value for _, value in residuals])
+    iterations, data = monitors.get_monitor_set_data("residual", 10, 12)
+    assert np.array_equal(iterations, [11, 12])
+    iterations, values = store.get_monitor_data("residual", "x-velocity", 20, 22)
+    assert np.array_equal(iterations, [20, 21, 22])
+    assert np.array_equal(values, [0.5 / 20, 0.5 / 21, 0.5 / 22])
+    monitors.disable_store()
+
+    # A resumed client does not store the replayed history again.
+    residuals += [(i, 1.0 / i) for i in range(51, 61)]
+    monitors, store = _stream_monitors(residuals, file_name)
+    iterations, data = monitors.get_monitor_set_data("residual")
+    assert np.array_equal(iterations, range(1, 61))
+
+    # A new history is appended once it diverges from the stored one.
+    monitors.stop()
+    monitors._streaming_service.residuals = [(1, 1.0), (2, 0.25)]
+    monitors.start()
+    monitors._stream_thread.join(timeout=10)
+    monitors.stop()
+    iterations, data = monitors.get_monitor_set_data("residual", 59)
+    assert np.array_equal(iterations, [60, 2])
+    assert np.array_equal(data["continuity"], [1.0 / 60, 0.25])
+    monitors.disable_store()
+
+
+def test_monitors_store_reads_pending_rows(tmp_path):
+    pytest.importorskip("h5py")
+    from ansys.fluent.core.streaming_services.monitor_store import MonitorStore
+
+    file_name = str(tmp_path / "monitors.h5")
+    residuals = [(i, 1.0 / i) for i in range(1, 11)]
+    monitors = MonitorsManager("session-id", MockMonitorsService(residuals))
+    store = monitors.enable_store(file_name, batch_size=7)
+    monitors.start()
+    monitors._stream_thread.join(timeout=10)
+
+    # Reading does not write the rows of the incomplete batch.
+    assert store.get_monitor_set_names() == ["residual"]
+    iterations, data = monitors.get_monitor_set_data("residual")
+    assert np.array_equal(iterations, range(1, 11))
+    assert np.array_equal(data["continuity"], [value for _, value in residuals])
+    iterations, data = monitors.get_monitor_set_data("residual", 5, 9)
+    assert np.array_equal(iterations, [6, 7, 8, 9])
+    iterations, values = store.get_monitor_data("residual", "x-velocity", 6, 9)
+    assert np.array_equal(iterations, [6, 7, 8, 9])
+    assert np.array_equal(values, [0.5 / 6, 0.5 / 7, 0.5 / 8, 0.5 / 9])
+    assert len(store._file["residual"]["xvalues"]) == 7
+
+    # Closing the monitors writes the pending rows and closes the store.
+    monitors.close()
+    assert store._file is None
+    store = MonitorStore(file_name)
+    try:
+        iterations, data = store.get_monitor_set_data("residual")
+        assert np.array_equal(iterations, range(1, 11))
+    finally:
+        store.close()
@@ -20,9 +20,24 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import gzip
+import threading
 import time
 
+import numpy as np
+import pytest
+
+from ansys.api.fluent.v0 import field_data_pb2 as FieldDataProtoModule
+from ansys.api.fluent.v0 import transcript_pb2 as TranscriptModule
 from ansys.fluent.core import connect_to_fluent
+from ansys.fluent.core.streaming_services.field_data_streaming import (
+    FieldDataDeliveryPolicy,
+    FieldDataStreaming,
+)
+from ansys.fluent.core.streaming_services.transcript_streaming import (
+    Transcript,
+    TranscriptSink,
+)
 from ansys.fluent.core.utils.fluent_version import FluentVersion
 
 
@@ -72,3 +87,149 @@ def test_transcript(new_solver_session):
         assert total_checked_transcripts == total_passed_transcripts
     else:
         assert total_checked_transcripts >= total_passed_transcripts
+
+
+class MockFieldsStreamingService:
+    def __init__(self, n_fields):
+        self.n_fields = n_fields
+        self.streamed = threading.Event()
+
+    def begin_streaming(self, request, started_evt, id, stream_begin_method):
+        started_evt.set()
+        field_request_info = FieldDataProtoModule.FieldRequestInfo(
+            scalarFieldRequest=FieldDataProtoModule.ScalarFieldRequest(
+                surfaceId=1, scalarFieldName="pressure"
+            )
+        )
+        for i in range(self.n_fields):
+            field = np.full(4, float(i))
+            yield FieldDataProtoModule.GetFieldsResponse(
+                payloadInfo=FieldDataProtoModule.PayloadInfo(
+                    surfaceId=1,
+                    fieldName="pressure",
+                    fieldType=FieldDataProtoModule.FieldType.DOUBLE_ARRAY,
+                    fieldSize=field.size,
+                    fieldRequestInfo=field_request_info,
+                )
+            )
+            yield FieldDataProtoModule.GetFieldsResponse(bytePayload=field.tobytes())
+        self.streamed.set()
+
+    def end_streaming(self, id, stream_begin_method):
+        pass
+
+
+def _stream_fields(policy, n_fields=50, max_pending=2, wait_for_stream=True):
+    service = MockFieldsStreamingService(n_fields)
+    streaming = FieldDataStreaming("session-id", service)
+    delivered = []
+
+    def on_field(surface_id, field_name, field):
+        # A slow consumer, which is busy until all the fields have been streamed.
+        if wait_for_stream:
+            service.streamed.wait(timeout=10)
+        delivered.append(field[0])
+
+    streaming.register_callback(on_field)
+    streaming.start(delivery_policy=policy, max_pending=max_pending)
+    streaming._stream_thread.join(timeout=10)
+    assert not streaming._stream_thread.is_alive()
+    return streaming.counters, delivered
+
+
+def test_field_data_streaming_delivery_policies():
+    counters, delivered = _stream_fields("inline", wait_for_stream=False)
+    assert (counters.received, counters.delivered, counters.dropped) == (50, 50, 0)
+    assert delivered == list(range(50))
+
+    counters, delivered = _stream_fields(FieldDataDeliveryPolicy.LATEST)
+    assert counters.received == 50
+    assert counters.delivered + counters.dropped == 50
+    assert counters.delivered <= 2
+    assert delivered[-1] == 49
+
+    counters, delivered = _stream_fields(FieldDataDeliveryPolicy.DROP_OLDEST)
+    assert counters.delivered + counters.dropped == 50
+    assert counters.delivered <= 3
+    assert counters.late >= 1
+    assert delivered[-2:] == [48, 49]
+
+    counters, delivered = _stream_fields(
+        FieldDataDeliveryPolicy.BLOCK, wait_for_stream=False
+    )
+    assert (counters.received, counters.delivered, counters.dropped) == (50, 50, 0)
+    assert delivered == list(range(50))
+
+    streaming = FieldDataStreaming("session-id", MockFieldsStreamingService(1))
+    with pytest.raises(ValueError):
+        streaming.start(delivery_policy="unknown")
+    with pytest.raises(ValueError):
+        streaming.start(delivery_policy="block", max_pending=0)
+    assert not streaming.is_streaming
+
+
+def test_transcript_sink_buffers_and_rotates(tmp_path):
+    file_name = tmp_path / "transcript.txt"
+    sink = TranscriptSink(
+        str(file_name),
+        flush_size=100,
+        flush_interval=60,
+        max_bytes=250,
+        backup_count=2,
+        compress=True,
+        tail_lines=3,
+    )
+    sink("line-0\n")
+    assert file_name.read_text() == ""
+    sink.flush()
+    assert file_name.read_text() == "line-0\n"
+
+    for i in range(1, 100):
+        sink(f"line-{i}\n")
+    sink.close()
+    assert sink.tail() == ["line-97", "line-98", "line-99"]
+    assert sink.tail(1) == ["line-99"]
+    assert file_name.stat().st_size <= 250
+    with gzip.open(f"{file_name}.1.gz", "rt") as f:
+        backup = f.read()
+    assert len(backup) <= 250 + 100
+    assert not (tmp_path / "transcript.txt.3.gz").exists()
+    with gzip.open(f"{file_name}.2.gz", "rt") as f:
+        lines = (f.read() + backup + file_name.read_text()).splitlines()
+    assert lines[-1] == "line-99"
+    assert lines == [f"line-{i}" for i in range(100 - len(lines), 100)]
+
+
+def test_transcript_sink_flushes_after_interval(tmp_path):
+    file_name = tmp_path / "transcript.txt"
+    sink = TranscriptSink(str(file_name), flush_interval=0.05)
+    sink("line-0\n")
+    for _ in range(100):
+        if file_name.read_text():
+            break
+        time.sleep(0.05)
+    assert file_name.read_text() == "line-0\n"
+    sink.close()
+
+
+class MockTranscriptService:
+    def begin_streaming(self, request, started_evt, id, stream_begin_method):
+        started_evt.set()
+        for text in ["line-", "0\nline-1", "\n", "", "line-2\n"]:
+            yield TranscriptModule.TranscriptResponse(transcript=text)
+
+    def end_streaming(self, id, stream_begin_method):
+        pass
+
+
+def test_transcript_tail_and_file(tmp_path):
+    file_name = tmp_path / "transcript.txt"
+    transcript = Transcript(MockTranscriptService())
+    lines = []
+    transcript.register_callback(lines.append)
+    transcript.start(file_name=str(file_name), tail_lines=2)
+    transcript._stream_thread.join(timeout=10)
+    transcript.stop()
+    assert lines == ["line-0\nline-1", "line-2"]
+    assert transcript.tail() == ["line-1", "line-2"]
+    assert file_name.read_text() == "line-0\nline-1\nline-2\n"
@@ -22,11 +22,19 @@
 
 import os
 
+import grpc
 import pytest
 
 from ansys.fluent.core import FluentVersion
 from ansys.fluent.core.examples.downloads import download_file
-from ansys.fluent.core.services.datamodel_tui import TUIMenu
+from ansys.fluent.core.services.datamodel_tui import (
+    DatamodelService,
+    PyMenu,
+    TUICommand,
+    TUIMenu,
+    TUIMethod,
+    _get_static_info_at_level,
+)
 
 
 @pytest.mark.skip("Failing in github")
@@ -97,3 +105,120 @@ def test_commands_not_in_solver_tui(new_solver_session):
     for command in hidden_commands:
         assert command not in dir(solver.tui)
         assert getattr(solver.tui, command)
+
+
+def test_tui_navigation_without_fluent(monkeypatch) -> None:
+    static_info = {
+        "menus": {
+            "file": {
+                "menus": {"import": {"commands": {"cgns": {}}}},
+                "commands": {"read_case": {}, "runtime_menu": {}},
+            }
+        }
+    }
+    child_names = {
+        "/file": ["import", "read_case", "runtime_menu", "added_menu"],
+        "/file/runtime_menu": ["runtime_command"],
+        "/file/added_menu": ["added_command"],
+    }
+    calls = []
+
+    def get_attribute_value(path, attribute, include_unavailable):
+        calls.append(path)
+        return child_names.get(path, [])
+
+    def get_static_info(path):
+        calls.append(("static", path))
+        return static_info
+
+    service = DatamodelService(
+        grpc.insecure_channel("localhost:0"), [], None, None, None
+    )
+    monkeypatch.setattr(service, "get_attribute_value", get_attribute_value)
+    monkeypatch.setattr(service, "get_static_info", get_static_info)
+    monkeypatch.setattr(service._impl, "execute_command", lambda request: None)
+    tui = TUIMenu(service, None, "solver", [])
+
+    for _ in range(3):
+        assert tui.file.import_.cgns.__class__ == TUICommand
+        assert tui.file.import_._path == ["file", "import"]
+    assert calls == [("static", ""), "/file/import/cgns"]
+
+    # Runtime submenus are reported as commands in the static info.
+    calls.clear()
+    for _ in range(3):
+        assert tui.file.runtime_menu.__class__ == TUIMenu
+        assert tui.file.runtime_menu.runtime_command.__class__ == TUICommand
+        assert tui.file.added_menu.added_command.__class__ == TUICommand
+    assert len(calls) == len(set(calls))
+
+    with pytest.raises(AttributeError):
+        tui.file.unknown
+
+    # Executing a command discards the cached child names.
+    child_names["/file/runtime_menu"] = []
+    service.execute_command("/file/read_case", "case.cas.h5")
+    assert tui.file.runtime_menu.__class__ == TUICommand
+
+    # Generated methods are resolved as menus only when navigated.
+    method = TUIMethod(service, None, "solver", ["file", "runtime_menu"])
+    child_names["/file/runtime_menu"] = ["runtime_command"]
+    service.clear_cache()
+    assert method.runtime_command.__class__ == TUICommand
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_tui_static_info_from_menus_without_fluent(monkeypatch, max_workers) -> None:
+    child_names = {
+        "": ["file", "solve"],
+        "/file": ["import", "read_case"],
+        "/file/import": ["cgns"],
+        "/solve": ["iterate"],
+    }
+    queried = []
+
+    def get_attribute_value(path, attribute, include_unavailable):
+        assert include_unavailable
+        queried.append((path, attribute))
+        if attribute == "help_string":
+            return f"help of {path}"
+        return child_names.get(path, [])
+
+    service = DatamodelService(
+        grpc.insecure_channel("localhost:0"), [], None, None, None
+    )
+    monkeypatch.setattr(service, "get_attribute_value", get_attribute_value)
+
+    def command(path):
+        return {"help": f"help of {path}", "menus": {}, "commands": {}}
+
+    info = _get_static_info_at_level(
+        PyMenu(service, None, "solver", ""), max_workers=max_workers
+    )
+    assert info == {
+        "help": "help of ",
+        "menus": {
+            "file": {
+                "help": "help of /file",
+                "menus": {
+                    "import": {
+                        "help": "help of /file/import",
+                        "menus": {},
+                        "commands": {"cgns": command("/file/import/cgns")},
+                    }
+                },
+                "commands": {"read_case": command("/file/read_case")},
+            },
+            "solve": {
+                "help": "help of /solve",
+                "menus": {},
+                "commands": {"iterate": command("/solve/iterate")},
+            },
+        },
+        "commands": {},
+    }
+    assert list(info["menus"]) == ["file", "solve"]
+    assert len(queried) == len(set(queried)) == 2 * 7
+
+    leaf = _get_static_info_at_level(PyMenu(service, None, "solver", "/solve/iterate"))
+    assert leaf == {**command("/solve/iterate"), "is_command": True}
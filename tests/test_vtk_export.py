@@ -0,0 +1,62 @@
+# Copyright (C) 2021 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import numpy as np
+import pytest
+
+from ansys.fluent.core.field_data_interfaces import get_csr_connectivity
+from ansys.fluent.core.utils.vtk_export import to_vtk_polydata
+
+vtk = pytest.importorskip("vtk")
+
+
+def test_to_vtk_polydata_shares_arrays() -> None:
+    vertices = np.arange(15, dtype=np.float64).reshape(-1, 3)
+    connectivity = get_csr_connectivity(
+        np.array([3, 0, 1, 2, 4, 1, 2, 3, 4], dtype=np.int64)
+    )
+    temperature = np.arange(5, dtype=np.float64)
+    pressure = np.array([1.0, 2.0])
+    polydata = to_vtk_polydata(
+        vertices,
+        connectivity,
+        point_data={"temperature": temperature},
+        cell_data={"pressure": pressure},
+    )
+    assert polydata.GetNumberOfPoints() == 5
+    assert polydata.GetNumberOfCells() == 2
+    assert polydata.GetCell(1).GetNumberOfPoints() == 4
+    vertices[0, 0] = -1.0
+    temperature[0] = -1.0
+    assert polydata.GetPoint(0)[0] == -1.0
+    assert polydata.GetPointData().GetArray("temperature").GetValue(0) == -1.0
+    assert polydata.GetCellData().GetArray("pressure").GetValue(1) == 2.0
+
+
+def test_to_vtk_polydata_from_flat_connectivity() -> None:
+    polydata = to_vtk_polydata(
+        np.zeros(12, dtype=np.float32),
+        np.array([3, 0, 1, 2, 3, 1, 2, 3], dtype=np.int32),
+    )
+    assert polydata.GetNumberOfPoints() == 4
+    assert polydata.GetNumberOfCells() == 2